@@ -0,0 +1,19 @@
+# ===================================================================================
+#   api/deps.py: 공용 의존성 주입 함수
+# ===================================================================================
+#
+#   - 여러 라우터에서 함께 사용하는 FastAPI 의존성 함수를 한 곳에 정의합니다.
+#   - 라우터 파일마다 같은 함수를 중복 정의하지 않고 이 모듈에서 임포트하여 사용합니다.
+#
+#
+from fastapi import Request
+
+from app.strategy.router import StrategyRouter
+
+
+def get_strategy_router(request: Request) -> StrategyRouter:
+    """
+    Request 객체에서 StrategyRouter 인스턴스를 가져옵니다.
+    main.py의 startup에서 app.state에 저장된 인스턴스를 사용합니다.
+    """
+    return request.app.state.strategy_router
@@ -8,8 +8,8 @@
 #
 #   **주요 기능:**
 #   - **로그인**: 사용자 이름과 비밀번호를 받아 인증을 수행합니다.
-#   - **비밀번호 검증**: `passlib`를 사용하여 안전하게 해시된 비밀번호를 비교합니다.
-#   - **JWT 생성**: 인증 성공 시, `python-jose`를 사용하여 JWT 액세스 토큰을 생성하여 반환합니다.
+#   - **비밀번호 검증**: Argon2id(`argon2-cffi`)로 해시된 비밀번호를 비교합니다. 기존 bcrypt 해시도 계속 검증할 수 있습니다.
+#   - **JWT 생성**: 인증 성공 시, `PyJWT`를 사용하여 JWT 액세스 토큰을 생성하여 반환합니다.
 #
 #   **보안 고려사항:**
 #   - 실제 프로덕션 환경에서는 HTTPS(TLS)를 통해 모든 API 통신을 암호화해야 합니다.
@@ -17,13 +17,22 @@
 #   - JWT 시크릿 키는 복잡하고 예측 불가능한 문자열로 설정해야 합니다.
 #
 #
-from datetime import datetime, timedelta
+import asyncio
+import hashlib
+import hmac
+import re
+import time
+from datetime import timedelta
 from typing import Annotated
 
+import bcrypt
+import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from jwt import InvalidTokenError as JWTError
 from pydantic import BaseModel
 
 from app.config import settings
@@ -34,13 +43,40 @@ router = APIRouter()
 # 보안 관련 설정 (Security Configuration)
 # --------------------------------------------------------------------------
 
-# 비밀번호 해싱을 위한 컨텍스트 설정 (bcrypt 알고리즘 사용)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # OAuth2 스킴 정의. React Native 앱은 여기서 받은 토큰을 이후 요청의
 # Authorization 헤더에 `Bearer <token>` 형태로 포함해야 합니다.
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+# JWT 형식(base64url 세 부분을 '.'으로 연결)의 정규식.
+# 형식이 맞지 않는 토큰은 해시 계산/캐시 조회/디코딩 없이 바로 거부합니다.
+_BEARER_RE = re.compile(r"^[A-Za-z0-9_\-]+\.[A-Za-z0-9_\-]+\.[A-Za-z0-9_\-]+$")
+
+# 검증이 끝난 토큰의 디코딩 결과(사용자 이름) 캐시.
+# 대시보드가 같은 토큰으로 반복 폴링할 때 매번 HMAC 검증/JSON 파싱을 하지 않도록 합니다.
+# 키는 원본 토큰이 아닌 SHA-256 다이제스트이며, 만료(exp)를 넘겨 캐시되지 않도록
+# 남은 수명이 캐시 TTL 이상인 토큰만 저장합니다.
+_JWT_CACHE_TTL_SECONDS = 30
+_jwt_cache: TTLCache = TTLCache(maxsize=10000, ttl=_JWT_CACHE_TTL_SECONDS)
+
+# JWT 서명 키와 알고리즘은 실행 중 바뀌지 않으므로 임포트 시점에 한 번만 풀어 둡니다.
+_JWT_SECRET = settings.jwt_secret_bytes
+_JWT_ALG = settings.JWT_ALGORITHM
+_JWT_ALGS = [settings.JWT_ALGORITHM]
+
+# Argon2id 해셔. 첫 로그인 시점이 아니라 임포트 시점에 한 번만 생성해 둡니다.
+_password_hasher = PasswordHasher(
+    time_cost=settings.ARGON2_TIME_COST,
+    memory_cost=settings.ARGON2_MEMORY_COST_KIB,
+    parallelism=settings.ARGON2_PARALLELISM,
+)
+
+# 존재하지 않는 사용자 이름으로 로그인할 때 검증에 사용할 더미 해시.
+# 실제 관리자 해시와 같은 방식/비용으로 한 번 검증하여 응답 시간으로 계정 존재 여부가 드러나지 않게 합니다.
+if settings.ADMIN_PASS_HASH.startswith("$argon2"):
+    _DUMMY_HASH = _password_hasher.hash("dummy-password")
+else:
+    _DUMMY_HASH = bcrypt.hashpw(b"dummy-password", bcrypt.gensalt(settings.BCRYPT_COST)).decode('utf-8')
+
 # --------------------------------------------------------------------------
 # Pydantic 모델 정의
 # --------------------------------------------------------------------------
@@ -64,25 +100,52 @@ class LoginRequest(BaseModel):
 # --------------------------------------------------------------------------
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """일반 텍스트 비밀번호와 해시된 비밀번호를 비교합니다."""
-    return pwd_context.verify(plain_password, hashed_password)
+    """
+    일반 텍스트 비밀번호와 해시된 비밀번호를 비교합니다.
+    Argon2id 해시(`$argon2id$...`)는 argon2-cffi로, 그 외(기존 `$2b$...` bcrypt 해시)는
+    bcrypt C 확장으로 검증합니다.
+    """
+    if hashed_password.startswith("$argon2"):
+        try:
+            return _password_hasher.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
+    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+def hash_password(plain_password: str) -> str:
+    """
+    `ADMIN_PASS_HASH`에 넣을 Argon2id 해시를 생성합니다.
+    비용은 `settings.ARGON2_*` 값을 사용합니다.
+
+    비용을 변경하거나 기존 bcrypt 해시에서 옮겨갈 때는 아래처럼 해시를 다시 생성하여 .env에 반영합니다:
+    `python -c "from app.api.routes_auth import hash_password; print(hash_password('new_password'))"`
+    """
+    return _password_hasher.hash(plain_password)
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """JWT 액세스 토큰을 생성합니다."""
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        # 기본 만료 시간: 15분
-        expire = datetime.utcnow() + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.JWT_SECRET.get_secret_value(),
-        algorithm=settings.JWT_ALGORITHM
-    )
+    # 기본 만료 시간: 15분
+    expires_seconds = int(expires_delta.total_seconds()) if expires_delta else 15 * 60
+    # datetime 대신 정수 epoch 초를 직접 사용합니다 (JWT `exp` 클레임 형식과 동일).
+    to_encode["exp"] = int(time.time()) + expires_seconds
+    encoded_jwt = jwt.encode(to_encode, _JWT_SECRET, algorithm=_JWT_ALG)
     return encoded_jwt
 
+def _is_admin_user(username: str) -> bool:
+    """
+    사용자 이름이 관리자 계정과 일치하는지 확인합니다.
+    타이밍 공격으로 계정명을 추측할 수 없도록 상수 시간 비교를 사용합니다.
+    """
+    return hmac.compare_digest(username.encode('utf-8'), settings.admin_user_bytes)
+
+def _cache_verified_username(cache_key: bytes, username: str, exp: int | None) -> None:
+    """검증된 사용자 이름을 토큰의 남은 수명을 넘지 않는 TTL로 캐시합니다."""
+    # TTLCache는 항목별 TTL을 지원하지 않으므로, 남은 수명이 캐시 TTL보다 짧은
+    # (만료가 임박한) 토큰은 캐시하지 않고 매번 디코딩하도록 둡니다.
+    if exp is not None and exp - time.time() >= _JWT_CACHE_TTL_SECONDS:
+        _jwt_cache[cache_key] = username
+
 async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> str:
     """
     요청 헤더의 JWT 토큰을 디코딩하고 유효성을 검증하여 현재 사용자를 식별합니다.
@@ -93,12 +156,16 @@ async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> str
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    if not _BEARER_RE.match(token):
+        raise credentials_exception
+
+    cache_key = hashlib.sha256(token.encode("utf-8")).digest()
+    cached_username = _jwt_cache.get(cache_key)
+    if cached_username is not None:
+        return cached_username
+
     try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET.get_secret_value(),
-            algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = jwt.decode(token, _JWT_SECRET, algorithms=_JWT_ALGS)
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
@@ -109,9 +176,10 @@ async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> str
 
     # 실제 애플리케이션에서는 데이터베이스에서 사용자 정보를 조회할 수 있습니다.
     # 이 예제에서는 사용자 이름이 관리자 이름과 일치하는지만 확인합니다.
-    if username != settings.ADMIN_USER:
+    if not _is_admin_user(username):
         raise credentials_exception
 
+    _cache_verified_username(cache_key, username, payload.get("exp"))
     return username
 
 # --------------------------------------------------------------------------
@@ -140,10 +208,18 @@ async def login_for_access_token(login_request: LoginRequest) -> Token:
     - 이후 모든 제어/주문 관련 API 요청 시 `Authorization: Bearer <token>` 헤더를 추가합니다.
     """
     # .env에 설정된 관리자 계정과 비교하여 인증
-    is_valid_user = (login_request.username == settings.ADMIN_USER)
-    is_valid_password = verify_password(login_request.password, settings.ADMIN_PASS_HASH)
+    # bcrypt 검증은 수십~수백 ms가 걸리므로 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+    if _is_admin_user(login_request.username):
+        is_authenticated = await asyncio.to_thread(
+            verify_password, login_request.password, settings.ADMIN_PASS_HASH
+        )
+    else:
+        # 사용자 이름이 틀린 경우 관리자 해시는 검증하지 않고, 같은 시간이 걸리도록
+        # 더미 해시로 한 번만 검증한 뒤 거부합니다.
+        await asyncio.to_thread(verify_password, login_request.password, _DUMMY_HASH)
+        is_authenticated = False
 
-    if not (is_valid_user and is_valid_password):
+    if not is_authenticated:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -157,4 +233,4 @@ async def login_for_access_token(login_request: LoginRequest) -> Token:
         data={"sub": login_request.username}, expires_delta=access_token_expires
     )
 
-    return {"access_token": access_token, "token_type": "bearer"}
+    return Token(access_token=access_token, token_type="bearer")
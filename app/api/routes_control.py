@@ -17,25 +17,16 @@
 #     유효한 토큰이 없는 경우 `401 Unauthorized` 에러를 반환합니다.
 #
 #
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from loguru import logger
 
+from app.api.deps import get_strategy_router
 from app.api.routes_auth import get_current_user
-from app.state.models import RiskConfig
+from app.state.models import RiskConfig, UniverseUpdate
 from app.strategy.router import StrategyRouter
 
 router = APIRouter()
 
-# --------------------------------------------------------------------------
-# 의존성 주입 함수 (Dependency Injection)
-# --------------------------------------------------------------------------
-
-def get_strategy_router(request: Request) -> StrategyRouter:
-    """
-    Request 객체에서 StrategyRouter 인스턴스를 가져옵니다.
-    """
-    return request.app.state.strategy_router
-
 # --------------------------------------------------------------------------
 # 제어 API 엔드포인트 정의
 # --------------------------------------------------------------------------
@@ -124,7 +115,10 @@ async def update_risk_config(
     - 설정 화면에서 각 리스크 파라미터 값을 입력받아 이 API를 호출합니다.
     - 호출 시 `Authorization: Bearer <token>` 헤더를 반드시 포함해야 합니다.
     """
-    logger.info(f"User '{current_user}' updating risk config to: {risk_config.model_dump_json()}")
+    # 직렬화 비용이 있으므로 INFO 레벨이 비활성화된 경우 model_dump_json()을 호출하지 않도록 지연 평가합니다.
+    logger.opt(lazy=True).info(
+        "User '{}' updating risk config to: {}", lambda: current_user, lambda: risk_config.model_dump_json()
+    )
     try:
         strategy_router.risk_engine.update_config(risk_config)
         return {"message": "Risk configuration updated successfully.", "new_config": risk_config}
@@ -137,7 +131,7 @@ async def update_risk_config(
 
 @router.post("/config/universe", status_code=status.HTTP_200_OK)
 async def update_universe(
-    symbols: list[str],
+    symbols: UniverseUpdate,
     current_user: str = Depends(get_current_user),
     strategy_router: StrategyRouter = Depends(get_strategy_router)
 ):
@@ -146,7 +140,7 @@ async def update_universe(
     
     자동 거래를 수행할 심볼의 화이트리스트를 변경합니다.
     
-    **요청 본문 (Request Body):** 심볼 문자열의 배열
+    **요청 본문 (Request Body):** 심볼 문자열의 배열 (1~500개, 대문자로 정규화되며 중복은 제거됩니다)
     ```json
     [
       "BTCUSDT",
@@ -159,11 +153,14 @@ async def update_universe(
     - 거래를 허용할 코인 목록을 선택하는 UI를 통해 이 API를 호출합니다.
     - 호출 시 `Authorization: Bearer <token>` 헤더를 반드시 포함해야 합니다.
     """
-    logger.info(f"User '{current_user}' updating universe to: {symbols}")
+    new_universe = symbols.root
+    logger.opt(lazy=True).info(
+        "User '{}' updating universe to: {}", lambda: current_user, lambda: new_universe
+    )
     try:
         # TODO: 입력된 심볼들이 Bybit에서 거래 가능한지 유효성 검사 로직 추가 필요
-        strategy_router.risk_engine.update_universe(symbols)
-        return {"message": "Universe updated successfully.", "new_universe": symbols}
+        strategy_router.risk_engine.update_universe(new_universe)
+        return {"message": "Universe updated successfully.", "new_universe": new_universe}
     except Exception as e:
         logger.error(f"Failed to update universe: {e}")
         raise HTTPException(
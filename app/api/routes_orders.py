@@ -3,10 +3,12 @@
 # ===================================================================================
 from typing import List, Any
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from app.state.store import state_store
 
-router = APIRouter()
+# 앱 전역 설정과 별개로, 라우터 단독으로 마운트되어도 orjson으로 직렬화되도록 명시합니다.
+router = APIRouter(default_response_class=ORJSONResponse)
 
 @router.get("/history",
             response_model=List[Any],
@@ -18,9 +20,8 @@ async def get_order_history(limit: int = 100):
     This list is periodically updated from the Bybit API.
     """
     try:
-        # state_store에서 직접 주문 내역을 가져옵니다.
-        order_history = state_store.get_system_state().order_history
-        return order_history[:limit]
+        # 전체 시스템 상태를 복사하지 않고, 필요한 개수만큼의 주문 내역만 가져옵니다.
+        return state_store.get_recent_orders(limit)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
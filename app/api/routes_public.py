@@ -20,31 +20,62 @@
 #
 #   - `GET /config/risk`: 현재 적용된 리스크 관리 설정을 반환합니다.
 #
+#   **캐싱:**
+#   - 위 엔드포인트들은 프로세스 부팅 ID와 데이터 버전을 `ETag` 헤더로 내려주며, 클라이언트가 같은 값을
+#     `If-None-Match`로 보내면 본문 없이 `304 Not Modified`를 반환합니다.
+#   - 직렬화된 JSON은 버전별로 캐시되어, 상태가 바뀌지 않은 폴링 요청은 재직렬화하지 않습니다.
 #
-from fastapi import APIRouter, Depends, Request
+#
+import secrets
+
+from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi.responses import ORJSONResponse
+
+from app.api.deps import get_strategy_router
 from app.state.store import state_store, SystemState
 from app.state.models import RiskConfig
 from app.strategy.router import StrategyRouter
 
-router = APIRouter()
+# 앱 전역 설정과 별개로, 라우터 단독으로 마운트되어도 orjson으로 직렬화되도록 명시합니다.
+router = APIRouter(default_response_class=ORJSONResponse)
 
 # --------------------------------------------------------------------------
-# 의존성 주입 함수 (Dependency Injection)
+# 응답 헬퍼 함수 (Response Helpers)
 # --------------------------------------------------------------------------
 
-def get_strategy_router(request: Request) -> StrategyRouter:
+# 프로세스마다 새로 만드는 부팅 ID. 버전 카운터는 재시작하면 처음부터 다시 세므로,
+# ETag에 함께 넣어 재시작 전의 ETag가 재시작 후의 다른 데이터와 일치하지 않게 합니다.
+_BOOT_ID = secrets.token_hex(4)
+
+def _if_none_match_matches(if_none_match: str, etag: str) -> bool:
+    """`If-None-Match` 헤더가 `etag`와 일치하는지 확인합니다. `*`와 약한 비교(`W/` 접두사)도 처리합니다."""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+def _etag_response(request: Request, kind: str, version: int, content: bytes) -> Response:
     """
-    Request 객체에서 StrategyRouter 인스턴스를 가져옵니다.
-    main.py의 startup에서 app.state에 저장된 인스턴스를 사용합니다.
+    캐시된 JSON 바이트로 응답을 만듭니다. ETag는 `"<kind>-<부팅 ID>-<version>"` 형식입니다.
+    요청의 `If-None-Match`가 현재 ETag와 같으면 본문 없이 304를 반환합니다.
     """
-    return request.app.state.strategy_router
+    etag = f'"{kind}-{_BOOT_ID}-{version}"'
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _if_none_match_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return Response(content=content, media_type="application/json", headers={"ETag": etag})
 
 # --------------------------------------------------------------------------
 # 공개 API 엔드포인트 정의
 # --------------------------------------------------------------------------
 
 @router.get("/status", response_model=SystemState)
-async def get_system_status():
+async def get_system_status(request: Request):
     """
     ## 시스템 전체 상태 조회
     
@@ -60,21 +91,27 @@ async def get_system_status():
     - `recent_errors`: 최근 발생한 오류 메시지 목록
     - `trend_summary`: 최근 감지된 트렌드 이벤트 요약
     - `risk_config`: 현재 적용 중인 리스크 설정
+
+    **RN 앱 연동 가이드:**
+    - 응답의 `ETag` 값을 저장해 두었다가 다음 폴링 시 `If-None-Match` 헤더로 보내면,
+      상태가 바뀌지 않은 경우 `304 Not Modified`만 받게 됩니다.
     """
-    return state_store.get_system_state()
+    version, content = state_store.get_system_state_json()
+    return _etag_response(request, "state", version, content)
 
 @router.get("/symbols", response_model=list[str])
-async def get_universe_symbols(strategy_router: StrategyRouter = Depends(get_strategy_router)):
+async def get_universe_symbols(request: Request, strategy_router: StrategyRouter = Depends(get_strategy_router)):
     """
     ## 거래 가능 심볼 목록 조회
     
     현재 시스템에서 거래 대상으로 설정된 심볼(universe)의 전체 목록을 반환합니다.
     RN 앱에서 수동 주문 등을 위한 심볼 선택 UI에 사용될 수 있습니다.
     """
-    return strategy_router.risk_engine.universe
+    version, content = strategy_router.risk_engine.get_universe_json()
+    return _etag_response(request, "universe", version, content)
 
 @router.get("/config/risk", response_model=RiskConfig)
-async def get_risk_config(strategy_router: StrategyRouter = Depends(get_strategy_router)):
+async def get_risk_config(request: Request, strategy_router: StrategyRouter = Depends(get_strategy_router)):
     """
     ## 현재 리스크 설정 조회
     
@@ -89,4 +126,5 @@ async def get_risk_config(strategy_router: StrategyRouter = Depends(get_strategy
     - `default_sl_bps`: 기본 손절 BPS
     - `trailing_sl_bps`: 추적 손절 BPS
     """
-    return strategy_router.risk_engine.get_config()
+    version, content = strategy_router.risk_engine.get_config_json()
+    return _etag_response(request, "risk", version, content)
@@ -12,12 +12,14 @@
 #
 #
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from app.state.store import state_store
 from app.trend.aggregator import TrendEvent
 
-router = APIRouter()
+# 앱 전역 설정과 별개로, 라우터 단독으로 마운트되어도 orjson으로 직렬화되도록 명시합니다.
+router = APIRouter(default_response_class=ORJSONResponse)
 
 # --------------------------------------------------------------------------
 # Pydantic 모델 정의
@@ -53,15 +55,12 @@ async def get_trend_signals(
     - `page`: 조회할 페이지 번호 (기본값: 1)
     - `page_size`: 한 페이지에 포함할 이벤트 수 (기본값: 20, 최대: 100)
     """
-    events = state_store.get_recent_trend_events()
-    
-    # 페이지네이션 로직
+    # 페이지네이션 로직: 전체 목록을 복사하지 않고 해당 페이지 구간만 가져옵니다.
     start_index = (page - 1) * page_size
-    end_index = start_index + page_size
-    paginated_events = events[start_index:end_index]
+    paginated_events = state_store.get_recent_trend_events_page(start_index, page_size)
     
     return {
-        "total": len(events),
+        "total": state_store.count_trend_events(),
         "page": page,
         "page_size": page_size,
         "events": paginated_events
@@ -9,20 +9,29 @@
 #     파일 I/O를 방지하고 성능을 향상시킵니다.
 #
 #
-import yaml
 from pathlib import Path
+import ahocorasick
+from yaml import load as _yaml_load
 from functools import lru_cache
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+# libyaml 기반 C 로더가 있으면 사용하고, 없으면 순수 파이썬 SafeLoader로 대체합니다.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 # 애셋 파일이 위치한 디렉토리 경로
 ASSETS_DIR = Path(__file__).parent
 
-@lru_cache(maxsize=1)
+# 파일 이름을 인자로 받으므로 maxsize=1이면 두 파일이 서로를 밀어내며 재파싱됩니다.
+@lru_cache(maxsize=None)
 def _load_yaml_file(filename: str) -> Dict | List:
     """YAML 파일을 안전하게 로드하고 그 내용을 캐시합니다."""
     file_path = ASSETS_DIR / filename
     with open(file_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+        return _yaml_load(f, Loader=_YamlLoader)
 
 def load_symbol_map() -> Dict[str, List[str]]:
     """
@@ -61,5 +70,36 @@ def load_universe() -> List[str]:
     return _load_yaml_file("universe.yml")
 
 # 모듈 로드 시점에 데이터를 캐싱
-symbol_map = load_symbol_map()
-universe = load_universe()
+# 실행 중 변경되지 않는 값이므로 읽기 전용 구조로 고정하여, 사용하는 쪽에서
+# 방어적 복사를 하지 않아도 되도록 합니다.
+symbol_map: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {symbol: tuple(keywords or ()) for symbol, keywords in load_symbol_map().items()}
+)
+universe: Tuple[str, ...] = tuple(load_universe())
+
+def _build_keyword_automaton(mapping: Mapping[str, Tuple[str, ...]]) -> "ahocorasick.Automaton":
+    """
+    `symbol_map`의 모든 키워드(소문자)를 하나의 Aho-Corasick 오토마톤으로 묶습니다.
+    텍스트를 한 번만 훑어 등장하는 키워드와 해당 심볼을 찾을 수 있습니다.
+    같은 키워드가 여러 심볼에 있으면 먼저 정의된 심볼이 우선합니다.
+    """
+    automaton = ahocorasick.Automaton()
+    for symbol, keywords in mapping.items():
+        for keyword in keywords:
+            if keyword:
+                key = keyword.lower()
+                if key not in automaton:
+                    automaton.add_word(key, symbol)
+    automaton.make_automaton()
+    return automaton
+
+# 키워드 -> 심볼 매칭용 오토마톤 (값: 심볼). 소문자로 변환한 텍스트에 사용합니다.
+keyword_automaton = _build_keyword_automaton(symbol_map)
+
+def find_symbol(text: str) -> Optional[str]:
+    """`text`(대소문자 무관)에서 가장 먼저 등장하는 키워드의 심볼을 반환합니다. 없으면 None."""
+    if not text:
+        return None
+    for _, symbol in keyword_automaton.iter(text.lower()):
+        return symbol
+    return None
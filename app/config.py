@@ -17,6 +17,7 @@
 #   - 예: `settings.BYBIT_API_KEY`, `settings.DAY_LOSS_LIMIT_USD`
 #
 #
+from functools import cached_property
 from pathlib import Path
 from pydantic import AnyHttpUrl, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -52,7 +53,16 @@ class AppSettings(BaseSettings):
     # 시스템 관리를 위한 초기 관리자 계정 정보
     # 보안을 위해 비밀번호는 해시된 형태로 저장하고 사용하는 것이 좋습니다.
     ADMIN_USER: str = "admin"
+    # Argon2id(`$argon2id$...`) 해시를 권장하며, 기존 bcrypt(`$2b$...`) 해시도 검증할 수 있습니다.
     ADMIN_PASS_HASH: str = "$2b$12$EixZAxWfBCS.xvmj2dIeA.L4SgPp2jP1mAnGzKi/fB.5P8S.J5.3u" # default: "admin"
+    # 관리자 비밀번호 해시(Argon2id) 생성 시 사용할 비용 설정. (OWASP 권장값 기준)
+    # 변경 후에는 `routes_auth.hash_password`로 ADMIN_PASS_HASH를 다시 생성해야 합니다.
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST_KIB: int = 65536  # 64 MiB
+    ARGON2_PARALLELISM: int = 2
+    # 기존 bcrypt 형식의 ADMIN_PASS_HASH를 사용할 때의 bcrypt 비용(work factor).
+    # 값이 1 증가할 때마다 검증 시간이 약 2배가 됩니다.
+    BCRYPT_COST: int = 12
 
     # --- 리스크 관리 설정 ---
     # 일일 최대 손실 한도 (USD 기준). 이 금액 도달 시 모든 거래가 중지됩니다.
@@ -78,6 +88,10 @@ class AppSettings(BaseSettings):
     X_BEARER_TOKEN: SecretStr | None = None # Twitter API v2 Bearer Token
     FB_APP_ID: str | None = None
     FB_APP_SECRET: SecretStr | None = None
+    # 이미 처리한 뉴스 기사 키를 저장하는 SQLite 파일. 재시작 후에도 같은 기사를 다시 보내지 않도록 합니다.
+    NEWS_SEEN_DB_PATH: str = str(PROJECT_ROOT / "news_seen.db")
+    # 처리한 기사 키를 보관하는 기간 (일)
+    NEWS_SEEN_RETENTION_DAYS: int = 7
 
     # --- 데이터베이스 및 이벤트 큐 설정 (선택 사항) ---
     # 프로젝트 루트에 `trading_bot.db`라는 SQLite 파일을 생성하도록 절대 경로를 사용합니다.
@@ -92,8 +106,22 @@ class AppSettings(BaseSettings):
     LOG_TO_FILE: bool = True
     LOG_FILE_PATH: str = str(PROJECT_ROOT / "logs/app.log")
     LOG_JSON_FORMAT: bool = False # JSON 형식으로 로그를 남길지 여부
+
+    # --- 개발 서버 설정 ---
+    DEV_RELOAD: bool = False # main.py를 직접 실행할 때 코드 변경 시 자동 재시작 (개발용)
     MAX_HOLDING_TIME_SECONDS: int
 
+    # --- 파생 값 (요청 처리 경로에서 반복 인코딩을 피하기 위해 미리 계산) ---
+    @cached_property
+    def admin_user_bytes(self) -> bytes:
+        """상수 시간 비교에 사용할 관리자 사용자 이름의 UTF-8 바이트"""
+        return self.ADMIN_USER.encode('utf-8')
+
+    @cached_property
+    def jwt_secret_bytes(self) -> bytes:
+        """JWT 서명/검증에 사용할 시크릿 키의 UTF-8 바이트"""
+        return self.JWT_SECRET.get_secret_value().encode('utf-8')
+
 # 설정 객체 인스턴스 생성
 # 이 `settings` 객체를 다른 모듈에서 임포트하여 사용합니다.
 settings = AppSettings()
\ No newline at end of file
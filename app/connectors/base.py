@@ -9,16 +9,21 @@
 #   **주요 기능:**
 #   - **통일된 인터페이스**: 모든 커넥터는 `run()` 메서드를 통해 실행되고, `_connect_and_stream()` 이라는 내부 메서드를 구현해야 합니다.
 #   - **이벤트 큐 주입**: 생성자에서 `asyncio.Queue`를 주입받아, 모든 커넥터가 수집한 데이터를 동일한 큐에 넣도록 강제합니다. 이 큐는 `TrendAggregator`가 소비합니다.
+#   - **배치 전송**: 이벤트를 하나씩 큐에 넣지 않고 `_emit()`으로 모아 두었다가, 배치 크기(기본 64개)에
+#     도달하거나 짧은 시간 창(기본 50ms)이 지나면 리스트 단위로 한 번에 큐에 넣습니다.
+#   - **백프레셔**: 큐가 가득 차면(소비자가 밀리면) 가장 오래된 배치를 버리고 새 배치를 넣습니다.
+#     버린 이벤트 수는 최대 1분에 한 번 경고 로그로 남깁니다.
 #   - **상태 관리**: `is_running` 플래그를 통해 커넥터의 실행 상태를 관리합니다.
 #   - **자동 재시도 로직**: `run()` 메서드 내에 기본적인 재시도 및 백오프 로직을 포함하여, 하위 클래스에서 발생할 수 있는 일시적인 연결 문제를 처리합니다.
 #
 #   **구현 가이드:**
 #   - 새로운 데이터 소스를 추가하려면, 이 `BaseFeedConnector`를 상속받고 다음을 구현해야 합니다:
-#     1. `_connect_and_stream()`: 실제 데이터 소스에 연결하고, 데이터를 스트리밍하며, 수신된 데이터를 파싱하여 `TrendEvent`로 변환한 뒤 `self.queue.put()`을 호출하는 로직.
+#     1. `_connect_and_stream()`: 실제 데이터 소스에 연결하고, 데이터를 스트리밍하며, 수신된 데이터를 파싱하여 `TrendEvent`로 변환한 뒤 `self._emit()`을 호출하는 로직.
 #     2. `stop()`: 스트림 연결을 정상적으로 종료하는 로직.
 #
 #
 import asyncio
+import time
 from abc import ABC, abstractmethod
 from loguru import logger
 
@@ -28,24 +33,96 @@ class BaseFeedConnector(ABC):
     """
     모든 데이터 피드 커넥터의 추상 베이스 클래스.
     """
-    def __init__(self, queue: asyncio.Queue[TrendEvent], source_name: str):
+    # 큐 오버플로로 버린 이벤트 수를 로그로 남기는 최소 간격 (초)
+    DROP_LOG_INTERVAL_SECONDS = 60
+
+    def __init__(self, queue: asyncio.Queue[list[TrendEvent]], source_name: str,
+                 batch_size: int = 64, batch_window_seconds: float = 0.05):
         """
         커넥터를 초기화합니다.
 
-        :param queue: 수집된 TrendEvent를 넣을 비동기 큐.
+        :param queue: 수집된 TrendEvent 배치(리스트)를 넣을 비동기 큐.
         :param source_name: 데이터 소스의 이름 (예: 'X', 'NewsAPI').
+        :param batch_size: 이 개수만큼 이벤트가 모이면 즉시 큐로 보냅니다.
+        :param batch_window_seconds: 첫 이벤트가 모인 뒤 이 시간이 지나면 배치 크기와 무관하게 보냅니다.
         """
         self.queue = queue
         self.source_name = source_name
+        self.batch_size = batch_size
+        self.batch_window_seconds = batch_window_seconds
         self._is_running = False
         self._task: asyncio.Task | None = None
+        # stop() 호출 시 백오프 대기를 즉시 깨우기 위한 이벤트
+        self._stop_event = asyncio.Event()
+        self._pending_batch: list[TrendEvent] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # 큐가 가득 차서 버린 이벤트 수 (마지막 로그 이후 누적)
+        self._dropped = 0
+        self._last_drop_log = time.monotonic()
+
+    def _emit(self, event: TrendEvent):
+        """
+        이벤트를 현재 배치에 추가합니다.
+        배치가 가득 차면 바로 보내고, 그렇지 않으면 시간 창이 끝날 때 보내도록 예약합니다.
+        """
+        self._pending_batch.append(event)
+        if len(self._pending_batch) >= self.batch_size:
+            self._flush_batch()
+        elif self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(self.batch_window_seconds, self._flush_batch)
+
+    def _emit_many(self, events: list[TrendEvent]):
+        """
+        한꺼번에 준비된 이벤트들(예: 한 번의 폴링 결과)을 시간 창을 기다리지 않고 바로 보냅니다.
+        """
+        if events:
+            self._pending_batch.extend(events)
+            self._flush_batch()
+
+    def _flush_batch(self):
+        """모아 둔 이벤트를 하나의 리스트로 큐에 넣습니다."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._pending_batch:
+            batch, self._pending_batch = self._pending_batch, []
+            self._put_drop_oldest(batch)
+
+    def _put_drop_oldest(self, batch: list[TrendEvent]):
+        """
+        배치를 큐에 넣습니다. 큐가 가득 찼으면 가장 오래된 배치를 버리고 넣습니다.
+        생산자(스트림 수신)가 소비자 때문에 멈추지 않도록 기다리지 않습니다.
+        """
+        try:
+            self.queue.put_nowait(batch)
+            return
+        except asyncio.QueueFull:
+            pass
+        try:
+            dropped = self.queue.get_nowait()
+            # 꺼낸 배치는 처리되지 않으므로 바로 완료 처리하여 join() 카운트를 맞춥니다.
+            self.queue.task_done()
+            self._dropped += len(dropped)
+        except asyncio.QueueEmpty:
+            pass
+        self.queue.put_nowait(batch)
+        self._log_dropped()
+
+    def _log_dropped(self):
+        """누적된 드롭 수를 최대 `DROP_LOG_INTERVAL_SECONDS`마다 한 번 로그로 남깁니다."""
+        now = time.monotonic()
+        if self._dropped and now - self._last_drop_log >= self.DROP_LOG_INTERVAL_SECONDS:
+            logger.warning(f"{self.source_name}: event queue full, dropped {self._dropped} oldest events in the last {now - self._last_drop_log:.0f}s.")
+            self._dropped = 0
+            self._last_drop_log = now
 
     @abstractmethod
     async def _connect_and_stream(self):
         """
         [구현 필요] 데이터 소스에 연결하고 스트리밍하는 핵심 로직.
         이 메서드는 데이터를 수신하고 `TrendEvent`로 변환한 뒤,
-        `await self.queue.put(event)`를 호출해야 합니다.
+        `self._emit(event)`를 호출해야 합니다.
         """
         pass
 
@@ -54,6 +131,7 @@ class BaseFeedConnector(ABC):
         커넥터를 실행하고, 연결이 끊어지면 지수 백오프와 함께 재연결을 시도합니다.
         """
         self._is_running = True
+        self._stop_event.clear()
         logger.info(f"Starting {self.source_name} connector...")
         backoff_delay = 5  # 초기 백오프 딜레이 (초)
         while self._is_running:
@@ -67,7 +145,12 @@ class BaseFeedConnector(ABC):
                 break
             except Exception as e:
                 logger.error(f"Error in {self.source_name} connector: {e}. Retrying in {backoff_delay} seconds.", exc_info=True)
-                await asyncio.sleep(backoff_delay)
+                # 단순 sleep 대신 중지 이벤트를 기다려, 대기 중에도 stop()이 즉시 반영되도록 합니다.
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=backoff_delay)
+                    break
+                except asyncio.TimeoutError:
+                    pass
                 backoff_delay = min(backoff_delay * 2, 300) # 최대 5분까지 딜레이 증가
         logger.info(f"{self.source_name} connector stopped.")
 
@@ -81,6 +164,8 @@ class BaseFeedConnector(ABC):
         커넥터 실행을 중지합니다.
         """
         self._is_running = False
+        self._stop_event.set()
+        self._flush_batch()
         if self._task and not self._task.done():
             self._task.cancel()
         logger.info(f"Stopping {self.source_name} connector...")
@@ -118,5 +203,5 @@ class MockFeedConnector(BaseFeedConnector):
                 url=f"https://mock.event/{random.randint(1000,9999)}",
                 timestamp=now(),
             )
-            await self.queue.put(event)
-            logger.info(f"[MOCK] Generated trend event: {event.text}")
+            self._emit(event)
+            logger.info("[MOCK] Generated trend event: {}", event.text)
@@ -26,7 +26,7 @@ from app.config import settings
 from app.connectors.base import BaseFeedConnector, MockFeedConnector
 from app.utils.typing import TrendEvent
 
-def create_facebook_connector(queue: asyncio.Queue[TrendEvent]) -> BaseFeedConnector:
+def create_facebook_connector(queue: asyncio.Queue[list[TrendEvent]], client: httpx.AsyncClient) -> BaseFeedConnector:
     """
     Facebook App ID/Secret의 존재 여부에 따라 실제 커넥터 또는 모의 커넥터를 생성하는 팩토리 함수.
     대부분의 경우 모의 커넥터를 반환하게 됩니다.
@@ -35,7 +35,7 @@ def create_facebook_connector(queue: asyncio.Queue[TrendEvent]) -> BaseFeedConne
         settings.FB_APP_SECRET.get_secret_value() != ""):
         logger.warning("Facebook credentials found, but real implementation is a placeholder. Using MockFeedConnector for Facebook.")
         # 실제 구현이 필요할 경우 아래 라인을 활성화하고 FacebookConnector를 완성해야 합니다.
-        # return FacebookConnector(queue)
+        # return FacebookConnector(queue, client)
         return MockFeedConnector(queue, source_name="Facebook")
     else:
         logger.warning("Facebook credentials not found. Creating MockFeedConnector for Facebook.")
@@ -50,19 +50,22 @@ class FacebookConnector(BaseFeedConnector):
     """
     API_URL = "https://graph.facebook.com/v18.0"
 
-    def __init__(self, queue: asyncio.Queue[TrendEvent], poll_interval_minutes: int = 15):
+    def __init__(self, queue: asyncio.Queue[list[TrendEvent]], client: httpx.AsyncClient, poll_interval_minutes: int = 15):
         super().__init__(queue, source_name="Facebook")
         self.app_id = settings.FB_APP_ID
         self.app_secret = settings.FB_APP_SECRET.get_secret_value()
+        # 앱 토큰은 자격 증명으로부터 고정적으로 만들어지므로 한 번만 계산해 둡니다.
+        self._app_token = f"{self.app_id}|{self.app_secret}"
         self.poll_interval_seconds = poll_interval_minutes * 60
-        self.client = httpx.AsyncClient(timeout=20.0)
+        # 커넥터별로 커넥션 풀을 만들지 않고 TrendAggregator가 만든 공유 클라이언트를 사용합니다.
+        self.client = client
         self.target_page_id = "some_public_crypto_page_id" # 모니터링할 페이지 ID
 
     async def _get_access_token(self):
         """앱 자격 증명으로 액세스 토큰을 얻습니다."""
         # 실제로는 사용자 토큰이나 페이지 액세스 토큰이 필요할 수 있습니다.
         # 이것은 가장 기본적인 앱 토큰입니다.
-        return f"{self.app_id}|{self.app_secret}"
+        return self._app_token
 
     async def _connect_and_stream(self):
         """
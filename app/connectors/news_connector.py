@@ -12,8 +12,10 @@
 #   - **주기적 폴링**: 설정된 시간(예: 5분)마다 뉴스 API에 새로운 기사를 요청합니다.
 #   - **키워드 검색**: `symbol_map.yml`의 키워드를 조합하여 관련성 높은 뉴스를 검색합니다.
 #     (예: `(Bitcoin OR BTC) AND (crypto OR currency)`)
-#   - **중복 방지**: 한 번 처리한 뉴스를 다시 처리하지 않도록 기사의 URL이나 제목을
-#     기억하는 메커니즘을 포함합니다. (`self.seen_articles`)
+#   - **중복 방지**: 한 번 처리한 뉴스를 다시 처리하지 않도록 정규화된 기사 URL을
+#     16바이트 해시로 크기가 제한된 LRU(`self.seen_articles`)에 기억합니다. 추적용 쿼리(`utm_*`)나
+#     프래그먼트만 다른 URL은 같은 기사로 취급합니다. 키는 SQLite 파일(`NEWS_SEEN_DB_PATH`, WAL 모드)에도
+#     기록되어, 재시작 후에도 최근 `NEWS_SEEN_RETENTION_DAYS`일 동안 본 기사는 다시 보내지 않습니다.
 #   - **API 호출 관리**: 단시간에 너무 많은 요청을 보내지 않도록 폴링 주기를 관리합니다.
 #   - **모의 모드(Mock Mode)**: `NEWS_API_KEY`가 없으면 `MockFeedConnector`로 대체되어
 #     가상의 뉴스 이벤트를 생성합니다.
@@ -24,25 +26,84 @@
 #
 #
 import asyncio
-import json
-from typing import Set
+import hashlib
+import sqlite3
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import httpx
+import orjson
 from loguru import logger
 
-from app.assets import symbol_map
+from app.assets import find_symbol, symbol_map
 from app.config import settings
 from app.connectors.base import BaseFeedConnector, MockFeedConnector
 from app.utils.time import now
 from app.utils.typing import TrendEvent
 
-def create_news_connector(queue: asyncio.Queue[TrendEvent]) -> BaseFeedConnector:
+# 기사 식별과 무관한 추적용 쿼리 파라미터 (`utm_*`는 접두사로 따로 처리)
+_TRACKING_PARAMS = frozenset({"ref", "fbclid", "gclid"})
+
+def normalize_article_url(url: str) -> str:
+    """
+    중복 판별을 위해 기사 URL을 정규화합니다.
+    스킴/호스트를 소문자로 바꾸고, 추적 파라미터(`utm_*`, `ref`, `fbclid`, `gclid`)와 프래그먼트(#...)를 제거합니다.
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                       if not (k.lower().startswith("utm_") or k.lower() in _TRACKING_PARAMS)])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ""))
+
+def article_url_key(url: str) -> bytes:
+    """정규화된 기사 URL의 16바이트 blake2b 다이제스트. 중복 판별 LRU의 키로 사용합니다."""
+    return hashlib.blake2b(normalize_article_url(url).encode("utf-8"), digest_size=16).digest()
+
+def parse_news_response(content: bytes) -> Tuple[dict, List[Tuple[bytes, dict]]]:
+    """
+    NewsAPI 응답 바이트를 파싱하여 (기사 URL 키, 기사 dict) 목록으로 변환합니다. 순서는 응답 순서(최신순)를 유지합니다.
+    응답은 `pageSize=20`으로 수십 KB 이하이므로 이벤트 루프에서 바로 파싱합니다.
+
+    :return: (`articles`를 포함한 원본 응답 dict, 파싱 결과 목록)
+    """
+    # httpx의 .json()(표준 json + 문자열 디코딩) 대신 바이트를 orjson으로 바로 파싱합니다.
+    data = orjson.loads(content)
+    parsed: List[Tuple[bytes, dict]] = []
+    if data.get("status") != "ok":
+        return data, parsed
+
+    for article in data.get("articles", []):
+        article_url = article.get("url")
+        if article_url:
+            parsed.append((article_url_key(article_url), article))
+    return data, parsed
+
+def article_to_event(article: dict, source_name: str, batch_ts: datetime) -> Optional[TrendEvent]:
+    """기사를 심볼과 매칭하여 TrendEvent로 변환합니다. 매칭되는 심볼이 없으면 None."""
+    # 기사 내용에서 어떤 심볼과 관련있는지 찾습니다.
+    # 제목을 먼저 확인하고, 제목에 키워드가 없을 때만 설명을 소문자로 바꿔 검사합니다.
+    # (제목+설명을 이어 붙인 문자열을 매번 만들지 않습니다.)
+    matched_symbol = find_symbol(article.get("title") or "") or find_symbol(article.get("description") or "")
+    if not matched_symbol:
+        return None
+    return TrendEvent(
+        source=source_name,
+        symbol_raw=matched_symbol,
+        text=f'{article["title"]}: {article.get("description", "")}',
+        url=article["url"],
+        timestamp=batch_ts,
+        author=article.get("source", {}).get("name")
+    )
+
+def create_news_connector(queue: asyncio.Queue[list[TrendEvent]], client: httpx.AsyncClient) -> BaseFeedConnector:
     """
     News API 키의 존재 여부에 따라 실제 커넥터 또는 모의 커넥터를 생성하는 팩토리 함수.
     """
     if settings.NEWS_API_KEY and settings.NEWS_API_KEY.get_secret_value() != "":
         logger.info("NEWS_API_KEY found, creating real NewsConnector.")
-        return NewsConnector(queue)
+        return NewsConnector(queue, client)
     else:
         logger.warning("NEWS_API_KEY not found. Creating MockFeedConnector for News.")
         return MockFeedConnector(queue, source_name="News")
@@ -52,31 +113,131 @@ class NewsConnector(BaseFeedConnector):
     NewsAPI.org를 폴링하여 암호화폐 관련 뉴스를 수집합니다.
     """
     API_URL = "https://newsapi.org/v2/everything"
+    # 중복 판별용으로 기억할 최대 기사 수. 초과 시 가장 오래 전에 본 기사부터 잊습니다.
+    MAX_SEEN_ARTICLES = 50_000
+    # 쿼리 하나에 넣을 키워드 수와, 한 번의 폴링에서 보낼 최대 쿼리(샤드) 수
+    KEYWORDS_PER_QUERY = 25
+    MAX_QUERY_SHARDS = 4
+    # 동시에 진행할 수 있는 NewsAPI 요청 수
+    MAX_CONCURRENT_REQUESTS = 5
+    # 한 응답(최신순)에서 이미 본 기사가 이만큼 연속되면 나머지는 확인하지 않습니다.
+    STOP_AFTER_CONSECUTIVE_SEEN = 5
+    # 디스크 중복 조회 시 `IN (...)` 한 번에 넣을 최대 키 수 (SQLite 바인딩 변수 한도 이내)
+    SEEN_LOOKUP_CHUNK = 500
 
-    def __init__(self, queue: asyncio.Queue[TrendEvent], poll_interval_minutes: int = 10):
+    def __init__(self, queue: asyncio.Queue[list[TrendEvent]], client: httpx.AsyncClient, poll_interval_minutes: int = 10):
         super().__init__(queue, source_name="NewsAPI")
         self.api_key = settings.NEWS_API_KEY.get_secret_value()
         self.poll_interval_seconds = poll_interval_minutes * 60
-        self.client = httpx.AsyncClient(timeout=20.0)
-        self.seen_articles: Set[str] = set() # 중복 처리를 막기 위해 기사 URL을 저장
+        # 커넥터별로 커넥션 풀을 만들지 않고 TrendAggregator가 만든 공유 클라이언트를 사용합니다.
+        self.client = client
+        # 중복 처리를 막기 위해 기사 URL 키(정규화 URL의 16바이트 해시)를 저장 (크기가 제한된 LRU)
+        self.seen_articles: OrderedDict[bytes, None] = OrderedDict()
+        # 재시작 후에도 중복을 막기 위해 기사 키를 디스크에도 기록합니다. LRU는 그 앞단의 캐시 역할을 합니다.
+        self._seen_db = self._open_seen_db(settings.NEWS_SEEN_DB_PATH)
+        # 워커 스레드에서 진행 중인(또는 마지막) `_seen_db` 작업. 종료 시 이 작업이 끝난 뒤에 연결을 닫습니다.
+        self._seen_db_call: Optional[asyncio.Future] = None
+        self._last_prune = 0.0
+        # symbol_map은 실행 중 바뀌지 않으므로 검색 쿼리(샤드)는 한 번만 만들어 둡니다.
+        self._queries = self._build_queries()
+        # NewsAPI 속도 제한을 넘지 않도록 동시에 보내는 요청 수를 제한합니다.
+        self._request_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+    @staticmethod
+    def _open_seen_db(path: str) -> sqlite3.Connection:
+        """
+        처리한 기사 키를 저장하는 SQLite DB를 열고 테이블을 준비합니다.
+        조회/기록은 `asyncio.to_thread`로 워커 스레드에서 실행합니다. 폴링 루프가 한 번에 하나씩만
+        호출하므로 동시에 두 스레드가 연결을 쓰지 않습니다 (`check_same_thread=False`).
+        """
+        db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("CREATE TABLE IF NOT EXISTS seen (url_hash BLOB PRIMARY KEY, ts INTEGER NOT NULL)")
+        return db
+
+    async def _run_on_seen_db(self, func, *args):
+        """
+        `_seen_db`를 쓰는 함수를 워커 스레드에서 실행합니다.
+        폴링 태스크가 취소되어도 스레드의 작업은 멈추지 않으므로, `shield`로 감싸 두고 `_close_seen_db`가 그 끝을 기다립니다.
+        """
+        self._seen_db_call = asyncio.ensure_future(asyncio.to_thread(func, *args))
+        return await asyncio.shield(self._seen_db_call)
+
+    async def _close_seen_db(self):
+        """진행 중인 `_seen_db` 작업이 끝나기를 기다린 뒤 워커 스레드에서 연결을 닫습니다."""
+        if self._seen_db_call is not None:
+            await asyncio.gather(self._seen_db_call, return_exceptions=True)
+        await asyncio.to_thread(self._seen_db.close)
+
+    def _lookup_seen_on_disk(self, keys: List[bytes]) -> Set[bytes]:
+        """`keys` 중 디스크(재시작 이전 기록 포함)에 이미 기록된 키들을 반환합니다. 워커 스레드에서 호출합니다."""
+        found: Set[bytes] = set()
+        for i in range(0, len(keys), self.SEEN_LOOKUP_CHUNK):
+            chunk = keys[i:i + self.SEEN_LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._seen_db.execute(f"SELECT url_hash FROM seen WHERE url_hash IN ({placeholders})", chunk)
+            found.update(row[0] for row in rows)
+        return found
+
+    def _seen(self, key: bytes, seen_on_disk: Set[bytes]) -> bool:
+        """
+        이미 처리한 기사인지 확인하고, 그렇다면 최근 사용으로 갱신합니다.
+        `seen_on_disk`는 이번 폴링에서 `_lookup_seen_on_disk`로 한 번에 조회해 둔 결과입니다.
+        """
+        if key in self.seen_articles:
+            self.seen_articles.move_to_end(key)
+            return True
+        if key in seen_on_disk:
+            self._remember(key)
+            return True
+        return False
 
-    def _build_query(self) -> str:
-        """`symbol_map`을 기반으로 검색 쿼리를 생성합니다."""
-        # 모든 심볼의 키워드를 OR로 묶어 하나의 긴 쿼리로 만듭니다.
+    def _mark(self, key: bytes):
+        """기사를 처리한 것으로 기록합니다. 디스크 기록은 `_persist_seen()`에서 폴링 단위로 모아서 합니다."""
+        self._remember(key)
+
+    def _remember(self, key: bytes):
+        """LRU에 키를 추가하고, 한도를 넘으면 가장 오래된 항목을 제거합니다."""
+        self.seen_articles[key] = None
+        if len(self.seen_articles) > self.MAX_SEEN_ARTICLES:
+            self.seen_articles.popitem(last=False)
+
+    def _persist_seen(self, keys: List[bytes]):
+        """새로 처리한 기사 키들을 하나의 트랜잭션으로 디스크에 기록하고, 하루에 한 번 오래된 키를 정리합니다."""
+        now_ts = int(time.time())
+        if keys:
+            with self._seen_db:
+                self._seen_db.execute("BEGIN")
+                self._seen_db.executemany(
+                    "INSERT OR IGNORE INTO seen (url_hash, ts) VALUES (?, ?)", ((k, now_ts) for k in keys)
+                )
+        if time.monotonic() - self._last_prune >= 24 * 60 * 60:
+            cutoff = now_ts - settings.NEWS_SEEN_RETENTION_DAYS * 24 * 60 * 60
+            self._seen_db.execute("DELETE FROM seen WHERE ts < ?", (cutoff,))
+            self._last_prune = time.monotonic()
+
+    def _build_queries(self) -> List[str]:
+        """
+        `symbol_map`을 기반으로 검색 쿼리들을 생성합니다.
+        키워드를 `KEYWORDS_PER_QUERY`개씩 나눠 여러 쿼리(샤드)로 만들고, 폴링 시 동시에 요청합니다.
+        """
         all_keywords = []
         for keywords in symbol_map.values():
             if keywords:
                 all_keywords.extend([f'"{k}"' for k in keywords if k and len(k) > 2])
-        
-        # 중복 제거 후 쿼리 생성
-        unique_keywords = list(set(all_keywords))
-        # NewsAPI 쿼리 길이 제한(500자)을 고려해야 함
-        query = " OR ".join(unique_keywords[:30]) # 예시로 30개 키워드만 사용
-        return f"({query}) AND (crypto OR cryptocurrency OR blockchain)"
 
-    async def _fetch_news(self):
-        """뉴스 API를 호출하여 최신 기사를 가져옵니다."""
-        query = self._build_query()
+        # 중복 제거 후 정렬하여 항상 같은 쿼리가 만들어지도록 합니다.
+        unique_keywords = sorted(set(all_keywords))
+        # NewsAPI 쿼리 길이 제한(500자)과 요청 한도를 고려해 샤드 크기와 개수를 제한합니다.
+        queries = []
+        for i in range(0, len(unique_keywords), self.KEYWORDS_PER_QUERY):
+            query = " OR ".join(unique_keywords[i:i + self.KEYWORDS_PER_QUERY])
+            queries.append(f"({query}) AND (crypto OR cryptocurrency OR blockchain)")
+        return queries[:self.MAX_QUERY_SHARDS]
+
+    async def _fetch_shard(self, query: str) -> List[Tuple[bytes, dict]]:
+        """하나의 쿼리(샤드)로 NewsAPI를 호출하고 파싱 결과를 반환합니다. 중복 판별은 하지 않습니다."""
         params = {
             "q": query,
             "apiKey": self.api_key,
@@ -84,44 +245,81 @@ class NewsConnector(BaseFeedConnector):
             "pageSize": 20, # 한 번에 가져올 기사 수
             "language": "en"
         }
-        try:
+        async with self._request_semaphore:
             response = await self.client.get(self.API_URL, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            if data.get("status") == "ok":
-                articles = data.get("articles", [])
-                logger.info(f"Fetched {len(articles)} articles from NewsAPI.")
-                for article in articles:
-                    article_url = article.get("url")
-                    if article_url and article_url not in self.seen_articles:
-                        self.seen_articles.add(article_url)
-                        
-                        # 기사 내용에서 어떤 심볼과 관련있는지 찾아야 함 (간단한 버전)
-                        title_desc = f'{article.get("title", "")} {article.get("description", "")}'.lower()
-                        matched_symbol = None
-                        for symbol, keywords in symbol_map.items():
-                            if keywords and any(k and k.lower() in title_desc for k in keywords):
-                                matched_symbol = symbol
-                                break
-                        
-                        if matched_symbol:
-                            event = TrendEvent(
-                                source=self.source_name,
-                                symbol_raw=matched_symbol,
-                                text=f'{article["title"]}: {article.get("description", "")}',
-                                url=article_url,
-                                timestamp=now(),
-                                author=article.get("source", {}).get("name")
-                            )
-                            await self.queue.put(event)
-            else:
-                logger.error(f"NewsAPI error: {data.get('message')}")
-
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error while fetching news: {e.response.status_code} - {e.response.text}")
-        except Exception as e:
-            logger.error(f"Failed to fetch or process news: {e}", exc_info=True)
+        response.raise_for_status()
+        data, parsed = parse_news_response(response.content)
+
+        if data.get("status") != "ok":
+            logger.error(f"NewsAPI error: {data.get('message')}")
+            return []
+        return parsed
+
+    async def _fetch_news(self):
+        """모든 쿼리 샤드로 뉴스 API를 동시에 호출하고, 결과를 합쳐 중복을 제거한 뒤 보냅니다."""
+        # 10분 주기 폴링이므로 한 번의 폴링에 속한 기사들은 같은 수집 시각을 사용합니다.
+        batch_ts = now()
+        results = await asyncio.gather(
+            *(self._fetch_shard(query) for query in self._queries), return_exceptions=True
+        )
+
+        shard_results: List[List[Tuple[bytes, dict]]] = []
+        for result in results:
+            if isinstance(result, httpx.HTTPStatusError):
+                logger.error(f"HTTP error while fetching news: {result.response.status_code} - {result.response.text}")
+                continue
+            if isinstance(result, BaseException):
+                logger.opt(exception=result).error(f"Failed to fetch or process news: {result}")
+                continue
+            shard_results.append(result)
+
+        # 메모리 LRU에 없는 키만 모아 디스크를 한 번에(워커 스레드에서) 조회합니다.
+        unknown_keys = list({key for result in shard_results for key, _ in result if key not in self.seen_articles})
+        seen_on_disk: Set[bytes] = set()
+        if unknown_keys:
+            try:
+                seen_on_disk = await self._run_on_seen_db(self._lookup_seen_on_disk, unknown_keys)
+            except sqlite3.Error as e:
+                # 조회에 실패하면 메모리 LRU만으로 중복을 판별합니다.
+                logger.error(f"Failed to look up seen news articles: {e}")
+
+        events: list[TrendEvent] = []
+        new_keys: List[bytes] = []
+        fetched = 0
+        for result in shard_results:
+            fetched += len(result)
+            # 중복 판별(LRU)은 커넥터 상태이므로 모든 샤드 결과를 모은 뒤 이벤트 루프에서 처리합니다.
+            # 중복 판별을 먼저 하고, 새 기사에 대해서만 심볼 매칭/이벤트 생성을 합니다.
+            # 응답은 최신순이므로 이미 본 기사가 연속으로 나오면 그 뒤도 이미 본 기사로 보고 멈춥니다.
+            consecutive_seen = 0
+            for article_key, article in result:
+                if self._seen(article_key, seen_on_disk):
+                    consecutive_seen += 1
+                    if consecutive_seen >= self.STOP_AFTER_CONSECUTIVE_SEEN:
+                        break
+                    continue
+                consecutive_seen = 0
+                self._mark(article_key)
+                new_keys.append(article_key)
+                event = article_to_event(article, self.source_name, batch_ts)
+                if event is not None:
+                    events.append(event)
+
+        logger.info(f"Fetched {fetched} articles from NewsAPI across {len(self._queries)} queries.")
+        try:
+            await self._run_on_seen_db(self._persist_seen, new_keys)
+        except sqlite3.Error as e:
+            # 기록에 실패해도 메모리 LRU로 중복은 계속 막히므로 폴링은 계속합니다.
+            logger.error(f"Failed to persist seen news articles: {e}")
+        # 한 번의 폴링에서 수집한 기사들은 하나의 배치로 한 번에 보냅니다.
+        self._emit_many(events)
+
+    async def run(self):
+        """폴링 루프를 실행하고, 루프가 끝나면(중지/취소 포함) 처리한 기사 키를 기록하는 SQLite 연결을 닫습니다."""
+        try:
+            await super().run()
+        finally:
+            await self._close_seen_db()
 
     async def _connect_and_stream(self):
         """주기적으로 `_fetch_news`를 호출하는 폴링 루프입니다."""
@@ -13,12 +13,15 @@
 #   - **동적 필터링 규칙**: `assets/symbol_map.yml` 파일을 읽어, 거래 대상 심볼과 관련된
 #     키워드, 캐시태그, 해시태그를 포함하는 필터링 규칙을 생성합니다.
 #     (예: `($BTC OR #Bitcoin OR "Bitcoin price")`)
-#   - **실시간 스트리밍**: `httpx.AsyncClient`의 스트리밍 요청을 사용하여 X 서버와의 연결을
-#     유지하고, 실시간으로 들어오는 트윗 데이터를 처리합니다.
+#   - **실시간 스트리밍**: 장시간 유지되는 스트림 연결은 `aiohttp`로 열어 X 서버와의 연결을
+#     유지하고, 실시간으로 들어오는 트윗 데이터를 처리합니다. 규칙 관리(REST)는 공유 `httpx` 클라이언트를 사용합니다.
 #   - **자동 재연결 및 규칙 업데이트**: 스트림 연결이 끊어지면 자동으로 재연결을 시도하며,
 #     시작 시 기존 규칙을 삭제하고 새로운 규칙을 설정하여 항상 최신 상태를 유지합니다.
 #   - **하트비트(Heartbeat) 처리**: X API는 연결 유지를 위해 주기적으로 빈 줄(하트비트)을
 #     보내는데, 이를 정상적인 신호로 처리하고 타임아웃을 방지합니다.
+#   - **노이즈 사전 필터**: 리트윗(`RT @`)이나 뻔한 스팸 문구가 담긴 줄은 JSON 파싱 전에
+#     원시 바이트 단계에서 버립니다. `hyperscan`이 설치되어 있으면 사용하고, 없으면 하나의
+#     정규식(alternation)으로 대체합니다.
 #   - **모의 모드(Mock Mode)**: `X_BEARER_TOKEN`이 제공되지 않으면, `MockFeedConnector`로
 #     대체되어 실제 API 호출 없이 가상의 데이터 스트림을 생성합니다.
 #
@@ -29,10 +32,13 @@
 #
 #
 import asyncio
-import json
+import re
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+import aiohttp
 import httpx
+import msgspec
 from loguru import logger
 
 from app.assets import symbol_map
@@ -41,14 +47,89 @@ from app.connectors.base import BaseFeedConnector, MockFeedConnector
 from app.utils.time import now
 from app.utils.typing import TrendEvent
 
+# --------------------------------------------------------------------------
+# 스트림 메시지 스키마 (msgspec)
+# --------------------------------------------------------------------------
+# 스트림의 각 줄을 dict로 파싱한 뒤 키를 찾아 들어가는 대신, 필요한 필드만 정의한
+# 구조체로 한 번에 디코딩합니다. 정의되지 않은 필드는 무시됩니다.
 
-def create_x_connector(queue: asyncio.Queue[TrendEvent]) -> BaseFeedConnector:
+class Tweet(msgspec.Struct):
+    id: str
+    text: str
+    author_id: str
+    lang: Optional[str] = None
+
+class MatchingRule(msgspec.Struct):
+    id: Optional[str] = None
+    tag: Optional[str] = None
+
+class User(msgspec.Struct):
+    username: Optional[str] = None
+
+class Includes(msgspec.Struct):
+    users: List[User] = []
+
+class TweetMsg(msgspec.Struct):
+    data: Optional[Tweet] = None
+    matching_rules: List[MatchingRule] = []
+    includes: Optional[Includes] = None
+
+# hyperscan(Intel의 다중 패턴 정규식 엔진)이 있으면 사용하고, 없으면 표준 `re`로 대체합니다.
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# 스트림 원시 줄(JSON 바이트)에서 찾을 노이즈 패턴. 하나라도 매칭되면 파싱하지 않고 버립니다.
+NOISE_PATTERNS: tuple[bytes, ...] = (
+    rb'"text":\s*"RT @',                                  # 리트윗
+    rb'free\s+airdrop',                                   # 에어드랍 스팸
+    rb'claim\s+your\s+(?:free\s+)?(?:tokens?|airdrop|reward)',
+    rb'\b(?:t\.me|bit\.ly|tinyurl\.com)/',                   # 홍보용 단축/텔레그램 링크
+)
+
+def _build_noise_matcher(patterns: tuple[bytes, ...]):
+    """
+    `patterns` 중 하나라도 포함된 줄인지 판별하는 함수를 만듭니다. (대소문자 무시)
+    hyperscan을 쓸 수 있으면 하나의 DFA 데이터베이스로, 아니면 하나의 정규식으로 컴파일합니다.
+    """
+    if hyperscan is not None:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=list(patterns),
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[hyperscan.HS_FLAG_CASELESS] * len(patterns),
+        )
+
+        def is_noise(line: bytes) -> bool:
+            matched = False
+
+            def on_match(*_):
+                nonlocal matched
+                matched = True
+                return True  # 첫 매칭에서 스캔 중단
+
+            try:
+                db.scan(line, match_event_handler=on_match)
+            except hyperscan.ScanTerminated:
+                pass
+            return matched
+        return is_noise
+
+    regex = re.compile(b"|".join(patterns), re.IGNORECASE)
+    return lambda line: regex.search(line) is not None
+
+is_noise_line = _build_noise_matcher(NOISE_PATTERNS)
+
+
+def create_x_connector(queue: asyncio.Queue[list[TrendEvent]], client: httpx.AsyncClient) -> BaseFeedConnector:
     """
     X API Bearer Token의 존재 여부에 따라 실제 커넥터 또는 모의 커넥터를 생성하는 팩토리 함수.
     """
     if settings.X_BEARER_TOKEN and settings.X_BEARER_TOKEN.get_secret_value() != "":
         logger.info("X_BEARER_TOKEN found, creating real XConnector.")
-        return XConnector(queue)
+        return XConnector(queue, client)
     else:
         logger.warning("X_BEARER_TOKEN not found. Creating MockFeedConnector for X.")
         return MockFeedConnector(queue, source_name="X")
@@ -59,18 +140,26 @@ class XConnector(BaseFeedConnector):
     X API v2 Filtered Stream에 연결하여 실시간 트윗을 수집합니다.
     """
     API_URL = "https://api.twitter.com/2/tweets/search/stream"
+    RULES_URL = f"{API_URL}/rules"
+    # X는 약 20초마다 하트비트를 보내므로, 이 시간 동안 아무 데이터도 없으면 연결이 끊긴 것으로 봅니다.
+    STREAM_READ_TIMEOUT_SECONDS = 30
+    STREAM_CHUNK_SIZE = 8192
 
-    def __init__(self, queue: asyncio.Queue[TrendEvent]):
+    def __init__(self, queue: asyncio.Queue[list[TrendEvent]], client: httpx.AsyncClient):
         super().__init__(queue, source_name="X")
-        self.client = httpx.AsyncClient(timeout=30.0)
+        # 커넥터별로 커넥션 풀을 만들지 않고 TrendAggregator가 만든 공유 클라이언트를 사용합니다.
+        self.client = client
         self.bearer_token = settings.X_BEARER_TOKEN.get_secret_value()
+        # 토큰은 실행 중 바뀌지 않으므로 인증 헤더를 한 번만 만들어 둡니다.
+        self._headers: Dict[str, str] = {"Authorization": f"Bearer {self.bearer_token}"}
+        self._decoder = msgspec.json.Decoder(TweetMsg)
 
     def _get_headers(self) -> Dict[str, str]:
-        return {"Authorization": f"Bearer {self.bearer_token}"}
+        return self._headers
 
     async def _get_rules(self) -> List[Dict[str, Any]]:
         """현재 설정된 필터링 규칙을 가져옵니다."""
-        response = await self.client.get(f"{self.API_URL}/rules", headers=self._get_headers())
+        response = await self.client.get(self.RULES_URL, headers=self._get_headers())
         response.raise_for_status()
         return response.json().get("data", [])
 
@@ -80,7 +169,7 @@ class XConnector(BaseFeedConnector):
             return
         rule_ids = [rule["id"] for rule in rules]
         payload = {"delete": {"ids": rule_ids}}
-        response = await self.client.post(f"{self.API_URL}/rules", headers=self._get_headers(), json=payload)
+        response = await self.client.post(self.RULES_URL, headers=self._get_headers(), json=payload)
         response.raise_for_status()
         logger.info(f"Deleted {len(rule_ids)} old X stream rules.")
 
@@ -96,7 +185,7 @@ class XConnector(BaseFeedConnector):
             rules.append({"value": f"({rule_value}) lang:en", "tag": symbol})
         
         payload = {"add": rules}
-        response = await self.client.post(f"{self.API_URL}/rules", headers=self._get_headers(), json=payload)
+        response = await self.client.post(self.RULES_URL, headers=self._get_headers(), json=payload)
         response.raise_for_status()
         logger.info(f"Added {len(rules)} new X stream rules.")
 
@@ -123,33 +212,55 @@ class XConnector(BaseFeedConnector):
             "user.fields": "username,name"
         }
         
-        async with self.client.stream("GET", self.API_URL, headers=self._get_headers(), params=params) as response:
+        # 장시간 스트림은 aiohttp로 받습니다. 연결이 끊겨 재연결할 때마다 세션을 새로 엽니다.
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=self.STREAM_READ_TIMEOUT_SECONDS)
+        async with aiohttp.ClientSession(headers=self._get_headers(), timeout=timeout) as session, \
+                session.get(self.API_URL, params=params) as response:
             logger.info("Connected to X Filtered Stream.")
             response.raise_for_status()
-            async for line in response.aiter_lines():
+            # 스트림은 `\r\n`으로 구분된 JSON 라인입니다. 문자열로 디코딩하지 않고
+            # 바이트 그대로 잘라 msgspec 디코더에 넘깁니다.
+            # 버퍼는 bytearray로 두고 처리한 줄만 앞에서 잘라내어, 조각마다 새 bytes를 만들지 않습니다.
+            buffer = bytearray()
+            async for chunk in response.content.iter_chunked(self.STREAM_CHUNK_SIZE):
                 if not self._is_running:
                     break
-                if line.strip(): # 하트비트(빈 줄) 무시
-                    try:
-                        data = json.loads(line)
-                        if "data" in data:
-                            tweet = data["data"]
-                            matching_rules = data.get("matching_rules", [])
-                            symbol = matching_rules[0]["tag"] if matching_rules else None
-
-                            if symbol:
-                                event = TrendEvent(
-                                    source=self.source_name,
-                                    symbol_raw=symbol,
-                                    text=tweet["text"],
-                                    url=f"https://twitter.com/{tweet['author_id']}/status/{tweet['id']}",
-                                    timestamp=now(),
-                                    lang=tweet.get("lang"),
-                                    author=data.get("includes", {}).get("users", [{}])[0].get("username")
-                                )
-                                await self.queue.put(event)
-                        else:
-                            # API 에러 메시지 처리
-                            logger.warning(f"Received non-data message from X stream: {data}")
-                    except json.JSONDecodeError:
-                        logger.warning(f"Could not decode JSON from X stream: {line}")
+                buffer += chunk
+                # 같은 청크로 도착한 트윗들은 수신 시각이 사실상 같으므로 청크당 한 번만 시각을 구합니다.
+                received_at = now()
+                while (newline := buffer.find(b"\r\n")) != -1:
+                    line = bytes(buffer[:newline])
+                    del buffer[:newline + 2]
+                    self._handle_stream_line(line, received_at)
+
+    def _handle_stream_line(self, line: bytes, received_at: datetime):
+        """스트림의 JSON 한 줄을 파싱하여 TrendEvent로 변환합니다."""
+        if line.strip(): # 하트비트(빈 줄) 무시
+            if is_noise_line(line):
+                return
+            try:
+                msg = self._decoder.decode(line)
+            except msgspec.DecodeError:
+                # JSON 형식 오류와 스키마 불일치(ValidationError) 모두 여기서 처리합니다.
+                logger.opt(lazy=True).warning("Could not decode JSON from X stream: {}", lambda: repr(line))
+                return
+
+            tweet = msg.data
+            if tweet is None:
+                # API 에러 메시지 처리 (WARNING이 꺼져 있으면 디코딩하지 않도록 지연 평가)
+                logger.opt(lazy=True).warning("Received non-data message from X stream: {}", lambda: line.decode(errors="replace"))
+                return
+
+            symbol = msg.matching_rules[0].tag if msg.matching_rules else None
+            if symbol:
+                users = msg.includes.users if msg.includes else None
+                event = TrendEvent(
+                    source=self.source_name,
+                    symbol_raw=symbol,
+                    text=tweet.text,
+                    url=f"https://twitter.com/{tweet.author_id}/status/{tweet.id}",
+                    timestamp=received_at,
+                    lang=tweet.lang,
+                    author=users[0].username if users else None
+                )
+                self._emit(event)
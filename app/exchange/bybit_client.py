@@ -23,14 +23,16 @@
 import asyncio
 import hashlib
 import hmac
-import json
+import random
 import time
-import math # Added for ceil/floor
-from typing import Any, Dict, List, Optional
-from decimal import Decimal # Added for precise price_scale calculation
+from functools import lru_cache, partial
+from typing import Any, Awaitable, Callable, ClassVar, Dict, List, Optional, Sequence, Tuple
+from decimal import ROUND_DOWN, Decimal # Added for precise price_scale calculation
 
 import httpx
+import orjson
 import websockets
+from websockets.asyncio.client import connect as ws_connect
 from loguru import logger
 from pydantic import SecretStr
 
@@ -39,9 +41,49 @@ from app.state.store import state_store
 from app.utils.retry import async_retry
 
 class BybitClient:
-    _instrument_info_cache: Dict[str, Any] = {} # Added for caching instrument info
     """Bybit V5 API와 통신하는 비동기 클라이언트"""
 
+    # 요청마다 접근하는 속성들이므로 __dict__ 대신 슬롯에 저장합니다.
+    # 새 인스턴스 속성을 추가할 때는 여기에도 이름을 추가해야 합니다.
+    __slots__ = (
+        "_clock_offset_ms",
+        "_clock_synced_at",
+        "_hmac_template",
+        "_key_window_bytes",
+        "_ob_batch",
+        "_ob_flush_task",
+        "_rl",
+        "_rl_gate",
+        "_topic_handlers",
+        "api_key",
+        "api_secret",
+        "base_url",
+        "client",
+        "testnet",
+        "ws_private_url",
+        "ws_url",
+    )
+
+    # 심볼별 거래 규칙 캐시 (모든 인스턴스가 공유하는 클래스 속성).
+    # 원본 응답(raw)과 함께 주문 수량 보정에 쓰는 값(precision 등)을 미리 파싱해 둡니다.
+    _instrument_info_cache: ClassVar[Dict[str, Dict[str, Any]]] = {}
+
+    # 거래 규칙 캐시를 미리 채울 때 동시에 보낼 최대 요청 수 (REST 요청 한도를 넘지 않도록 제한).
+    INSTRUMENT_WARMUP_CONCURRENCY: ClassVar[int] = 8
+
+    # REST 요청의 X-BAPI-RECV-WINDOW 값 (ms).
+    RECV_WINDOW: ClassVar[str] = "5000"
+
+    # Public WebSocket에서 이 개수만큼 메시지를 처리할 때마다 이벤트 루프에 제어권을 넘깁니다.
+    # 수신 버퍼에 호가 메시지가 쌓여 있으면 recv()가 대기 없이 바로 반환되므로,
+    # 주기적으로 양보하지 않으면 Private(주문) 스트림 처리가 뒤로 밀릴 수 있습니다.
+    PUBLIC_WS_YIELD_EVERY: ClassVar[int] = 32
+
+    # WebSocket 재접속 대기 시간 (지수 백오프, 초).
+    # 정상 종료(1000/1001)는 첫 번째만 대기 없이 바로 재접속하고, 데이터를 받기 전에 다시 정상 종료되면 백오프를 적용합니다.
+    WS_BACKOFF_INITIAL: ClassVar[float] = 0.1
+    WS_BACKOFF_MAX: ClassVar[float] = 30.0
+
     def __init__(self, api_key: SecretStr, api_secret: SecretStr, testnet: bool = True):
         self.testnet = testnet
         self.base_url = "https://api-testnet.bybit.com" if testnet else "https://api.bybit.com"
@@ -50,74 +92,146 @@ class BybitClient:
         
         self.api_key = api_key.get_secret_value()
         self.api_secret = api_secret.get_secret_value()
+        # 키가 적용된(내부/외부 패드 계산이 끝난) HMAC-SHA256 상태를 한 번만 만들어 두고,
+        # 서명할 때마다 복사(copy)하여 페이로드만 추가합니다.
+        self._hmac_template = hmac.new(self.api_secret.encode('utf-8'), b"", hashlib.sha256)
+        # REST 서명 페이로드(timestamp + api_key + recv_window + params) 중 고정된 가운데 부분을 미리 인코딩해 둡니다.
+        self._key_window_bytes = (self.api_key + self.RECV_WINDOW).encode('utf-8')
         
-        self.client = httpx.AsyncClient(base_url=self.base_url, timeout=10.0)
-        self.rate_limit_remaining = 120
-        self.rate_limit_reset_at = time.time() + 60
+        # HTTP/2로 하나의 연결에서 여러 요청을 동시에 보내고, 연결을 오래 유지하여 TLS 핸드셰이크를 줄입니다.
+        # 재시도는 `@async_retry`에서만 처리하도록 전송 계층 재시도는 끕니다.
+        # (transport를 직접 지정하면 클라이언트의 limits/http2 인자는 무시되므로 transport에 설정합니다.)
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            # API 키는 요청마다 바뀌지 않으므로 기본 헤더로 둡니다.
+            headers={"X-BAPI-API-KEY": self.api_key},
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=0,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32, keepalive_expiry=90.0),
+            ),
+        )
+        # Rate limit 상태 (남은 요청 수, 초기화 시각[epoch 초]).
+        # 두 값을 하나의 튜플로 한 번에 읽고 쓰므로, 동시에 실행되는 요청들이 서로 다른 시점의 값을 섞어 읽지 않습니다.
+        self._rl: Tuple[int, float] = (120, time.time() + 60)
+        # Rate limit 대기 게이트. 한 요청만 타이머를 잡고 잠들며, 나머지 요청은 게이트가 열릴 때 함께 깨어납니다.
+        self._rl_gate = asyncio.Event()
+        self._rl_gate.set()
+        # 벽시계(ms)와 이벤트 루프의 단조 시계 사이의 오프셋. `_now_ms()`에서 지연 초기화하고 주기적으로 다시 맞춥니다.
+        self._clock_offset_ms: Optional[int] = None
+        self._clock_synced_at = 0.0
+        # WebSocket 토픽 -> 처리 함수 캐시. 토픽 문자열 파싱(split/startswith)을 토픽당 한 번만 합니다.
+        self._topic_handlers: Dict[str, Callable[[Dict], Awaitable[None]]] = {}
+        # 한 루프 턴 동안 받은 호가 메시지 (심볼 -> 수신 순서대로의 메시지 목록).
+        # `_flush_orderbook_batch`가 다음 턴에 한 번의 락 획득으로 state_store에 반영합니다.
+        self._ob_batch: Dict[str, List[Dict]] = {}
+        self._ob_flush_task: Optional[asyncio.Task] = None
 
         logger.info(f"BybitClient initialized for {'Testnet' if testnet else 'Mainnet'}.")
 
     # --- REST API 관련 메서드 ---
 
+    # 벽시계 오프셋을 다시 맞추는 주기 (초). 그 사이의 시계 오차는 recv_window(5000ms) 안에 충분히 들어옵니다.
+    _CLOCK_RESYNC_SECONDS = 60.0
+
+    def _now_ms(self) -> int:
+        """
+        현재 epoch 시각(ms)을 반환합니다.
+        매번 벽시계를 읽지 않고 이벤트 루프의 단조 시계(`loop.time()`)에 오프셋을 더해 계산하며,
+        `_CLOCK_RESYNC_SECONDS`마다 벽시계와 오프셋을 다시 맞춥니다.
+        """
+        loop_now = asyncio.get_running_loop().time()
+        if self._clock_offset_ms is None or loop_now - self._clock_synced_at >= self._CLOCK_RESYNC_SECONDS:
+            self._clock_offset_ms = int(time.time() * 1000) - int(loop_now * 1000)
+            self._clock_synced_at = loop_now
+        return self._clock_offset_ms + int(loop_now * 1000)
+
     def _generate_signature(self, data_to_sign: str) -> str:
         """Generates the HMAC-SHA256 signature."""
-        return hmac.new(self.api_secret.encode('utf-8'), data_to_sign.encode('utf-8'), hashlib.sha256).hexdigest()
+        h = self._hmac_template.copy()
+        h.update(data_to_sign.encode('utf-8'))
+        return h.hexdigest()
 
-    def _get_auth_headers(self, method: str, params: Optional[Dict] = None, data: Optional[Dict] = None) -> Dict[str, str]:
-        """Generates authentication headers for a request."""
-        timestamp = str(int(time.time() * 1000))
-        recv_window = "5000"
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _sorted_query_string(items: Tuple[Tuple[str, Any], ...]) -> str:
+        """정렬된 (키, 값) 쌍으로 query string을 만듭니다. 같은 파라미터로 반복되는 GET 요청(kline 폴링 등)은 캐시를 재사용합니다."""
+        return "&".join([f"{k}={v}" for k, v in items])
 
-        if method == "GET":
-            # GET 요청 시, query parameter를 알파벳순으로 정렬하여 서명
-            param_str = "&".join([f"{k}={v}" for k, v in sorted(params.items())]) if params else ""
-        else:  # POST
-            # POST 요청 시, request body를 JSON 문자열로 만들어 서명
-            param_str = json.dumps(data, separators=(',', ':')) if data else ""
+    def _query_string(self, params: Dict) -> str:
+        """params를 키 순서로 정렬한 query string. 서명과 실제 요청 URL에 동일한 문자열을 사용합니다."""
+        return self._sorted_query_string(tuple(sorted(params.items())))
 
-        signature_payload = timestamp + self.api_key + recv_window + param_str
-        signature = self._generate_signature(signature_payload)
+    def _get_auth_headers(self, payload: bytes) -> Dict[str, str]:
+        """
+        Generates authentication headers for a request.
+        `payload`는 GET이면 정렬된 query string, POST이면 전송할 JSON 본문 바이트이며 `_request`에서 한 번만 만듭니다.
+        """
+        timestamp = str(self._now_ms())
+
+        # 서명 페이로드를 문자열로 이어 붙이지 않고, 조각별로 HMAC에 바로 넣습니다.
+        h = self._hmac_template.copy()
+        h.update(timestamp.encode('ascii'))
+        h.update(self._key_window_bytes)
+        h.update(payload)
+        signature = h.hexdigest()
 
+        # X-BAPI-API-KEY는 클라이언트 기본 헤더로 설정되어 있습니다.
         headers = {
-            "X-BAPI-API-KEY": self.api_key,
             "X-BAPI-TIMESTAMP": timestamp,
             "X-BAPI-SIGN": signature,
-            "X-BAPI-RECV-WINDOW": recv_window,
+            "X-BAPI-RECV-WINDOW": self.RECV_WINDOW,
         }
-        if method == "POST":
-            headers["Content-Type"] = "application/json"
         return headers
 
     @async_retry(attempts=3, delay=2)
     async def _request(self, method: str, endpoint: str, params: Optional[Dict] = None, data: Optional[Dict] = None) -> Dict:
-        print(f"_request called with endpoint: {endpoint}")  # Debug print
+        # 모든 REST 호출 경로이므로 동기 print 대신 TRACE 로그를 사용합니다. (자리표시자로 비활성 시 포맷팅 생략)
+        logger.trace("_request called with endpoint: {}", endpoint)
 
         # Rate limit 확인
-        if self.rate_limit_remaining < 5:
-            sleep_time = self.rate_limit_reset_at - time.time()
+        await self._rl_gate.wait()
+        remaining, reset_at = self._rl
+        if remaining < 5 and self._rl_gate.is_set():
+            sleep_time = reset_at - self._now_ms() / 1000
             if sleep_time > 0:
                 logger.warning(f"Rate limit approaching. Sleeping for {sleep_time:.2f} seconds.")
-                await asyncio.sleep(sleep_time)
+                self._rl_gate.clear()
+                try:
+                    await asyncio.sleep(sleep_time)
+                finally:
+                    self._rl_gate.set()
+
+        # 서명과 실제 요청에 똑같이 쓰이는 문자열을 한 번만 만듭니다.
+        # - GET: 알파벳순으로 정렬한 query string
+        # - POST: orjson으로 한 번 직렬화한 압축 JSON 본문 바이트 (서명한 바이트 그대로 전송)
+        query = self._query_string(params) if method == "GET" and params else ""
+        body = orjson.dumps(data) if method != "GET" and data else b""
 
         # private 엔드포인트 체크 및 헤더 생성
         is_private = any(k in endpoint for k in ["/v5/order", "/v5/position", "/v5/account"])
-        headers = self._get_auth_headers(method, params=params, data=data) if is_private else {}
+        headers = self._get_auth_headers(query.encode('utf-8') if method == "GET" else body) if is_private else {}
+        if body:
+            headers["Content-Type"] = "application/json"
 
         try:
             url = self.base_url + endpoint
             # httpx는 GET 요청 시 params 딕셔너리의 순서를 보장하지 않으므로, 직접 query string을 만들어 전달
-            if method == "GET" and params:
-                sorted_params = "&".join([f"{k}={v}" for k, v in sorted(params.items())])
-                url = f"{self.base_url}{endpoint}?{sorted_params}"
-                response = await self.client.request(method, url, json=data, headers=headers)
+            if query:
+                response = await self.client.request(method, f"{url}?{query}", headers=headers)
             else:
-                response = await self.client.request(method, url, params=params, json=data, headers=headers)
-
-            # Rate limit 업데이트
-            if 'X-Bapi-Limit-Status' in response.headers:
-                self.rate_limit_remaining = int(response.headers['X-Bapi-Limit-Status'])
-            if 'X-Bapi-Limit-Reset-Timestamp' in response.headers:
-                self.rate_limit_reset_at = int(response.headers['X-Bapi-Limit-Reset-Timestamp']) / 1000
+                response = await self.client.request(method, url, params=params, content=body or None, headers=headers)
+
+            # Rate limit 업데이트 (두 값을 한 번에 교체)
+            limit_status = response.headers.get('X-Bapi-Limit-Status')
+            limit_reset = response.headers.get('X-Bapi-Limit-Reset-Timestamp')
+            if limit_status is not None or limit_reset is not None:
+                remaining, reset_at = self._rl
+                self._rl = (
+                    int(limit_status) if limit_status is not None else remaining,
+                    int(limit_reset) / 1000 if limit_reset is not None else reset_at,
+                )
 
             response.raise_for_status()
             response_data = response.json()
@@ -140,9 +254,9 @@ class BybitClient:
     async def get_kline(self, symbol: str, interval: str, limit: int = 200) -> List[Dict]:
         """K-line (캔들) 데이터를 가져옵니다."""
         params = {"category": "spot", "symbol": symbol, "interval": interval, "limit": limit}
-        logger.debug(f"Requesting kline with params: {params}")
+        logger.debug("Requesting kline with params: {}", params)
         data = await self._request("GET", "/v5/market/kline", params=params)
-        logger.debug(f"Received raw kline response for {symbol}: {data}")
+        logger.debug("Received raw kline response for {}: {}", symbol, data)
         return data.get("result", {}).get("list", [])
 
     async def get_instruments_info(self, category: str = 'spot') -> List[Dict]:
@@ -151,11 +265,15 @@ class BybitClient:
         data = await self._request("GET", "/v5/market/instruments-info", params=params)
         return data.get("result", {}).get("list", [])
 
+    async def get_tickers(self, category: str = 'spot') -> List[Dict]:
+        """특정 카테고리의 모든 심볼 티커(24시간 거래량/고가/저가 등)를 한 번에 가져옵니다."""
+        data = await self._request("GET", "/v5/market/tickers", params={"category": category})
+        return data.get("result", {}).get("list", [])
+
     async def get_wallet_balance(self, **params):
         """
         Bybit API v5의 지갑 잔고 엔드포인트를 호출하여 전체 응답을 반환합니다.
         """
-        print(params);
         # 이 함수는 API의 응답 딕셔너리 전체를 그대로 반환해야 합니다.
         return await self._request(
             endpoint="/v5/account/wallet-balance",
@@ -195,9 +313,51 @@ class BybitClient:
             logger.error(f"[{symbol}] 최신 가격 조회 중 오류 발생: {e}")
             return 0.0
 
-    async def _get_instrument_info(self, symbol: str) -> dict:
+    @staticmethod
+    def _parse_instrument_info(instrument_info: dict) -> Dict[str, Any]:
+        """
+        거래 규칙 원본에서 수량 보정에 필요한 값을 미리 계산합니다.
+        반환값: `raw`(원본), `precision`(수량 소수점 자릿수),
+        `min_qty`/`min_qty_str`(최소 주문 수량), `qty_step`/`qty_step_str`(수량 단위, `Decimal`)
         """
-        심볼의 거래 규칙 (tickSize, minPrice 등)을 조회하고 캐시합니다.
+        lot_size_filter = instrument_info.get('lotSizeFilter', {})
+        min_order_qty_str = lot_size_filter.get('minOrderQty', '0')
+        qty_step_str = lot_size_filter.get('qtyStep', '0')
+
+        # 정밀도(소수점 자릿수) 결정
+        precision = 0
+        # qtyStep이 유효한 소수일 경우, 해당 값의 소수점 자릿수 사용
+        if '.' in qty_step_str and float(qty_step_str) > 0:
+            precision = len(qty_step_str.split('.')[1])
+        # 그렇지 않으면, minOrderQty가 유효한 소수일 경우 사용
+        elif '.' in min_order_qty_str and float(min_order_qty_str) > 0:
+            precision = len(min_order_qty_str.split('.')[1])
+
+        # 수량 내림에 사용할 단위. qtyStep이 없으면 위에서 정한 자릿수(10**-precision)를 단위로 씁니다.
+        qty_step = Decimal(qty_step_str)
+        if qty_step <= 0:
+            qty_step = Decimal(1).scaleb(-precision)
+
+        return {
+            "raw": instrument_info,
+            "precision": precision,
+            "min_qty": Decimal(min_order_qty_str),
+            "min_qty_str": min_order_qty_str,
+            "qty_step": qty_step,
+            "qty_step_str": qty_step_str,
+        }
+
+    @staticmethod
+    def _quantize_qty(qty: float, qty_step: Decimal) -> Decimal:
+        """
+        주문 수량을 `qty_step` 단위로 내림합니다.
+        부동소수점 오차(e.g. 0.1*10 != 1) 없이 계산하도록 `qty`를 `str()`을 거쳐 `Decimal`로 바꿉니다.
+        """
+        return (Decimal(str(qty)) / qty_step).to_integral_value(rounding=ROUND_DOWN) * qty_step
+
+    async def _get_instrument_info(self, symbol: str) -> Dict[str, Any]:
+        """
+        심볼의 거래 규칙 (tickSize, minPrice 등)을 조회하고, 파싱한 결과(`_parse_instrument_info`)를 캐시합니다.
         """
         if symbol in self._instrument_info_cache:
             return self._instrument_info_cache[symbol]
@@ -206,7 +366,7 @@ class BybitClient:
             response = await self._request("GET", "/v5/market/instruments-info", params={"category": "spot", "symbol": symbol})
             data = response.get('result', {}).get('list', [])
             if data:
-                instrument_info = data[0]
+                instrument_info = self._parse_instrument_info(data[0])
                 self._instrument_info_cache[symbol] = instrument_info
                 return instrument_info
             else:
@@ -216,6 +376,23 @@ class BybitClient:
             logger.error(f"[{symbol}] 거래 규칙 조회 중 오류 발생: {e}")
             return {}
 
+    async def warm_instrument_cache(self, symbols: Sequence[str]) -> None:
+        """
+        유니버스 심볼들의 거래 규칙을 미리 조회하여 캐시해 둡니다.
+        첫 매도 주문 시 거래 규칙 조회(GET) 왕복 없이 주문(POST) 한 번으로 처리되도록 합니다.
+        """
+        semaphore = asyncio.Semaphore(self.INSTRUMENT_WARMUP_CONCURRENCY)
+
+        async def _fetch(symbol: str) -> None:
+            async with semaphore:
+                await self._get_instrument_info(symbol)
+
+        # 이미 캐시된 심볼은 건너뜁니다. 조회 실패는 `_get_instrument_info`에서 로그만 남기므로
+        # 해당 심볼은 주문 시점에 다시 조회됩니다.
+        missing = [s for s in symbols if s not in self._instrument_info_cache]
+        await asyncio.gather(*(_fetch(s) for s in missing))
+        logger.info("Warmed instrument info cache for {} symbols.", len(missing))
+
     async def place_market_order(self, symbol: str, side: Side, qty: float, notional: float = 0) -> Dict:
         """
         현물 시장가 주문을 제출합니다.
@@ -243,37 +420,17 @@ class BybitClient:
                 logger.error(f"[{symbol}] Instrument info not found. Cannot place order.")
                 return {}
 
-            lot_size_filter = instrument_info.get('lotSizeFilter', {})
-            min_order_qty_str = lot_size_filter.get('minOrderQty', '0')
-            qty_step_str = lot_size_filter.get('qtyStep', '0')
-            
-            logger.debug(f"[{symbol}] Adjusting qty. Original: {qty}, Step: {qty_step_str}, MinQty: {min_order_qty_str}")
+            qty_step = instrument_info["qty_step"]
 
-            try:
-                # 1. 정밀도(소수점 자릿수) 결정
-                precision = 0
-                # qtyStep이 유효한 소수일 경우, 해당 값의 소수점 자릿수 사용
-                if '.' in qty_step_str and float(qty_step_str) > 0:
-                    precision = len(qty_step_str.split('.')[1])
-                # 그렇지 않으면, minOrderQty가 유효한 소수일 경우 사용
-                elif '.' in min_order_qty_str and float(min_order_qty_str) > 0:
-                    precision = len(min_order_qty_str.split('.')[1])
-                
-                # 2. 결정된 정밀도를 사용하여 수량 내림 처리
-                factor = 10 ** precision
-                adjusted_qty = math.floor(qty * factor) / factor
-                
-                # 3. 최종 문자열 포맷팅
-                qty_str = f"{adjusted_qty:.{precision}f}"
+            logger.debug("[{}] Adjusting qty. Original: {}, Step: {}, MinQty: {}", symbol, qty, instrument_info['qty_step_str'], instrument_info['min_qty_str'])
 
-            except Exception as e:
-                logger.error(f"CRITICAL: Could not adjust quantity for {symbol}. Error: {e}. Aborting order.")
-                return {}
+            adjusted_qty = self._quantize_qty(qty, qty_step)
+            qty_str = format(adjusted_qty, 'f')
 
             logger.info(f"Original sell qty: {qty}, Adjusted sell qty: {qty_str} for symbol {symbol}")
 
-            if float(qty_str) < float(min_order_qty_str):
-                logger.warning(f"[{symbol}] Adjusted qty ({qty_str}) is below min order qty ({min_order_qty_str}). Skipping trade.")
+            if adjusted_qty < instrument_info["min_qty"]:
+                logger.warning(f"[{symbol}] Adjusted qty ({qty_str}) is below min order qty ({instrument_info['min_qty_str']}). Skipping trade.")
                 return {}
             
             order_data["qty"] = qty_str
@@ -298,61 +455,135 @@ class BybitClient:
 
     # --- WebSocket 관련 메서드 ---
 
-    async def _ws_handler(self, url: str, subscriptions: List[str], is_private: bool):
-        """WebSocket 연결 및 데이터 처리를 위한 내부 핸들러"""
+    @staticmethod
+    def _build_subscribe_frames(subscriptions: List[str], chunk_size: int = 10) -> List[bytes]:
+        """구독 토픽을 10개 이하씩 나누어 subscribe 프레임(JSON 바이트)으로 미리 인코딩합니다."""
+        return [
+            orjson.dumps({"op": "subscribe", "args": subscriptions[i:i + chunk_size]})
+            for i in range(0, len(subscriptions), chunk_size)
+        ]
+
+    async def _ws_handler(self, url: str, subscribe_frames: List[bytes], is_private: bool):
+        """
+        WebSocket 연결 및 데이터 처리를 위한 내부 핸들러.
+        `subscribe_frames`는 `run_websockets`에서 한 번만 인코딩해 두고, 재접속할 때마다 그대로 다시 보냅니다.
+        """
+        backoff = self.WS_BACKOFF_INITIAL
+        # 데이터를 받지 못한 채 연속으로 정상 종료된 횟수
+        normal_closes = 0
         while True:
             try:
-                async with websockets.connect(url) as ws:
+                # 메시지가 작은 JSON이므로 per-message deflate 압축은 끕니다.
+                async with ws_connect(url, compression=None, max_size=2**21) as ws:
                     logger.info(f"WebSocket connected to {url}")
                     if is_private:
                         # Private 채널 인증
                         expires = int((time.time() + 10) * 1000)
-                        signature = hmac.new(self.api_secret.encode('utf-8'), f"GET/realtime{expires}".encode('utf-8'), hashlib.sha256).hexdigest()
-                        await ws.send(json.dumps({"op": "auth", "args": [self.api_key, expires, signature]}))
+                        signature = self._generate_signature(f"GET/realtime{expires}")
+                        await ws.send(orjson.dumps({"op": "auth", "args": [self.api_key, expires, signature]}), text=True)
                     
-                    # Split subscriptions into chunks of 10 or less
-                    chunk_size = 10
-                    for i in range(0, len(subscriptions), chunk_size):
-                        chunk = subscriptions[i:i + chunk_size]
-                        await ws.send(json.dumps({"op": "subscribe", "args": chunk}))
-                        logger.debug(f"Sent subscription request for chunk: {chunk}")
+                    for frame in subscribe_frames:
+                        # Bybit는 텍스트 프레임을 기대하므로, bytes를 디코딩하지 않고 text=True로 텍스트 프레임으로 보냅니다.
+                        await ws.send(frame, text=True)
+                    logger.debug(f"Sent {len(subscribe_frames)} subscription frames to {url}.")
 
+                    processed = 0
                     while True:
-                        message = await ws.recv()
-                        data = json.loads(message)
+                        # 텍스트 프레임을 str로 디코딩하지 않고 bytes 그대로 받아 orjson에 넘깁니다.
+                        message = await ws.recv(decode=False)
+                        data = orjson.loads(message)
                         
                         if "op" in data and data["op"] == "subscribe":
                             logger.info(f"Subscribed to {data.get('args', 'N/A')}: Success={data.get('success')}")
                         elif "topic" in data:
                             await self._process_ws_message(data)
+                            # 데이터를 정상적으로 받기 시작했으므로 백오프를 초기화합니다.
+                            backoff = self.WS_BACKOFF_INITIAL
+                            normal_closes = 0
                         else:
-                            logger.debug(f"Received WS message: {data}")
+                            logger.debug("Received WS message: {}", data)
+
+                        if not is_private:
+                            processed += 1
+                            if processed >= self.PUBLIC_WS_YIELD_EVERY:
+                                processed = 0
+                                await asyncio.sleep(0)
 
             except websockets.exceptions.ConnectionClosed as e:
-                logger.warning(f"WebSocket connection closed to {url}. Reconnecting in 5 seconds... Error: {e}")
+                # 서버 측 연결 교체 등 정상 종료는 데이터 공백을 줄이기 위해 바로 재접속합니다.
+                # 단, 접속 직후 정상 종료가 반복되면 재접속이 빈 루프가 되지 않도록 백오프를 적용합니다.
+                if e.rcvd is not None and e.rcvd.code in (1000, 1001):
+                    normal_closes += 1
+                    if normal_closes == 1:
+                        logger.info(f"WebSocket connection to {url} closed normally ({e.rcvd.code}). Reconnecting immediately.")
+                        continue
+                    logger.warning(f"WebSocket connection to {url} closed normally {normal_closes} times in a row. Reconnecting in ~{backoff:.1f} seconds...")
+                else:
+                    logger.warning(f"WebSocket connection closed to {url}. Reconnecting in ~{backoff:.1f} seconds... Error: {e}")
             except Exception as e:
                 logger.error(f"Error in WebSocket handler for {url}: {e}", exc_info=True)
-            
-            await asyncio.sleep(5) # 재접속 전 대기
+
+            # 재접속 전 대기 (지터를 준 지수 백오프)
+            await asyncio.sleep(backoff * (0.5 + random.random()))
+            backoff = min(backoff * 2, self.WS_BACKOFF_MAX)
 
     async def _process_ws_message(self, data: Dict):
         """수신된 WebSocket 메시지를 처리하고 state_store를 업데이트합니다."""
         topic = data.get("topic", "")
-        
+        handler = self._topic_handlers.get(topic)
+        if handler is None:
+            handler = self._topic_handlers[topic] = self._resolve_topic_handler(topic)
+        await handler(data)
+
+    def _resolve_topic_handler(self, topic: str) -> Callable[[Dict], Awaitable[None]]:
+        """토픽 문자열을 해석하여 해당 메시지를 처리할 함수를 반환합니다."""
         # 예: 오더북 데이터 처리
         if topic.startswith("orderbook.50"):  # 50-level orderbook
             symbol = topic.split('.')[-1]
             # data['data'] 대신 전체 data 객체를 전달하여 type, s, b, a 등의 정보를 모두 활용하도록 변경
-            await state_store.update_orderbook(symbol, data)
-            # logger.debug(f"Updated orderbook for {symbol}")
+            return partial(self._queue_orderbook_update, symbol)
 
         # 예: 개인 주문 업데이트 처리
-        elif topic == "order":
-            for order_data in data.get("data", []):
-                await state_store.update_order(order_data)
-                logger.info(f"Order update: {order_data}")
-        
+        if topic == "order":
+            return self._handle_order_message
+
+        # 지갑(잔고) 업데이트 처리
+        if topic == "wallet":
+            return self._handle_wallet_message
+
         # 다른 토픽(trade, tickers, execution 등)에 대한 처리 로직 추가 가능
+        return self._ignore_ws_message
+
+    async def _queue_orderbook_update(self, symbol: str, data: Dict):
+        """호가 메시지를 배치에 모으고, 다음 루프 턴에 한 번에 반영하도록 플러시를 예약합니다."""
+        if data.get('type') == 'snapshot':
+            # 스냅샷은 이전 메시지를 모두 덮어쓰므로, 같은 심볼의 대기 중인 델타는 버립니다.
+            self._ob_batch[symbol] = [data]
+        else:
+            self._ob_batch.setdefault(symbol, []).append(data)
+
+        if self._ob_flush_task is None:
+            self._ob_flush_task = asyncio.create_task(self._flush_orderbook_batch())
+
+    async def _flush_orderbook_batch(self):
+        """모아 둔 호가 메시지를 state_store에 한 번에 반영합니다."""
+        batch, self._ob_batch = self._ob_batch, {}
+        self._ob_flush_task = None
+        try:
+            await state_store.bulk_update_orderbooks(batch)
+        except Exception as e:
+            logger.error(f"Failed to apply orderbook batch: {e}", exc_info=True)
+
+    async def _handle_order_message(self, data: Dict):
+        for order_data in data.get("data", []):
+            await state_store.update_order(order_data)
+            logger.info(f"Order update: {order_data}")
+
+    async def _handle_wallet_message(self, data: Dict):
+        await state_store.apply_wallet_update(data.get("data", []))
+
+    async def _ignore_ws_message(self, data: Dict):
+        return None
 
     async def run_websockets(self):
         """Public 및 Private WebSocket 연결을 모두 실행합니다."""
@@ -361,10 +592,23 @@ class BybitClient:
         public_subs = [f"orderbook.50.{symbol}" for symbol in symbols]
         public_subs += [f"publicTrade.{symbol}" for symbol in symbols]
         
-        # Private 채널 구독 (주문, 체결) - position 제거
-        private_subs = ["order", "execution"]
-
-        public_task = asyncio.create_task(self._ws_handler(self.ws_url, public_subs, is_private=False))
-        private_task = asyncio.create_task(self._ws_handler(self.ws_private_url, private_subs, is_private=True))
-
-        await asyncio.gather(public_task, private_task)
+        # Private 채널 구독 (주문, 체결, 지갑) - position 제거
+        # 지갑(wallet) 토픽으로 잔고/손익을 실시간 반영하고, REST 잔고 조회는 드문 보정용으로만 사용합니다.
+        private_subs = ["order", "execution", "wallet"]
+
+        # 구독할 토픽은 미리 알고 있으므로 처리 함수 테이블을 연결 전에 한 번에 채워 둡니다.
+        # 메시지 처리 시에는 dict 조회 한 번으로 처리 함수를 찾습니다.
+        for topic in public_subs + private_subs:
+            self._topic_handlers[topic] = self._resolve_topic_handler(topic)
+
+        # 구독 프레임은 고정이므로 한 번만 인코딩하여 재접속 시 재사용합니다.
+        public_frames = self._build_subscribe_frames(public_subs)
+        private_frames = self._build_subscribe_frames(private_subs)
+
+        # TaskGroup으로 묶어, 이 태스크가 취소되거나 하위 태스크 하나가 실패하면 나머지도 함께 정리되도록 합니다.
+        async with asyncio.TaskGroup() as tg:
+            # Private(주문) 스트림을 먼저 시작합니다.
+            tg.create_task(self._ws_handler(self.ws_private_url, private_frames, is_private=True))
+            tg.create_task(self._ws_handler(self.ws_url, public_frames, is_private=False))
+            # 거래 규칙 캐시는 WebSocket 연결을 지연시키지 않도록 백그라운드에서 함께 채웁니다.
+            tg.create_task(self.warm_instrument_cache(symbols))
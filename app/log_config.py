@@ -12,6 +12,7 @@
 #   - **포맷 커스터마이징**: 로그 메시지에 시간, 레벨, 모듈, 함수, 라인 번호 등 상세 정보를 포함합니다.
 #   - **파일 로테이션**: 로그 파일이 너무 커지는 것을 방지하기 위해 파일 크기나 시간에 따라 자동으로 새 파일을 생성합니다. (예: `rotation="10 MB"`)
 #   - **JSON 로깅**: `LOG_JSON_FORMAT=True`로 설정 시, 구조화된 로깅(JSON)을 활성화하여 로그 분석 시스템(예: ELK, Datadog)과의 연동을 용이하게 합니다.
+#     loguru 기본 직렬화(`serialize=True`, 표준 json) 대신 필요한 필드만 orjson으로 한 줄씩 인코딩합니다.
 #   - **예외 추적**: 예외 발생 시 스택 트레이스를 자동으로 포함하여 디버깅을 돕습니다.
 #
 #   **사용법:**
@@ -20,10 +21,34 @@
 #
 #
 import sys
+import traceback
 from pathlib import Path
+
+import orjson
 from loguru import logger
 from app.config import settings
 
+_TEXT_FILE_FORMAT = "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}"
+
+def _json_file_format(record) -> str:
+    """
+    파일 싱크용 포맷 함수. 레코드의 주요 필드를 orjson으로 한 줄의 JSON으로 인코딩하여 `extra`에 넣고,
+    loguru가 그 문자열만 그대로 쓰도록 템플릿을 반환합니다. (파일 로테이션/압축은 loguru 파일 싱크가 계속 담당)
+    """
+    payload = {
+        "t": record["time"].timestamp(),
+        "l": record["level"].name,
+        "m": record["message"],
+        "n": record["name"],
+        "f": record["function"],
+        "ln": record["line"],
+    }
+    if record["exception"] is not None:
+        exc_type, exc_value, exc_tb = record["exception"]
+        payload["exc"] = "".join(traceback.format_exception(exc_type, exc_value, exc_tb))
+    record["extra"]["_json"] = orjson.dumps(payload, default=str).decode()
+    return "{extra[_json]}\n"
+
 def configure_logging():
     """
     Loguru를 사용하여 애플리케이션의 로거를 설정합니다.
@@ -58,11 +83,11 @@ def configure_logging():
         logger.add(
             log_file,
             level=settings.LOG_LEVEL.upper(),
-            format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}",
+            # LOG_JSON_FORMAT=True일 경우 orjson으로 인코딩한 JSON 한 줄씩 저장
+            format=_json_file_format if settings.LOG_JSON_FORMAT else _TEXT_FILE_FORMAT,
             rotation="10 MB",  # 파일 크기가 10MB에 도달하면 새 파일 생성
             retention="7 days", # 최대 7일간의 로그 파일 보관
             compression="zip", # 오래된 로그 파일은 zip으로 압축
-            serialize=settings.LOG_JSON_FORMAT, # True일 경우 JSON 형식으로 저장
             enqueue=True,      # 비동기 및 다중 프로세스 환경에서 안전하게 로깅
             backtrace=True,    # 예외 발생 시 전체 스택 트레이스 기록
             diagnose=True,     # 예외 진단 정보 추가
@@ -29,10 +29,13 @@
 import asyncio
 import logging
 from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import Any, Coroutine
 
 from fastapi import FastAPI, Request, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import ORJSONResponse
+from loguru import logger
 from prometheus_fastapi_instrumentator import Instrumentator
 
 from app.api import (routes_auth, routes_control, routes_orders, routes_public,
@@ -45,21 +48,51 @@ from app.state.store import state_store
 from app.strategy.router import StrategyRouter
 from app.trend.aggregator import TrendAggregator
 from app.ws.manager import WebSocketManager
-from app.utils.time import get_seconds_until_next_day_utc
+from app.utils.time import get_next_midnight_utc, now
 
 # --------------------------------------------------------------------------
 # 백그라운드 태스크 (Background Tasks)
 # --------------------------------------------------------------------------
+# REST 지갑 잔고 보정 주기 (초). 평상시 잔고 갱신은 private WS `wallet` 토픽이 담당합니다.
+WALLET_RECONCILE_INTERVAL_SECONDS = 60
+
+# 종료 시 백그라운드 태스크의 취소 완료를 기다리는 최대 시간 (초).
+SHUTDOWN_TIMEOUT_SECONDS = 5
+
+# 한 번에 잠드는 최대 시간 (초). 절전/재개나 시계 보정이 있어도 이 주기마다 벽시계 기준으로 남은 시간을 다시 계산합니다.
+DAILY_RESET_MAX_SLEEP_SECONDS = 600
+
+def _log_background_task_exit(task: asyncio.Task):
+    """백그라운드 태스크가 종료 시점이 아닌데 끝나거나 예외로 죽으면 바로 로그를 남깁니다."""
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.opt(exception=exc).critical(f"Background task {task.get_name()} crashed.")
+    else:
+        logger.warning(f"Background task {task.get_name()} exited unexpectedly.")
+
+def start_background_task(name: str, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+    """
+    이름을 붙여 백그라운드 태스크를 시작하고, 예기치 않은 종료를 로그로 알리는 콜백을 등록합니다.
+    반환된 태스크는 `app.state`에 보관하여 종료 시 취소합니다.
+    """
+    task = asyncio.create_task(coro, name=name)
+    task.add_done_callback(_log_background_task_exit)
+    return task
+
 async def daily_reset_task(bybit_client: BybitClient):
     """매일 자정(UTC)에 일일 상태를 리셋하는 백그라운드 태스크"""
     while True:
-        seconds_until_midnight = get_seconds_until_next_day_utc()
-        logger.info(f"Daily reset task sleeping for {seconds_until_midnight / 3600:.2f} hours until next UTC midnight.")
-        await asyncio.sleep(seconds_until_midnight + 5) # 자정이 지난 후 5초 더 대기
+        # 상대 시간이 아닌 절대 시각(자정 + 5초)을 목표로 잡아, 대기가 길어져도 오차가 누적되지 않게 합니다.
+        target = get_next_midnight_utc() + timedelta(seconds=5) # 자정이 지난 후 5초 더 대기
+        logger.info(f"Daily reset task sleeping for {(target - now()).total_seconds() / 3600:.2f} hours until next UTC midnight.")
+        while (remaining := (target - now()).total_seconds()) > 0:
+            await asyncio.sleep(min(remaining, DAILY_RESET_MAX_SLEEP_SECONDS))
         
         # 리셋 직전의 최신 자산 정보를 가져옴
         await state_store.update_wallet_balance(bybit_client)
-        current_equity = state_store.get_system_state().total_equity
+        current_equity = state_store.get_total_equity()
         
         # 새로운 시작 자산으로 리셋
         await state_store.reset_daily_state(current_equity)
@@ -81,6 +114,8 @@ async def lifespan(app: FastAPI):
     # --- Startup ---
     print("Initializing application components...")
     configure_logging()
+    # uvloop 적용 여부 확인용 (uvicorn --loop uvloop / loop="auto"로 선택된 루프).
+    logger.info("Running on event loop: {}", type(asyncio.get_running_loop()).__module__)
     await db.connect()
     
     bybit_client = BybitClient(
@@ -106,16 +141,20 @@ async def lifespan(app: FastAPI):
 
     # 시작 시점의 자산 가치를 초기화
     await state_store.update_wallet_balance(bybit_client)
-    initial_equity = state_store.get_system_state().total_equity
+    initial_equity = state_store.get_total_equity()
     await state_store.set_initial_equity(initial_equity)
 
     # 백그라운드 태스크 시작
-    app.state.bybit_ws_task = asyncio.create_task(bybit_client.run_websockets())
-    # app.state.trend_task = asyncio.create_task(trend_aggregator.run_connectors()) # 비활성화
-    app.state.ws_broadcast_task = asyncio.create_task(ws_manager.broadcast_loop())
-    app.state.wallet_balance_task = asyncio.create_task(state_store.update_wallet_balance_loop(bybit_client))
-    app.state.order_history_task = asyncio.create_task(state_store.update_order_history_loop(bybit_client))
-    app.state.daily_reset_task = asyncio.create_task(daily_reset_task(bybit_client))
+    app.state.bybit_ws_task = start_background_task("bybit_ws", bybit_client.run_websockets())
+    # app.state.trend_task = start_background_task("trend", trend_aggregator.run_connectors()) # 비활성화
+    app.state.ws_broadcast_task = start_background_task("ws_broadcast", ws_manager.broadcast_loop())
+    # 잔고는 private WS `wallet` 토픽으로 실시간 반영되므로, REST 폴링은 누락/오차 보정용으로 60초마다만 수행합니다.
+    app.state.wallet_balance_task = start_background_task(
+        "wallet_balance",
+        state_store.update_wallet_balance_loop(bybit_client, interval_seconds=WALLET_RECONCILE_INTERVAL_SECONDS),
+    )
+    app.state.order_history_task = start_background_task("order_history", state_store.update_order_history_loop(bybit_client))
+    app.state.daily_reset_task = start_background_task("daily_reset", daily_reset_task(bybit_client))
 
     print("Application startup complete.")
     
@@ -126,13 +165,25 @@ async def lifespan(app: FastAPI):
     
     await app.state.strategy_router.stop()
     tasks = [
-        app.state.ws_broadcast_task, app.state.trend_task, app.state.bybit_ws_task,
-        app.state.wallet_balance_task, app.state.order_history_task, app.state.daily_reset_task
+        app.state.ws_broadcast_task, # app.state.trend_task, # 비활성화
+        app.state.bybit_ws_task, app.state.wallet_balance_task,
+        app.state.order_history_task, app.state.daily_reset_task
     ]
+    # 이미 끝난 태스크는 `_log_background_task_exit`가 로그를 남겼으므로 다시 보고하지 않습니다.
+    # 아직 실행 중인 태스크는 콜백을 떼어 내고 취소하여, 종료 중 예외는 아래에서 한 번만 로그로 남깁니다.
+    tasks = [task for task in tasks if not task.done()]
     for task in tasks:
+        task.remove_done_callback(_log_background_task_exit)
         task.cancel()
-    await asyncio.gather(*tasks, return_exceptions=True)
+    # 취소 완료를 제한 시간까지만 기다리고, 취소가 아닌 예외로 끝난 태스크는 삼키지 않고 로그로 남깁니다.
+    done, pending = await asyncio.wait(tasks, timeout=SHUTDOWN_TIMEOUT_SECONDS) if tasks else (set(), set())
+    for task in done:
+        if not task.cancelled() and task.exception() is not None:
+            logger.opt(exception=task.exception()).error(f"Background task {task.get_name()} failed during shutdown.")
+    for task in pending:
+        logger.warning(f"Background task {task.get_name()} did not finish within {SHUTDOWN_TIMEOUT_SECONDS}s of cancellation.")
 
+    # await app.state.trend_aggregator.close() # 비활성화
     await bybit_client.close()
     await db.disconnect()
     print("Application shutdown complete.")
@@ -195,14 +246,22 @@ async def read_root():
 # --------------------------------------------------------------------------
 # Uvicorn으로 실행하기 위한 설정 (if __name__ == "__main__")
 # --------------------------------------------------------------------------
-# 이 파일을 직접 실행할 경우 Uvicorn 개발 서버를 구동합니다.
-# 프로덕션 환경에서는 Gunicorn + Uvicorn 워커를 사용하는 것이 일반적입니다.
+# 이 파일을 직접 실행할 경우 Uvicorn 서버를 구동합니다. (자동 재시작은 .env의 DEV_RELOAD=true일 때만)
+# 프로덕션 환경에서는 Dockerfile의 uvicorn 명령(단일 워커, uvloop + httptools)을 사용합니다.
+# 봇 상태(state_store)와 Bybit WebSocket/전략 태스크가 프로세스 안에 있으므로 워커를 여러 개 띄우면 안 됩니다.
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True, # 개발 중 코드 변경 시 자동 재시작
+        reload=settings.DEV_RELOAD, # 개발 중 코드 변경 시 자동 재시작 (감시 프로세스를 추가로 띄우므로 기본값은 꺼짐)
+        # uvloop이 설치되어 있으면 사용하고, 없으면(예: Windows) 기본 asyncio 루프로 대체합니다.
+        loop="auto",
+        http="auto", # httptools가 설치되어 있으면(uvicorn[standard]) httptools 파서를 사용합니다.
+        # 대시보드 WebSocket 프레임(반복되는 키가 많은 SystemState JSON)을 permessage-deflate로 압축합니다.
+        # 클라이언트가 확장을 협상하지 않으면 압축 없이 동작합니다.
+        ws="websockets",
+        ws_per_message_deflate=True,
         log_level="info"
     )
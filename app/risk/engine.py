@@ -9,8 +9,9 @@
 #
 #
 import asyncio
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
+import orjson
 from loguru import logger
 
 from app.config import settings
@@ -24,41 +25,81 @@ from app.exchange.bybit_client import BybitClient
 class RiskEngine:
     """거래 리스크를 관리하고 검증하는 엔진"""
 
+    # 시작 시 유동성 체크용 kline을 동시에 조회할 최대 요청 수 (REST 요청 한도를 넘지 않도록 제한).
+    KLINE_FETCH_CONCURRENCY = 10
+
     def __init__(self, bybit_client: BybitClient):
         self.bybit_client = bybit_client
         self.config = self._load_config_from_settings()
         self.instrument_info: Dict[str, Dict] = {}
         self.universe: List[str] = []
+        # 설정/유니버스가 바뀔 때마다 증가하는 버전. 공개 API의 ETag와 직렬화 캐시 키로 사용합니다.
+        self.config_version: int = 0
+        self.universe_version: int = 0
+        self._config_json_cache: Optional[Tuple[int, bytes]] = None
+        self._universe_json_cache: Optional[Tuple[int, bytes]] = None
         logger.info(f"RiskEngine initialized.")
 
     async def load_instrument_info(self):
         """Bybit에서 거래 상품 정보를 로드하여 리스크 엔진에 저장합니다."""
         logger.info("Loading instrument info from Bybit...")
         try:
-            initial_universe = load_universe()
-            info_list = await self.bybit_client.get_instruments_info(category='spot')
+            initial_universe = frozenset(load_universe())
+            # 상품 정보와 전체 티커를 동시에 조회합니다. 티커 한 번으로 모든 심볼의 24시간 거래량/고저가를 얻습니다.
+            info_list, tickers = await asyncio.gather(
+                self.bybit_client.get_instruments_info(category='spot'),
+                self.bybit_client.get_tickers(category='spot'),
+                return_exceptions=True,
+            )
+            if isinstance(info_list, Exception):
+                raise info_list
+            if isinstance(tickers, Exception):
+                logger.warning(f"Failed to fetch tickers for liquidity check: {tickers}. Falling back to kline.")
+                tickers = []
             logger.info(f"Received {len(info_list)} instruments from Bybit API.")
 
+            candidates = [item for item in info_list if item['symbol'] in initial_universe]
+            ticker_by_symbol = {t['symbol']: t for t in tickers}
+
+            # 티커에 없는 심볼만 kline으로 확인합니다. 순차 조회하지 않고, 동시 요청 수를 제한하여 한꺼번에 조회합니다.
+            semaphore = asyncio.Semaphore(self.KLINE_FETCH_CONCURRENCY)
+
+            async def fetch_kline(symbol: str) -> List:
+                async with semaphore:
+                    return await self.bybit_client.get_kline(symbol=symbol, interval="1", limit=15)
+
+            fallback_symbols = [item['symbol'] for item in candidates if item['symbol'] not in ticker_by_symbol]
+            kline_results = dict(zip(
+                fallback_symbols,
+                await asyncio.gather(*(fetch_kline(s) for s in fallback_symbols), return_exceptions=True),
+            ))
+
             liquid_symbols = []
-            for item in info_list:
+            for item in candidates:
                 symbol = item['symbol']
-                if symbol in initial_universe:
-                    # 유동성 체크 로직 (기존 코드 유지)
-                    kline_data = await self.bybit_client.get_kline(symbol=symbol, interval="1", limit=15)
-                    if not kline_data or len(kline_data) < 15:
+                ticker = ticker_by_symbol.get(symbol)
+                if ticker is not None:
+                    # 티커에는 kline 이력이 없으므로, 24시간 거래량이 0이거나 고가와 저가가 같은(거래가 없는) 심볼을 제외합니다.
+                    total_volume = float(ticker.get('volume24h') or 0)
+                    unchanging = ticker.get('highPrice24h') == ticker.get('lowPrice24h')
+                    if total_volume == 0 or unchanging:
+                        logger.warning(f"[{symbol}] Illiquid symbol detected from ticker. Skipping.")
+                        continue
+                else:
+                    kline_data = kline_results[symbol]
+                    if isinstance(kline_data, Exception):
+                        logger.warning(f"[{symbol}] Failed to fetch kline for liquidity check: {kline_data}. Skipping.")
                         continue
 
-                    total_volume = sum(float(k[5]) for k in kline_data)
-                    prices = [float(k[4]) for k in kline_data]
-
-                    # if total_volume == 0 or all(p == prices[0] for p in prices):
-                    #     logger.warning(f"[{symbol}] Illiquid symbol detected. Skipping.")
-                    #     continue
+                    # 유동성 체크 로직 (기존 코드 유지): kline 경로는 최소 이력(15개)만 확인합니다.
+                    if not kline_data or len(kline_data) < 15:
+                        continue
 
-                    liquid_symbols.append(symbol)
-                    self.instrument_info[symbol] = item.get('lotSizeFilter', {})
+                liquid_symbols.append(symbol)
+                self.instrument_info[symbol] = item.get('lotSizeFilter', {})
 
             self.universe = liquid_symbols
+            self.universe_version += 1
             # state_store가 최신 universe를 참조하도록 업데이트
             state_store._universe = self.universe
             logger.success(f"Successfully loaded instrument info for {len(self.instrument_info)} liquid symbols.")
@@ -84,16 +125,32 @@ class RiskEngine:
         """현재 리스크 설정을 반환합니다."""
         return self.config
 
+    def get_config_json(self) -> Tuple[int, bytes]:
+        """현재 리스크 설정의 버전과 JSON 직렬화 결과(캐시)를 반환합니다."""
+        if self._config_json_cache is None or self._config_json_cache[0] != self.config_version:
+            content = orjson.dumps(self.config.model_dump(mode='json'))
+            self._config_json_cache = (self.config_version, content)
+        return self._config_json_cache
+
+    def get_universe_json(self) -> Tuple[int, bytes]:
+        """현재 거래 대상 심볼 목록의 버전과 JSON 직렬화 결과(캐시)를 반환합니다."""
+        if self._universe_json_cache is None or self._universe_json_cache[0] != self.universe_version:
+            content = orjson.dumps(list(self.universe))
+            self._universe_json_cache = (self.universe_version, content)
+        return self._universe_json_cache
+
     def update_config(self, new_config: RiskConfig):
         """API를 통해 리스크 설정을 동적으로 업데이트합니다."""
         self.config = new_config
-        logger.warning(f"Risk configuration updated via API: {self.config.model_dump_json()}")
+        self.config_version += 1
+        logger.opt(lazy=True).warning("Risk configuration updated via API: {}", lambda: self.config.model_dump_json())
         # state_store에도 변경된 설정을 즉시 반영
         asyncio.create_task(state_store.set_risk_config(self.config))
 
     def update_universe(self, new_universe: list[str]):
         """거래 대상 심볼 목록을 업데이트합니다."""
         self.universe = new_universe
+        self.universe_version += 1
         state_store._universe = self.universe
         logger.warning(f"Trading universe updated: {self.universe}")
 
@@ -127,18 +184,18 @@ class RiskEngine:
         if not self.is_globally_ok_to_trade():
             return False, "Global trading stop is active (e.g., daily loss limit)."
 
-        state = state_store.get_system_state()
+        held_symbols = state_store.get_held_symbols()
 
         if side == Side.BUY:
             # 최대 동시 보유 포지션 수 확인
-            if len(state.held_symbols) >= self.config.max_active_symbols:
+            if len(held_symbols) >= self.config.max_active_symbols:
                 # 이미 보유한 종목에 대한 추가 매수(물타기)가 아닌 신규 진입인 경우 차단
-                if symbol not in state.held_symbols:
+                if symbol not in held_symbols:
                     return False, f"Max active symbols limit reached ({self.config.max_active_symbols})."
 
         elif side == Side.SELL:
             # 판매할 자산이 실제로 있는지 확인
-            if symbol not in state.held_symbols:
+            if symbol not in held_symbols:
                 return False, f"Attempted to sell {symbol} which is not held."
 
         return True, "Trade is allowed."
@@ -149,9 +206,8 @@ class RiskEngine:
 
         :return: 거래에 사용할 USDT 금액
         """
-        state = state_store.get_system_state()
-        available_usdt = state.available_usdt_balance
-        total_equity = state.total_equity
+        available_usdt = state_store.get_available_usdt_balance()
+        total_equity = state_store.get_total_equity()
 
         if available_usdt < 20:  # 최소 주문 금액 등을 고려한 버퍼
             logger.warning(f"Not enough USDT to trade. Available: {available_usdt:.2f}")
@@ -5,7 +5,7 @@ import time
 from datetime import datetime
 from typing import List, Optional, Dict
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, RootModel, field_validator
 from sqlmodel import Field as SQLField
 from sqlmodel import SQLModel
 
@@ -31,6 +31,22 @@ class RiskConfig(BaseModel):
     max_holding_time_seconds: int = Field(300, gt=0, description="최대 포지션 보유 시간(초)")
 
 
+class UniverseUpdate(RootModel[List[str]]):
+    """
+    거래 대상 심볼(universe) 변경 요청 모델.
+    요청 본문은 기존과 같이 심볼 문자열 배열이며, 대문자로 정규화하고 순서를 유지한 채 중복을 제거합니다.
+    """
+    root: List[str] = Field(..., min_length=1, max_length=500, description="거래 대상 심볼 목록")
+
+    @field_validator('root')
+    @classmethod
+    def normalize_symbols(cls, v: List[str]) -> List[str]:
+        symbols = list(dict.fromkeys(s.strip().upper() for s in v if s and s.strip()))
+        if not symbols:
+            raise ValueError("At least one non-empty symbol is required.")
+        return symbols
+
+
 class Position(BaseModel):
     """단일 포지션(자산) 상태 모델"""
     symbol: str
@@ -16,6 +16,7 @@
 #   - **세션 관리**: 비동기 세션(`AsyncSession`)을 사용하여 데이터베이스 트랜잭션을 관리합니다.
 #   - **데이터 로깅**: `add_trade`, `add_event`, `add_trend_event`와 같은 메서드를 통해
 #     거래, 시스템 이벤트, 트렌드 데이터를 영구적으로 저장합니다.
+#     행은 쓰기 큐에 쌓였다가 백그라운드 태스크가 짧은 주기로 모아 한 트랜잭션으로 커밋합니다.
 #   - **데이터 조회**: 과거 데이터를 조회하는 메서드를 제공합니다 (예: `get_trades_for_symbol`).
 #
 #   **데이터베이스 선택:**
@@ -25,10 +26,14 @@
 #
 #
 import asyncio
-from typing import List, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+from collections import defaultdict
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Type
 
 from loguru import logger
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
 from sqlmodel import SQLModel, select
 from sqlalchemy.orm import sessionmaker
 
@@ -36,12 +41,57 @@ from app.config import settings
 from app.state.models import EventLog, TradeLog, TrendEventLog
 from app.utils.typing import TrendEvent
 
+# SQLite 연결마다 적용할 PRAGMA.
+# - WAL: 쓰기(거래/이벤트 로그) 중에도 읽기(대시보드 내역 조회)가 막히지 않고, 커밋당 fsync가 줄어듭니다.
+# - synchronous=NORMAL: WAL 모드에서는 전원 장애 시 마지막 커밋 일부만 잃을 수 있고 DB 손상은 없습니다.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA cache_size=-65536",    # 64 MiB
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """새 SQLite 연결이 만들어질 때 `_SQLITE_PRAGMAS`를 적용합니다."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
 class Database:
     """데이터베이스 연결 및 세션 관리를 담당하는 클래스"""
 
+    # 쓰기 큐를 비우는 주기(초)와 한 트랜잭션에 넣을 최대 행 수.
+    FLUSH_INTERVAL_SECONDS = 0.1
+    FLUSH_MAX_BATCH = 500
+
     def __init__(self, db_url: str):
-        self.engine = create_async_engine(db_url, echo=False) # echo=True로 설정 시 SQL 쿼리 로깅
+        is_sqlite = db_url.startswith("sqlite")
+        if is_sqlite:
+            # 파일 SQLite는 기본 풀(연결 재사용)을 그대로 쓰고, 쓰기 연결이 락을 잡고 있을 때
+            # 조회가 바로 실패하지 않도록 busy timeout만 늘립니다.
+            engine_kwargs = {"connect_args": {"timeout": 30}}
+        else:
+            # PostgreSQL 등: 여러 백그라운드 루프와 API 조회가 동시에 연결을 쓰므로 풀을 넉넉히 잡고,
+            # 끊긴 연결은 사용 전에 확인(pre_ping)하고 오래된 연결은 주기적으로 교체합니다.
+            engine_kwargs = {"pool_size": 20, "max_overflow": 20, "pool_pre_ping": True, "pool_recycle": 1800}
+        self.engine = create_async_engine(db_url, echo=False, **engine_kwargs) # echo=True로 설정 시 SQL 쿼리 로깅
+        if is_sqlite:
+            # PostgreSQL 등 다른 DB에는 적용하지 않습니다.
+            event.listen(self.engine.sync_engine, "connect", _apply_sqlite_pragmas)
         self.session_maker = sessionmaker(self.engine, class_=AsyncSession, expire_on_commit=False)
+        # add_* 로 들어온 행(SQLModel 객체)을 모아 두는 쓰기 큐와 이를 비우는 백그라운드 태스크
+        # (None은 종료 신호입니다)
+        self._write_queue: asyncio.Queue[Optional[SQLModel]] = asyncio.Queue()
+        self._flush_task: Optional[asyncio.Task] = None
+        # 쓰기 전용으로 계속 열어 두는 연결. 쓰기는 `_flush_loop` 태스크 하나에서만 하므로 별도 락이 필요 없습니다.
+        # 조회(get_*)는 기존처럼 session_maker의 풀 연결을 사용합니다.
+        self._writer_conn: Optional[AsyncConnection] = None
         logger.info(f"Database engine created for URL: {db_url}")
 
     async def connect(self):
@@ -50,52 +100,134 @@ class Database:
             # SQLModel 모델에 정의된 모든 테이블을 생성합니다.
             await conn.run_sync(SQLModel.metadata.create_all)
         logger.info("Database connected and tables created (if not exist)." )
+        self._writer_conn = await self.engine.connect()
+        self._flush_task = asyncio.create_task(self._flush_loop(), name="db_flush")
 
     async def disconnect(self):
-        """데이터베이스 연결을 종료합니다."""
+        """쓰기 큐에 남은 행을 모두 기록한 뒤 데이터베이스 연결을 종료합니다."""
+        if self._flush_task is not None:
+            # 취소하면 커밋 중인 배치를 잃을 수 있으므로, 종료 신호를 넣고 남은 행을 다 기록할 때까지 기다립니다.
+            self._write_queue.put_nowait(None)
+            await self._flush_task
+            self._flush_task = None
+        if self._writer_conn is not None:
+            await self._writer_conn.close()
+            self._writer_conn = None
         await self.engine.dispose()
         logger.info("Database connection closed.")
 
-    async def get_session(self) -> AsyncSession:
-        """비동기 데이터베이스 세션을 반환합니다."""
+    @asynccontextmanager
+    async def get_session(self) -> AsyncIterator[AsyncSession]:
+        """
+        비동기 데이터베이스 세션 컨텍스트를 제공합니다.
+        `async with db.get_session() as session:` 형태로 사용하며, 블록을 벗어날 때 세션이 닫히고 연결이 풀로 반환됩니다.
+        """
         async with self.session_maker() as session:
-            return session
+            yield session
+
+    def _drain_write_queue(self, batch: List[SQLModel]) -> bool:
+        """
+        쓰기 큐에서 `batch`가 `FLUSH_MAX_BATCH`개가 될 때까지 기다리지 않고 행을 꺼내 담습니다.
+        종료 신호(None)를 만나면 True를 반환합니다.
+        """
+        while len(batch) < self.FLUSH_MAX_BATCH and not self._write_queue.empty():
+            row = self._write_queue.get_nowait()
+            if row is None:
+                return True
+            batch.append(row)
+        return False
+
+    async def _insert_rows(self, rows_by_model: Dict[Type[SQLModel], List[dict]]) -> bool:
+        """
+        모델별 행들을 쓰기 전용 연결에서 한 트랜잭션(커밋 한 번)으로 기록합니다.
+        실패하면 롤백하고 False를 반환합니다. 롤백 자체의 예외도 여기서 삼켜 `_flush_loop`가 죽지 않게 합니다.
+        """
+        try:
+            for model, rows in rows_by_model.items():
+                await self._writer_conn.execute(insert(model), rows)
+            await self._writer_conn.commit()
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to write rows to DB: {e}")
+            try:
+                await self._writer_conn.rollback()
+            except Exception as rollback_error:
+                logger.error(f"Failed to roll back DB writer connection: {rollback_error}", exc_info=True)
+            return False
+
+    async def _write_batch(self, batch: List[SQLModel]):
+        """
+        모은 행들을 쓰기 전용 연결에서 한 트랜잭션(커밋 한 번)으로 기록합니다.
+        ORM 세션 대신 테이블별 Core `insert`를 executemany로 실행합니다.
+        배치 커밋이 실패하면 모델별로, 그래도 실패하는 모델은 행별로 다시 기록해 문제가 된 행만 버립니다.
+        """
+        if not batch:
+            return
+        rows_by_model: Dict[Type[SQLModel], List[dict]] = defaultdict(list)
+        for row in batch:
+            # id가 비어 있으면 DB가 채우도록 컬럼에서 뺍니다.
+            rows_by_model[type(row)].append(row.model_dump(exclude={'id'} if row.id is None else None))
+        if await self._insert_rows(rows_by_model):
+            logger.debug("Flushed {} rows to DB.", len(batch))
+            return
+
+        logger.warning("Batch of {} rows failed; retrying per model.", len(batch))
+        dropped = 0
+        for model, rows in rows_by_model.items():
+            if await self._insert_rows({model: rows}):
+                continue
+            for row in rows:
+                if not await self._insert_rows({model: [row]}):
+                    dropped += 1
+                    logger.error(f"Dropped {model.__name__} row that could not be written to DB: {row}")
+        logger.warning("Flushed {} of {} rows to DB after retry.", len(batch) - dropped, len(batch))
+
+    async def _flush_loop(self):
+        """쓰기 큐에 행이 들어오면 `FLUSH_INTERVAL_SECONDS` 동안 더 모았다가 한 번에 커밋합니다."""
+        stopping = False
+        while not stopping:
+            first = await self._write_queue.get()
+            if first is None:
+                stopping = True
+                batch = []
+            else:
+                await asyncio.sleep(self.FLUSH_INTERVAL_SECONDS)
+                batch = [first]
+            stopping = self._drain_write_queue(batch) or stopping
+            await self._write_batch(batch)
+        # 종료 신호 이후 큐에 남은 행까지 모두 기록합니다.
+        while not self._write_queue.empty():
+            batch = []
+            self._drain_write_queue(batch)
+            await self._write_batch(batch)
 
     async def add_trade(self, trade_data: dict):
-        """체결된 거래를 데이터베이스에 기록합니다."""
-        async with self.session_maker() as session:
-            trade_log = TradeLog(**trade_data) # dict를 SQLModel 객체로 변환
-            session.add(trade_log)
-            await session.commit()
-            logger.debug(f"Trade logged to DB: {trade_log}")
+        """체결된 거래를 쓰기 큐에 넣습니다. 실제 기록은 `_flush_loop`가 모아서 수행합니다."""
+        trade_log = TradeLog(**trade_data) # dict를 SQLModel 객체로 변환
+        self._write_queue.put_nowait(trade_log)
+        logger.debug("Trade queued for DB: {}", trade_log)
 
     async def add_event(self, event_type: str, details: str):
-        """시스템 이벤트를 데이터베이스에 기록합니다."""
-        async with self.session_maker() as session:
-            event_log = EventLog(event_type=event_type, details=details)
-            session.add(event_log)
-            await session.commit()
-            logger.info(f"Event logged to DB: {event_type} - {details}")
+        """시스템 이벤트를 쓰기 큐에 넣습니다."""
+        self._write_queue.put_nowait(EventLog(event_type=event_type, details=details))
+        logger.info(f"Event queued for DB: {event_type} - {details}")
 
     async def add_trend_event(self, trend_event: TrendEvent):
-        """수집된 트렌드 이벤트를 데이터베이스에 기록합니다."""
-        async with self.session_maker() as session:
-            # Pydantic 모델을 SQLModel로 변환
-            trend_log = TrendEventLog.model_validate(trend_event)
-            session.add(trend_log)
-            await session.commit()
-            logger.debug(f"Trend event logged to DB: {trend_event.symbol_final} - {trend_event.text[:30]}...")
+        """수집된 트렌드 이벤트를 쓰기 큐에 넣습니다."""
+        # TrendEvent 데이터클래스를 SQLModel로 변환
+        self._write_queue.put_nowait(TrendEventLog.model_validate(asdict(trend_event)))
+        logger.debug("Trend event queued for DB: {} - {}...", trend_event.symbol_final, trend_event.text[:30])
 
     async def get_trades_for_symbol(self, symbol: str, limit: int = 100) -> Sequence[TradeLog]:
         """특정 심볼에 대한 최근 거래 기록을 조회합니다."""
-        async with self.session_maker() as session:
+        async with self.get_session() as session:
             statement = select(TradeLog).where(TradeLog.symbol == symbol).order_by(TradeLog.timestamp.desc()).limit(limit)
             result = await session.execute(statement)
             return result.scalars().all()
 
     async def get_all_trades(self, limit: int = 100) -> Sequence[TradeLog]:
         """모든 심볼에 대한 최근 거래 기록을 조회합니다."""
-        async with self.session_maker() as session:
+        async with self.get_session() as session:
             statement = select(TradeLog).order_by(TradeLog.timestamp.desc()).limit(limit)
             result = await session.execute(statement)
             return result.scalars().all()
@@ -12,8 +12,10 @@
 import asyncio
 import time
 from collections import deque
-from typing import Deque, Dict, List, Optional
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
 
+import orjson
 from loguru import logger
 
 from app.exchange.models import Order, CoinBalance
@@ -26,43 +28,147 @@ from app.assets import universe
 class StateStore:
     """애플리케이션의 실시간 상태를 관리하는 인메모리 저장소"""
 
+    # 드물게 바뀌는 SystemState 필드. 바뀔 때만 미리 JSON으로 인코딩해 두고(orjson.Fragment),
+    # 상태 직렬화 시에는 다시 인코딩하지 않고 그대로 이어 붙입니다.
+    _FRAGMENT_FIELDS = frozenset({'risk_config', 'order_history'})
+    # 체결/에러/추세/포지션처럼 몰려서 들어오는 변경은 이 시간 동안 모았다가 `_update_state`를 한 번만 실행합니다.
+    UPDATE_DEBOUNCE_SECONDS = 0.05
+
     def __init__(self, max_events: int = 50):
         self._lock = asyncio.Lock()
         self._max_events = max_events
 
         self._system_state = SystemState()
         self._initial_total_equity: float = 0.0
+        # SystemState가 변경될 때마다 증가하는 버전. API 응답의 ETag와 직렬화 캐시 키로 사용합니다.
+        self._version: int = 0
+        self._state_json_cache: Optional[Tuple[int, bytes]] = None
+        self._json_fragments: Dict[str, orjson.Fragment] = {}
+        # 버전이 오를 때 set되는 알림. 여러 번 바뀌어도 플래그 하나로 합쳐지므로, 기다리는 쪽은 항상 최신 상태만 읽습니다.
+        self._state_changed = asyncio.Event()
+        # 예약된 지연 동기화 태스크. 이미 예약돼 있으면 새 변경은 그 태스크에 합쳐집니다.
+        self._update_task: Optional[asyncio.Task] = None
 
         self._orderbooks: Dict[str, Dict] = {}
-        self._orders: Dict[str, Dict] = {}
+        # 주문/체결은 파싱한 `Order` 객체로 보관하고, dict 변환은 SystemState 동기화 시점에만 합니다.
+        self._orders: Dict[str, Order] = {}
+        # 주문별 `model_dump()` 결과 캐시. 주문이 갱신되면 해당 항목만 버립니다.
+        self._order_dumps: Dict[str, Dict] = {}
         self._balances: Dict[str, CoinBalance] = {}
-        self._universe: List[str] = universe
+        self._universe: Sequence[str] = universe
 
-        self._recent_trades_deque: Deque[dict] = deque(maxlen=max_events)
+        self._recent_trades_deque: Deque[Order] = deque(maxlen=max_events)
         self._recent_errors_deque: Deque[str] = deque(maxlen=max_events)
         self._trend_summary_deque: Deque[TrendEvent] = deque(maxlen=max_events)
+        # 컬렉션별 변경 플래그. `_update_state`는 플래그가 선 컬렉션만 리스트로 다시 복사합니다.
+        self._orders_dirty = False
+        self._trades_dirty = False
+        self._errors_dirty = False
+        self._trends_dirty = False
 
-        self._system_state.recent_trades = list(self._recent_trades_deque)
+        self._system_state.recent_trades = []
         self._system_state.recent_errors = list(self._recent_errors_deque)
         self._system_state.trend_summary = list(self._trend_summary_deque)
+        for field in self._FRAGMENT_FIELDS:
+            self._refresh_json_fragment(field)
 
     async def _update_state(self):
-        """내부 상태를 SystemState 객체에 동기화합니다."""
+        """
+        내부 상태를 SystemState 객체에 동기화합니다.
+        주문/거래/에러/추세 컬렉션은 마지막 동기화 이후 바뀐 것만 다시 복사합니다.
+        """
         async with self._lock:
-            self._system_state.orders = list(self._orders.values())
-            self._system_state.recent_trades = list(self._recent_trades_deque)
-            self._system_state.recent_errors = list(self._recent_errors_deque)
-            self._system_state.trend_summary = list(self._trend_summary_deque)
+            if self._orders_dirty:
+                self._system_state.orders = self._dump_orders()
+                self._orders_dirty = False
+            if self._trades_dirty:
+                self._system_state.recent_trades = [trade.model_dump() for trade in self._recent_trades_deque]
+                self._trades_dirty = False
+            if self._errors_dirty:
+                self._system_state.recent_errors = list(self._recent_errors_deque)
+                self._errors_dirty = False
+            if self._trends_dirty:
+                self._system_state.trend_summary = list(self._trend_summary_deque)
+                self._trends_dirty = False
 
             usdt_balance = self._balances.get("USDT")
             self._system_state.available_usdt_balance = usdt_balance.wallet_balance if usdt_balance else 0.0
 
             self._system_state.timestamp = now()
+            self._bump_version()
+
+    def _dump_orders(self) -> List[Dict]:
+        """`_orders`를 dict 리스트로 만듭니다. 마지막 동기화 이후 바뀐 주문만 다시 `model_dump()` 합니다."""
+        dumps = self._order_dumps
+        result = []
+        for order_id, order in self._orders.items():
+            dumped = dumps.get(order_id)
+            if dumped is None:
+                dumped = dumps[order_id] = order.model_dump()
+            result.append(dumped)
+        return result
+
+    def _schedule_update(self):
+        """
+        `_update_state`를 `UPDATE_DEBOUNCE_SECONDS` 뒤에 실행하도록 예약합니다 (trailing-edge debounce).
+        그 사이에 들어온 변경은 모두 한 번의 동기화/버전 증가로 합쳐집니다.
+        """
+        if self._update_task is None or self._update_task.done():
+            self._update_task = asyncio.create_task(self._delayed_update(), name="state_update")
+
+    async def _delayed_update(self):
+        await asyncio.sleep(self.UPDATE_DEBOUNCE_SECONDS)
+        # 동기화 도중 들어온 변경이 새 태스크를 예약할 수 있도록 먼저 비워 둡니다.
+        self._update_task = None
+        await self._update_state()
+
+    def _bump_version(self):
+        """상태 버전을 올리고, 변경을 기다리는 쪽(대시보드 브로드캐스트 등)을 깨웁니다."""
+        self._version += 1
+        self._state_changed.set()
+
+    async def wait_for_state_change(self):
+        """마지막 호출 이후 상태가 바뀔 때까지 기다립니다. 그 사이의 여러 변경은 한 번으로 합쳐집니다."""
+        await self._state_changed.wait()
+        self._state_changed.clear()
+
+    def _refresh_json_fragment(self, field: str):
+        """`_FRAGMENT_FIELDS` 중 하나가 바뀌었을 때 해당 필드의 JSON 조각을 다시 만듭니다."""
+        value = self._system_state.model_dump(mode='json', include={field})[field]
+        self._json_fragments[field] = orjson.Fragment(orjson.dumps(value))
 
     # --- Public Getters ---
     def get_system_state(self) -> SystemState:
         return self._system_state.model_copy(deep=True)
 
+    def get_system_state_json(self) -> Tuple[int, bytes]:
+        """
+        현재 SystemState의 버전과 JSON 직렬화 결과를 반환합니다.
+        상태가 바뀌지 않았다면 이전에 직렬화한 바이트를 그대로 재사용합니다.
+        """
+        version = self._version
+        if self._state_json_cache is None or self._state_json_cache[0] != version:
+            data = self._system_state.model_dump(mode='json', exclude=self._FRAGMENT_FIELDS)
+            data.update(self._json_fragments)
+            content = orjson.dumps(data)
+            self._state_json_cache = (version, content)
+        return self._state_json_cache
+
+    # 전략/리스크 경로에서 자주 읽는 값들은 `get_system_state()`처럼 전체 상태를 깊은 복사하지 않고 바로 반환합니다.
+    def get_total_equity(self) -> float:
+        return self._system_state.total_equity
+
+    def get_available_usdt_balance(self) -> float:
+        return self._system_state.available_usdt_balance
+
+    def get_held_symbols(self) -> List[str]:
+        # held_symbols는 갱신 시 새 리스트로 교체되므로 복사 없이 반환해도 안전합니다. (호출하는 쪽에서 수정하지 않아야 합니다)
+        return self._system_state.held_symbols
+
+    def get_active_positions(self) -> List[Position]:
+        # active_positions는 제자리에서 추가/교체되므로 리스트만 얕게 복사합니다.
+        return list(self._system_state.active_positions)
+
     def get_orderbook(self, symbol: str) -> Dict | None:
         return self._orderbooks.get(symbol)
 
@@ -72,9 +178,28 @@ class StateStore:
     def get_all_balances(self) -> Dict[str, CoinBalance]:
         return self._balances
 
-    def get_universe(self) -> List[str]:
+    def get_universe(self) -> Sequence[str]:
         return self._universe
 
+    def get_recent_orders(self, limit: int) -> List[dict]:
+        """
+        최근 주문 내역 중 최대 `limit`개를 반환합니다.
+        Bybit 주문 내역은 최신순으로 내려오므로 앞에서부터 잘라내며,
+        `get_system_state()`처럼 전체 상태를 깊은 복사하지 않습니다.
+        """
+        return self._system_state.order_history[:limit]
+
+    def count_trend_events(self) -> int:
+        """보관 중인 최근 트렌드 이벤트의 개수를 반환합니다."""
+        return len(self._trend_summary_deque)
+
+    def get_recent_trend_events_page(self, offset: int, limit: int) -> List[TrendEvent]:
+        """
+        최신순으로 정렬된 트렌드 이벤트 중 `offset`부터 최대 `limit`개만 반환합니다.
+        전체 목록을 복사하지 않고 필요한 구간만 꺼냅니다.
+        """
+        return list(islice(self._trend_summary_deque, offset, offset + limit))
+
     def get_position(self, symbol: str) -> Optional[Position]:
         """
         [신규 추가] 특정 심볼의 포지션 객체를 반환합니다.
@@ -104,6 +229,93 @@ class StateStore:
 
     # app/state/store.py
 
+    def _parse_account_info(self, account_info: Dict) -> Optional[Tuple[Dict[str, float], Dict[str, CoinBalance]]]:
+        """
+        v5 지갑 계정 정보(REST `get_wallet_balance`의 `result.list[0]` 또는 private WS `wallet` 메시지의 항목)를
+        (SystemState 지갑 필드 값, 코인별 잔고) 로 파싱합니다.
+        상태를 건드리지 않으므로 `_lock` 밖에서 호출하고, 반영은 `_apply_account_info`로 합니다.
+        """
+        coin_list = account_info.get('coin', [])
+        if not coin_list:
+            logger.warning("Wallet balance data is malformed (missing 'coin' list).")
+            return None
+
+        # --- 기본 지갑 정보 ---
+        wallet_fields = {
+            'total_equity': float(account_info.get('totalEquity', 0) or 0),
+            'available_balance': float(account_info.get('totalAvailableBalance', 0) or 0),
+            'unrealised_pnl': float(account_info.get('totalUnrealisedPnl', 0) or 0),
+            'available_usdt_balance': 0.0,
+        }
+
+        # --- 사용 가능한 USDT 잔액을 명시적으로 찾아 저장 (v5 호환) ---
+        for coin in coin_list:
+            if coin.get('coin') == 'USDT':
+                # v5 API에서는 'walletBalance' 대신 'equity'를 사용합니다.
+                wallet_fields['available_usdt_balance'] = float(coin.get('equity', 0) or 0)
+                break
+
+        balances: Dict[str, CoinBalance] = {}
+        for coin_dict in coin_list:
+            # 'walletBalance' 키를 'equity'로 변경하여 CoinBalance 모델에 전달
+            # **중요**: CoinBalance 모델의 필드명도 'walletBalance'에서 'equity'로 변경해야 합니다.
+
+            # 임시로 'walletBalance' 키를 추가하여 기존 모델과 호환되도록 처리
+            coin_dict_compatible = coin_dict.copy()
+            coin_dict_compatible['wallet_balance'] = coin_dict.get('equity', '0')
+
+            balance = CoinBalance(**coin_dict_compatible)
+            balances[balance.coin] = balance
+
+        return wallet_fields, balances
+
+    def _apply_account_info(self, parsed: Tuple[Dict[str, float], Dict[str, CoinBalance]]):
+        """
+        `_parse_account_info`의 결과를 시스템 상태에 반영합니다. 호출하는 쪽에서 `_lock`을 잡고 있어야 합니다.
+        파싱은 이미 끝났으므로 락 안에서는 값 대입과 일일 손익 계산만 합니다.
+        """
+        wallet_fields, balances = parsed
+        for field, value in wallet_fields.items():
+            setattr(self._system_state, field, value)
+
+        # --- 일일 손익 계산 ---
+        if self._initial_total_equity > 0:
+            pnl = self._system_state.total_equity - self._initial_total_equity
+            self._system_state.pnl_day = pnl
+            self._system_state.pnl_day_pct = (pnl / self._initial_total_equity) * 100
+
+        # --- [수정된 부분] held_symbols를 active_positions를 기반으로 업데이트합니다. ---
+        self._system_state.held_symbols = sorted({p.symbol for p in self._system_state.active_positions})
+
+        # 새로 만든 딕셔너리로 교체합니다. (기존 딕셔너리를 비우고 채우지 않습니다)
+        self._balances = balances
+
+        logger.info(
+            f"Wallet balance updated. Equity: {self._system_state.total_equity:.2f}, "
+            f"Available USDT: {self._system_state.available_usdt_balance:.2f}, "
+            f"PnL Day: {self._system_state.pnl_day:.2f}, "
+            f"Held Coins: {len(self._system_state.held_symbols)}"
+        )
+
+    async def apply_wallet_update(self, accounts: List[Dict]):
+        """
+        Bybit private WebSocket `wallet` 토픽 메시지의 `data`(계정 목록)를 반영합니다.
+        REST 폴링 없이 잔고/일일 손익이 실시간으로 갱신되며, 상태 버전도 함께 올립니다.
+        """
+        account_info = next((a for a in accounts if a.get('accountType') == 'UNIFIED'), None)
+        if account_info is None:
+            return
+        try:
+            parsed = self._parse_account_info(account_info)
+        except Exception as e:
+            logger.error(f"Failed to apply wallet update from WebSocket: {e}", exc_info=True)
+            return
+        if parsed is None:
+            return
+        async with self._lock:
+            self._apply_account_info(parsed)
+        self._schedule_update()
+
     async def update_wallet_balance(self, bybit_client: "BybitClient"):
         """Bybit에서 지갑 잔고를 가져와 시스템 상태를 업데이트합니다. (API v5 호환 최종 수정본)"""
         try:
@@ -121,56 +333,10 @@ class StateStore:
                 logger.warning("Wallet balance data list is empty.")
                 return
 
-            account_info = account_info_list[0]
-            coin_list = account_info.get('coin', [])
-            if not coin_list:
-                logger.warning("Wallet balance data is malformed (missing 'coin' list).")
-                return
-
-            async with self._lock:
-                # --- 기본 지갑 정보 업데이트 ---
-                self._system_state.total_equity = float(account_info.get('totalEquity', 0) or 0)
-                self._system_state.available_balance = float(account_info.get('totalAvailableBalance', 0) or 0)
-                self._system_state.unrealised_pnl = float(account_info.get('totalUnrealisedPnl', 0) or 0)
-
-                # --- 사용 가능한 USDT 잔액을 명시적으로 찾아 저장 (v5 호환) ---
-                for coin in coin_list:
-                    if coin.get('coin') == 'USDT':
-                        # v5 API에서는 'walletBalance' 대신 'equity'를 사용합니다.
-                        self._system_state.available_usdt_balance = float(coin.get('equity', 0) or 0)
-                        break
-                else:
-                    self._system_state.available_usdt_balance = 0.0
-
-                # --- 일일 손익 계산 ---
-                if self._initial_total_equity > 0:
-                    pnl = self._system_state.total_equity - self._initial_total_equity
-                    self._system_state.pnl_day = pnl
-                    self._system_state.pnl_day_pct = (
-                                                                 pnl / self._initial_total_equity) * 100 if self._initial_total_equity > 0 else 0.0
-
-                # --- [수정된 부분] held_symbols를 active_positions를 기반으로 업데이트합니다. ---
-                held_symbols_set = {p.symbol for p in self._system_state.active_positions}
-                self._system_state.held_symbols = sorted(list(held_symbols_set))
-
-                self._balances.clear()
-                for coin_dict in coin_list:
-                    # 'walletBalance' 키를 'equity'로 변경하여 CoinBalance 모델에 전달
-                    # **중요**: CoinBalance 모델의 필드명도 'walletBalance'에서 'equity'로 변경해야 합니다.
-
-                    # 임시로 'walletBalance' 키를 추가하여 기존 모델과 호환되도록 처리
-                    coin_dict_compatible = coin_dict.copy()
-                    coin_dict_compatible['wallet_balance'] = coin_dict.get('equity', '0')
-
-                    balance = CoinBalance(**coin_dict_compatible)
-                    self._balances[balance.coin] = balance
-
-            logger.info(
-                f"Wallet balance updated. Equity: {self._system_state.total_equity:.2f}, "
-                f"Available USDT: {self._system_state.available_usdt_balance:.2f}, "
-                f"PnL Day: {self._system_state.pnl_day:.2f}, "
-                f"Held Coins: {len(self._system_state.held_symbols)}"
-            )
+            parsed = self._parse_account_info(account_info_list[0])
+            if parsed is not None:
+                async with self._lock:
+                    self._apply_account_info(parsed)
 
         except Exception as e:
             logger.error(f"Failed to update wallet balance: {e}", exc_info=True)
@@ -185,6 +351,7 @@ class StateStore:
     async def set_risk_config(self, config: RiskConfig):
         async with self._lock:
             self._system_state.risk_config = config
+            self._refresh_json_fragment('risk_config')
         await self._update_state()
 
     async def update_orderbook(self, symbol: str, data: Dict):
@@ -193,21 +360,35 @@ class StateStore:
         호가창 데이터를 스냅샷 또는 델타 업데이트로 처리합니다.
         """
         async with self._lock:
-            # 1. 메시지 타입 확인: 스냅샷 또는 델타
-            is_snapshot = data.get('type') == 'snapshot'
+            self._apply_orderbook_update(symbol, data)
 
-            if is_snapshot:
-                # 스냅샷일 경우: 기존 데이터 덮어쓰기
-                self._orderbooks[symbol] = data['data']
-                logger.info(f"Orderbook snapshot received for {symbol}.")
+    async def bulk_update_orderbooks(self, batch: Dict[str, List[Dict]]):
+        """
+        여러 심볼의 호가 메시지를 락 한 번으로 반영합니다.
+        `batch`는 심볼 -> 수신 순서대로의 메시지 목록입니다.
+        """
+        async with self._lock:
+            for symbol, messages in batch.items():
+                for data in messages:
+                    self._apply_orderbook_update(symbol, data)
+
+    def _apply_orderbook_update(self, symbol: str, data: Dict):
+        """호가 메시지 하나를 반영합니다. 호출하는 쪽에서 `_lock`을 잡고 있어야 합니다."""
+        # 1. 메시지 타입 확인: 스냅샷 또는 델타
+        is_snapshot = data.get('type') == 'snapshot'
+
+        if is_snapshot:
+            # 스냅샷일 경우: 기존 데이터 덮어쓰기
+            self._orderbooks[symbol] = data['data']
+            logger.info(f"Orderbook snapshot received for {symbol}.")
+        else:
+            # 델타일 경우: 기존 데이터에 병합
+            current_book = self._orderbooks.get(symbol)
+            if current_book:
+                self._merge_delta(current_book,  data['data'])
             else:
-                # 델타일 경우: 기존 데이터에 병합
-                current_book = self._orderbooks.get(symbol)
-                if current_book:
-                    self._merge_delta(current_book,  data['data'])
-                else:
-                    # 스냅샷을 받기 전에 델타가 오면 무시 (재연결 필요)
-                    logger.warning(f"Delta update for {symbol} received before snapshot. Ignoring.")
+                # 스냅샷을 받기 전에 델타가 오면 무시 (재연결 필요)
+                logger.warning(f"Delta update for {symbol} received before snapshot. Ignoring.")
 
 
     def _merge_delta(self, current_book: Dict, delta_data: Dict):
@@ -250,29 +431,35 @@ class StateStore:
             if order_id:
                 try:
                     order = Order(**order_data)
-                    self._orders[order_id] = order.model_dump()
+                    self._orders[order_id] = order
+                    self._order_dumps.pop(order_id, None)
+                    self._orders_dirty = True
                 except Exception as e:
                     logger.error(f"Failed to parse order data: {order_data}. Error: {e}")
+        self._schedule_update()
 
     async def add_trade(self, trade_data: dict):
         async with self._lock:
             try:
                 trade = Order(**trade_data)
-                self._recent_trades_deque.appendleft(trade.model_dump())
+                self._recent_trades_deque.appendleft(trade)
+                self._trades_dirty = True
                 logger.info(f"Trade history updated with order {trade.order_id}")
             except Exception as e:
                 logger.error(f"Failed to parse and add trade data: {trade_data}. Error: {e}")
-        await self._update_state()
+        self._schedule_update()
 
     async def add_error(self, error_message: str):
         async with self._lock:
             self._recent_errors_deque.appendleft(error_message)
-        await self._update_state()
+            self._errors_dirty = True
+        self._schedule_update()
 
     async def add_trend_event(self, trend_event: TrendEvent):
         async with self._lock:
             self._trend_summary_deque.appendleft(trend_event)
-        await self._update_state()
+            self._trends_dirty = True
+        self._schedule_update()
 
     # ... 이하 루프 메서드들은 그대로 유지 ...
     async def update_wallet_balance_loop(self, bybit_client: "BybitClient", interval_seconds: int = 5):
@@ -296,6 +483,8 @@ class StateStore:
                 processed_orders = [Order(**data).model_dump() for data in order_history_data]
                 async with self._lock:
                     self._system_state.order_history = processed_orders
+                    self._refresh_json_fragment('order_history')
+                    self._bump_version()
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -318,7 +507,7 @@ class StateStore:
                 # 기존 포지션이 없으면 새로 추가
                 self._system_state.active_positions.append(position)
                 logger.info(f"New position for {position.symbol} added.")
-        await self._update_state()
+        self._schedule_update()
 
     async def update_realized_pnl(self, pnl: float):
         """
@@ -327,7 +516,7 @@ class StateStore:
         async with self._lock:
             self._system_state.realized_pnl += pnl
             logger.critical(f"Realized PnL updated. Current total: {self._system_state.realized_pnl:.2f}")
-        await self._update_state()
+        self._schedule_update()
 
 # 전역 상태 저장소 인스턴스 생성
 state_store = StateStore()
\ No newline at end of file
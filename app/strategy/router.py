@@ -98,7 +98,7 @@ class StrategyRouter:
         while True:
             try:
                 signal = await self._signal_queue.get()
-                logger.debug(f"Received signal from queue: {signal.signal_type} for {signal.symbol}")
+                logger.debug("Received signal from queue: {} for {}", signal.signal_type, signal.symbol)
 
                 if not self.risk_engine.is_globally_ok_to_trade():
                     continue
@@ -128,7 +128,7 @@ class StrategyRouter:
         while True:
             try:
                 await asyncio.sleep(3)  # TA 계산을 위해 약간의 여유를 둠
-                active_positions = state_store.get_system_state().active_positions
+                active_positions = state_store.get_active_positions()
                 logger.info(f"Checking for active positions. Found {len(active_positions)}.")
 
                 if not active_positions:
@@ -152,7 +152,7 @@ class StrategyRouter:
                         continue
 
                     pnl_bps = ((current_price / entry_price) - 1) * 10000
-                    logger.debug(f"[{position.symbol}] Current PnL: {pnl_bps:.1f} BPS.")
+                    logger.debug("[{}] Current PnL: {:.1f} BPS.", position.symbol, pnl_bps)
 
                     if pnl_bps >= config.default_tp_bps:
                         logger.info(f"[{position.symbol}] Take Profit condition met. PnL: {pnl_bps:.1f} BPS.")
@@ -280,7 +280,7 @@ class StrategyRouter:
                 logger.info(f"[EVALUATION] BUY signal for {symbol} approved by RiskEngine.")
                 await self._execute_buy_trade(signal)
             else:
-                logger.debug(f"Ignoring BUY signal for {symbol}. Reason: {reason}")
+                logger.debug("Ignoring BUY signal for {}. Reason: {}", symbol, reason)
 
     def _is_in_cooldown(self, symbol: str) -> bool:
         """해당 심볼이 현재 거래 쿨다운 상태인지 확인합니다."""
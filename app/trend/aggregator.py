@@ -9,9 +9,10 @@
 #
 #   **주요 기능:**
 #   - **커넥터 관리**: `create_x_connector`, `create_news_connector` 등 팩토리 함수를
-#     사용하여 모든 활성 커넥터 인스턴스를 생성하고 관리합니다.
-#   - **중앙 이벤트 큐**: 모든 커넥터는 `asyncio.Queue`를 공유하며, 수집한 원시
-#     `TrendEvent`를 이 큐에 넣습니다.
+#     사용하여 모든 활성 커넥터 인스턴스를 생성하고 관리합니다. 커넥터들은 집계기가 만든
+#     하나의 `httpx.AsyncClient`(HTTP/2)를 공유하며, `close()`에서 함께 정리됩니다.
+#   - **중앙 이벤트 큐**: 모든 커넥터는 크기가 제한된 `asyncio.Queue`를 공유하며, 수집한 원시
+#     `TrendEvent`를 이 큐에 넣습니다. 큐가 가득 차면 가장 오래된 배치가 버려집니다.
 #   - **이벤트 처리 파이프라인**: 집계기는 큐에서 이벤트를 꺼내 다음 순서로 처리합니다:
 #     1. `SymbolMapper`: 이벤트 텍스트를 분석하여 공식 거래 심볼(`symbol_final`)에 매핑합니다.
 #     2. `TrendScorer`: 매핑된 이벤트의 텍스트를 분석하여 감성 점수(`score`)와 신뢰도(`confidence`)를 부여합니다.
@@ -21,8 +22,8 @@
 #
 #   **데이터 흐름:**
 #   1. `main.py`에서 `TrendAggregator` 인스턴스 생성 및 `run_connectors()` 호출.
-#   2. 각 커넥터가 백그라운드에서 실행되며 원시 이벤트를 `self.raw_event_queue`에 추가.
-#   3. `_process_events()` 루프가 큐에서 이벤트를 가져와 `mapper`와 `scorer`로 처리.
+#   2. 각 커넥터가 백그라운드에서 실행되며 원시 이벤트를 배치(리스트) 단위로 `self.raw_event_queue`에 추가.
+#   3. `_process_events()` 루프가 큐에서 배치를 가져와 각 이벤트를 `mapper`와 `scorer`로 처리.
 #   4. 처리된 이벤트(`processed_event`)를 `state_store.add_trend_event()`로 저장.
 #   5. `processed_event`가 임계값을 넘으면 `Signal`로 변환하여 `self.latest_signals`에 저장.
 #   6. `StrategyRouter`는 `get_latest_signal()`을 호출하여 이 신호를 가져가 거래 결정에 사용.
@@ -31,6 +32,7 @@
 import asyncio
 from typing import Dict, List
 
+import httpx
 from loguru import logger
 
 from app.connectors.base import BaseFeedConnector
@@ -46,8 +48,19 @@ class TrendAggregator:
     """
     다양한 소스로부터 트렌드 이벤트를 수집, 처리, 집계하여 중앙 신호 큐로 보냅니다.
     """
+    # 원시 이벤트 큐에 쌓아 둘 수 있는 최대 배치 수
+    RAW_EVENT_QUEUE_MAXSIZE = 1024
+
     def __init__(self, signal_threshold: float = 0.3):
-        self.raw_event_queue: asyncio.Queue[TrendEvent] = asyncio.Queue()
+        # 소비가 밀려도 메모리가 무한히 늘지 않도록 크기를 제한합니다.
+        # 가득 차면 커넥터가 가장 오래된 배치를 버리고 새 배치를 넣습니다. (`BaseFeedConnector._flush_batch`)
+        self.raw_event_queue: asyncio.Queue[list[TrendEvent]] = asyncio.Queue(maxsize=self.RAW_EVENT_QUEUE_MAXSIZE)
+        # 모든 커넥터가 공유하는 HTTP 클라이언트. 커넥션 풀/TLS 세션을 재사용하고 HTTP/2로 요청을 다중화합니다.
+        self.http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
         self.connectors: List[BaseFeedConnector] = self._create_connectors()
         self.signal_queue: Optional[asyncio.Queue[Signal]] = None # 외부에서 주입받을 신호 큐
         self.signal_threshold = signal_threshold
@@ -61,8 +74,8 @@ class TrendAggregator:
     def _create_connectors(self) -> List[BaseFeedConnector]:
         """활성화된 모든 커넥터를 생성하고 리스트로 반환합니다."""
         return [
-            create_news_connector(self.raw_event_queue),
-            create_facebook_connector(self.raw_event_queue),
+            create_news_connector(self.raw_event_queue, self.http_client),
+            create_facebook_connector(self.raw_event_queue, self.http_client),
         ]
 
     async def run_connectors(self):
@@ -79,23 +92,29 @@ class TrendAggregator:
         connector_tasks = [asyncio.create_task(conn.run()) for conn in self.connectors]
         await asyncio.gather(self._processing_task, *connector_tasks)
 
+    async def close(self):
+        """모든 커넥터를 중지하고 공유 HTTP 클라이언트를 닫습니다."""
+        for conn in self.connectors:
+            conn.stop()
+        await self.http_client.aclose()
+
     async def _process_events(self):
-        """큐에서 원시 이벤트를 가져와 처리하는 메인 루프."""
+        """큐에서 원시 이벤트 배치를 가져와 처리하는 메인 루프."""
         while True:
             try:
-                raw_event = await self.raw_event_queue.get()
-                
-                final_symbol = symbol_mapper.map_event_to_symbol(raw_event)
-                if not final_symbol:
-                    self.raw_event_queue.task_done()
-                    continue
-                raw_event.symbol_final = final_symbol
+                batch = await self.raw_event_queue.get()
+                try:
+                    for raw_event in batch:
+                        final_symbol = symbol_mapper.map_event_to_symbol(raw_event)
+                        if not final_symbol:
+                            continue
+                        raw_event.symbol_final = final_symbol
 
-                processed_event = trend_scorer.score_event(raw_event)
-                await state_store.add_trend_event(processed_event)
-                self._generate_and_send_signal(processed_event)
-
-                self.raw_event_queue.task_done()
+                        processed_event = trend_scorer.score_event(raw_event)
+                        await state_store.add_trend_event(processed_event)
+                        self._generate_and_send_signal(processed_event)
+                finally:
+                    self.raw_event_queue.task_done()
 
             except asyncio.CancelledError:
                 logger.info("Event processing loop cancelled.")
@@ -64,10 +64,10 @@ class SymbolMapper:
         for keyword, symbol in sorted(self._reversed_symbol_map.items(), key=lambda item: len(item[0]), reverse=True):
             # 단어 경계를 확인하여 "sol"이 "absolve"에 매칭되는 경우 등을 방지 (간단한 방식)
             if f' {keyword} ' in f' {text_lower} ':
-                logger.debug(f"Mapped text '{event.text[:30]}...' to {symbol} with keyword '{keyword}'")
+                logger.debug("Mapped text '{}...' to {} with keyword '{}'", event.text[:30], symbol, keyword)
                 return symbol
 
-        logger.warning(f"Could not map event to any symbol: {event.text[:50]}...")
+        logger.warning("Could not map event to any symbol: {}...", event.text[:50])
         return None
 
 # 전역 인스턴스 생성
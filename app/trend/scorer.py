@@ -82,8 +82,9 @@ class TrendScorer:
         event.score = compound_score
         event.confidence = confidence
 
-        logger.debug(f"Scored event for symbol '{event.symbol_final}': "
-                     f"Score={event.score:.2f}, Conf={event.confidence:.2f}, Text='{event.text[:50]}...'")
+        # 이벤트마다 호출되므로 f-string 대신 loguru 자리표시자를 사용해, DEBUG가 꺼져 있으면 포맷팅하지 않습니다.
+        logger.debug("Scored event for symbol '{}': Score={:.2f}, Conf={:.2f}, Text='{}...'",
+                     event.symbol_final, event.score, event.confidence, event.text[:50])
         
         return event
 
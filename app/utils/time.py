@@ -6,12 +6,15 @@ def now() -> datetime:
     """
     return datetime.now(timezone.utc)
 
+def get_next_midnight_utc() -> datetime:
+    """
+    다음 날 UTC 자정 시각(절대 시각)을 반환합니다.
+    """
+    tomorrow_utc = now().date() + timedelta(days=1)
+    return datetime(tomorrow_utc.year, tomorrow_utc.month, tomorrow_utc.day, tzinfo=timezone.utc)
+
 def get_seconds_until_next_day_utc() -> float:
     """
     현재 시간으로부터 다음 날 UTC 자정까지 남은 시간을 초 단위로 계산합니다.
     """
-    now_utc = now()
-    tomorrow_utc = now_utc.date() + timedelta(days=1)
-    midnight_utc = datetime(tomorrow_utc.year, tomorrow_utc.month, tomorrow_utc.day, tzinfo=timezone.utc)
-    seconds_remaining = (midnight_utc - now_utc).total_seconds()
-    return seconds_remaining
\ No newline at end of file
+    return (get_next_midnight_utc() - now()).total_seconds()
\ No newline at end of file
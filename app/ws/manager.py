@@ -10,18 +10,20 @@
 #   **주요 기능:**
 #   - **연결 관리**: 여러 클라이언트의 동시 접속을 관리하고, 연결이 끊긴 클라이언트를 정리합니다.
 #   - **상태 브로드캐스팅**: `broadcast_loop` 태스크를 통해 1초마다 `state_store`에서 최신 시스템 상태를 가져와 JSON 형태로 모든 클라이언트에게 전송합니다.
+#     상태는 틱당 한 번만 직렬화하고, 모든 클라이언트에게 동시에 전송하여 느린 클라이언트가 다른 클라이언트의 전송을 지연시키지 않게 합니다.
+#     상태가 바뀐 틱에만 전송하며(일정 주기의 keepalive 제외), 새 클라이언트는 연결 직후 현재 스냅샷을 받습니다.
 #   - **비동기 처리**: `asyncio`를 사용하여 다수의 WebSocket 연결을 효율적으로 처리합니다.
 #
 #   **데이터 흐름:**
 #   1. RN 앱이 `/ws/dashboard` 엔드포인트로 WebSocket 연결을 요청합니다.
 #   2. `handle_connection`이 호출되어 연결을 수락하고, `self.active_connections` 리스트에 추가합니다.
-#   3. `broadcast_loop` (백그라운드 태스크)는 주기적으로 `state_store.get_system_state()`를 호출합니다.
+#   3. `broadcast_loop` (백그라운드 태스크)는 주기적으로 `state_store.get_system_state_json()`을 호출합니다.
 #   4. 획득한 상태 정보를 JSON으로 직렬화하여 `active_connections`에 있는 모든 클라이언트에게 전송합니다.
 #   5. 클라이언트 연결이 끊어지면, 해당 클라이언트는 리스트에서 제거됩니다.
 #
 #
 import asyncio
-from typing import List, Callable, Awaitable, Any
+from typing import List, Callable, Awaitable, Any, Optional, Set, Tuple
 
 from fastapi import WebSocket
 from loguru import logger
@@ -33,9 +35,18 @@ class WebSocketManager:
     """
     WebSocket 연결을 관리하고, 연결된 모든 클라이언트에게 메시지를 브로드캐스트합니다.
     """
+    # 상태가 바뀌지 않아도 이 주기(초)마다 한 번은 스냅샷을 다시 보내, 클라이언트가 연결이 살아 있음을 알 수 있게 합니다.
+    KEEPALIVE_INTERVAL_SECONDS = 15.0
+    # 클라이언트 한 곳에 대한 전송 제한 시간(초). 넘기면 느린 클라이언트로 보고 연결을 끊습니다.
+    SEND_TIMEOUT_SECONDS = 1.0
+
     def __init__(self):
         # 현재 활성화된 WebSocket 연결 목록
         self.active_connections: List[WebSocket] = []
+        # (상태 버전, 전송할 JSON 문자열). 상태가 바뀐 틱에만 새로 디코딩합니다.
+        self._message_cache: Optional[Tuple[int, str]] = None
+        # 느린 클라이언트를 닫는 중인 태스크 (완료 전에 GC되지 않도록 참조를 보관합니다)
+        self._closing_tasks: Set[asyncio.Task] = set()
         logger.info("WebSocketManager initialized.")
 
     async def handle_connection(self, websocket: WebSocket):
@@ -60,6 +71,8 @@ class WebSocketManager:
         클라이언트의 WebSocket 연결을 수락하고 관리 목록에 추가합니다.
         """
         await websocket.accept()
+        # 새 클라이언트는 다음 변경을 기다리지 않도록 현재 스냅샷을 바로 받습니다.
+        await websocket.send_text(self._current_message()[1])
         self.active_connections.append(websocket)
         logger.info(f"New WebSocket connection: {websocket.client}. Total clients: {len(self.active_connections)}")
 
@@ -71,14 +84,46 @@ class WebSocketManager:
             self.active_connections.remove(websocket)
             logger.info(f"WebSocket connection closed: {websocket.client}. Total clients: {len(self.active_connections)}")
 
+    def _close_quietly(self, websocket: WebSocket):
+        """느린 클라이언트의 연결을 백그라운드에서 닫습니다. 클라이언트는 재접속하면서 최신 스냅샷을 다시 받습니다."""
+        async def _close():
+            try:
+                await asyncio.wait_for(websocket.close(code=1013), self.SEND_TIMEOUT_SECONDS)
+            except Exception:
+                pass
+
+        task = asyncio.create_task(_close())
+        self._closing_tasks.add(task)
+        task.add_done_callback(self._closing_tasks.discard)
+
+    def _current_message(self) -> Tuple[int, str]:
+        """
+        현재 시스템 상태의 (버전, JSON 문자열)을 반환합니다.
+        `state_store`의 버전별 직렬화 캐시를 사용하므로, 상태가 바뀐 경우에만 새로 직렬화/디코딩합니다.
+        (RN 대시보드는 텍스트 프레임을 `JSON.parse`하므로 send_bytes(바이너리 프레임)로 바꾸지 않습니다.)
+        """
+        version, content = state_store.get_system_state_json()
+        if self._message_cache is None or self._message_cache[0] != version:
+            self._message_cache = (version, content.decode('utf-8'))
+        return self._message_cache
+
     async def broadcast_loop(self, interval_seconds: float = 1.0):
         """
-        주기적으로 모든 연결된 클라이언트에게 시스템 상태를 브로드캐스트하는 백그라운드 태스크입니다.
+        시스템 상태가 바뀔 때마다 모든 연결된 클라이언트에게 브로드캐스트하는 백그라운드 태스크입니다.
+        `interval_seconds`는 전송 간 최소 간격이며, 그 사이의 변경은 합쳐서 가장 최신 상태만 보냅니다.
         `main.py`의 `startup` 이벤트에서 `asyncio.create_task`로 실행됩니다.
         """
         logger.info(f"Starting WebSocket broadcast loop with {interval_seconds}s interval.")
+        loop = asyncio.get_running_loop()
+        last_version = -1
+        last_sent_at = 0.0
         while True:
             try:
+                # 상태가 바뀌거나 keepalive 주기가 될 때까지 기다린 뒤, 최소 간격만큼 변경을 더 모읍니다. (latest-wins)
+                try:
+                    await asyncio.wait_for(state_store.wait_for_state_change(), self.KEEPALIVE_INTERVAL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
                 await asyncio.sleep(interval_seconds)
                 
                 # 브로드캐스트 중 연결이 끊어지는 경우를 대비해 리스트를 복사해서 사용합니다.
@@ -86,18 +131,36 @@ class WebSocketManager:
                 if not connections:
                     continue
 
-                # state_store에서 최신 시스템 상태를 가져옵니다.
-                system_state = state_store.get_system_state()
-                # Pydantic 모델을 JSON 문자열로 변환합니다.
-                message = system_state.model_dump_json()
+                # 상태가 바뀌지 않았다면 같은 스냅샷을 다시 보내지 않습니다. (keepalive 주기는 예외)
+                # 새 클라이언트는 `connect`에서 현재 스냅샷을 이미 받았으므로 놓치는 상태가 없습니다.
+                # 같은 문자열 객체를 모든 클라이언트에게 그대로 전달합니다.
+                version, message = self._current_message()
+                now = loop.time()
+                if version == last_version and now - last_sent_at < self.KEEPALIVE_INTERVAL_SECONDS:
+                    continue
+                last_version, last_sent_at = version, now
 
-                # 모든 활성 클라이언트에게 메시지를 전송합니다.
+                # 연결이 끊긴 클라이언트는 리스트에서 제거하고, 나머지에게는 동시에 전송합니다.
+                targets = []
                 for websocket in connections:
-                    # 전송 전에 웹소켓 연결 상태를 확인합니다.
                     if websocket.client_state == WebSocketState.CONNECTED:
-                        await websocket.send_text(message)
+                        targets.append(websocket)
                     else:
-                        # 연결이 끊긴 경우 리스트에서 제거합니다.
+                        self.disconnect(websocket)
+
+                # 클라이언트별로 전송 제한 시간을 두어, 느린 클라이언트 하나가 전체 브로드캐스트를 붙잡지 않게 합니다.
+                results = await asyncio.gather(
+                    *(asyncio.wait_for(websocket.send_text(message), self.SEND_TIMEOUT_SECONDS) for websocket in targets),
+                    return_exceptions=True,
+                )
+                # 전송에 실패한 클라이언트만 정리합니다. (한 클라이언트의 실패가 루프 전체를 멈추지 않도록)
+                for websocket, result in zip(targets, results):
+                    if isinstance(result, asyncio.TimeoutError):
+                        logger.warning(f"WebSocket client {websocket.client} is too slow. Disconnecting.")
+                        self.disconnect(websocket)
+                        self._close_quietly(websocket)
+                    elif isinstance(result, Exception):
+                        logger.warning(f"Failed to send to WebSocket client {websocket.client}: {result}")
                         self.disconnect(websocket)
 
             except asyncio.CancelledError:
@@ -10,6 +10,7 @@
 #   **테스트 대상:**
 #   - 공개 엔드포인트 (`/api/v1/public/...`):
 #     - `GET /status`: 정상적인 상태 응답(200 OK)과 `SystemState` 모델에 맞는 JSON 본문을 반환하는지 확인합니다.
+#       `If-None-Match`가 현재 ETag와 일치하면 304를 반환하는지도 확인합니다.
 #     - `GET /symbols`: 심볼 목록을 정상적으로 반환하는지 확인합니다.
 #   - 인증 및 제어 엔드포인트 (`/api/v1/auth/...`, `/api/v1/control/...`):
 #     - `POST /auth/login`: 유효한 자격증명으로 JWT 토큰을 발급하는지, 유효하지 않은 자격증명은 거부하는지 테스트합니다.
@@ -23,10 +24,12 @@
 #   - `monkeypatch`나 `unittest.mock`을 사용하여 의존성(서비스, 함수)을 모의 객체로 대체합니다.
 #
 #
+import orjson
 import pytest
 from httpx import AsyncClient
 from unittest.mock import patch, MagicMock
 
+from app.api.routes_public import _BOOT_ID
 from app.state.models import SystemState
 from app.config import settings
 
@@ -41,20 +44,34 @@ async def test_read_root(client: AsyncClient):
 
 async def test_get_system_status(client: AsyncClient):
     """공개 상태 엔드포인트 GET /api/v1/public/status 테스트"""
-    # state_store.get_system_state가 반환할 모의 데이터 생성
+    # state_store.get_system_state_json이 반환할 모의 데이터 생성
     mock_state = SystemState(status="testing", pnl_day=123.45)
+    mock_json = (7, orjson.dumps(mock_state.model_dump(mode='json')))
     
-    # state_store.get_system_state 함수를 모의 객체로 패치
-    with patch("app.api.routes_public.state_store.get_system_state", return_value=mock_state) as mock_get:
+    # state_store.get_system_state_json 함수를 모의 객체로 패치
+    with patch("app.api.routes_public.state_store.get_system_state_json", return_value=mock_json) as mock_get:
         response = await client.get("/api/v1/public/status")
         assert response.status_code == 200
         # 반환된 JSON이 Pydantic 모델을 통해 직렬화된 결과와 일치하는지 확인
         assert response.json() == mock_state.model_dump(mode='json')
+        assert response.headers["etag"] == f'"state-{_BOOT_ID}-7"'
         mock_get.assert_called_once()
 
+async def test_get_system_status_not_modified(client: AsyncClient):
+    """If-None-Match가 현재 ETag와 같으면 304를 반환하는지 테스트"""
+    mock_json = (7, orjson.dumps(SystemState().model_dump(mode='json')))
+
+    with patch("app.api.routes_public.state_store.get_system_state_json", return_value=mock_json):
+        response = await client.get("/api/v1/public/status", headers={"If-None-Match": f'"state-{_BOOT_ID}-7"'})
+        assert response.status_code == 304
+        assert response.content == b""
+
+        response = await client.get("/api/v1/public/status", headers={"If-None-Match": f'"state-{_BOOT_ID}-6"'})
+        assert response.status_code == 200
+
 async def test_login_for_access_token(client: AsyncClient):
     """인증 엔드포인트 POST /api/v1/auth/login 테스트"""
-    # passlib의 verify 함수를 항상 True를 반환하도록 패치
+    # verify_password 함수를 항상 True를 반환하도록 패치
     with patch("app.api.routes_auth.verify_password", return_value=True):
         login_data = {"username": settings.ADMIN_USER, "password": "admin"}
         response = await client.post("/api/v1/auth/login", data=login_data)
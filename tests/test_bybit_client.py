@@ -0,0 +1,133 @@
+# ===================================================================================
+#   tests/test_bybit_client.py: BybitClient 주문 수량 보정 단위 테스트
+# ===================================================================================
+#
+#   - 시장가 주문 수량을 거래 규칙(`qtyStep`, `minOrderQty`)에 맞게 내림 처리하는 로직을 테스트합니다.
+#   - 실제 Bybit API는 호출하지 않고, `_request`를 모의(mock) 객체로 대체합니다.
+#
+#   **테스트 대상:**
+#   - `_quantize_qty`: 소수 단위(0.001)와 정수 단위(10)의 qtyStep, 이진 부동소수점 오차가 있는 입력(0.1+0.2 등).
+#   - `place_market_order`: 보정된 수량 문자열로 주문하고, 최소 주문 수량 미만이면 주문하지 않는지 확인합니다.
+#   - `_ws_handler`: 정상 종료(1000)가 반복되면 첫 번째만 바로 재접속하고 이후에는 백오프하는지 확인합니다.
+#
+#
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pydantic import SecretStr
+from websockets.exceptions import ConnectionClosedOK
+from websockets.frames import Close
+
+from app.exchange.bybit_client import BybitClient
+from app.utils.typing import Side
+
+
+@pytest.mark.parametrize(
+    "qty, qty_step, expected",
+    [
+        # 소수 단위 qtyStep
+        (1.23456, "0.001", "1.234"),
+        (0.0009, "0.001", "0.000"),
+        (2.0, "0.001", "2.000"),
+        # 정수 단위 qtyStep
+        (125.7, "10", "120"),
+        (9.99, "10", "0"),
+        (10, "10", "10"),
+        # 이진 부동소수점 오차가 있는 입력: float 나눗셈/내림이었다면 한 단위 아래로 잘립니다.
+        (0.1 + 0.2, "0.001", "0.300"),
+        (0.1 + 0.2, "0.1", "0.3"),
+        (0.3, "0.1", "0.3"),
+        (0.1 * 3, "0.01", "0.30"),
+        (1.1 + 2.2, "0.1", "3.3"),
+        (4.35, "0.01", "4.35"),
+    ],
+)
+def test_quantize_qty(qty, qty_step, expected):
+    """qtyStep 단위 내림 결과가 Decimal 기준으로 정확한지 테스트"""
+    adjusted = BybitClient._quantize_qty(qty, Decimal(qty_step))
+    assert adjusted == Decimal(expected)
+    # 주문에 그대로 넣는 문자열은 지수 표기가 없고, qtyStep보다 많은 소수점 자릿수를 갖지 않아야 합니다.
+    qty_str = format(adjusted, 'f')
+    assert 'E' not in qty_str
+    assert adjusted.as_tuple().exponent >= Decimal(qty_step).as_tuple().exponent
+
+
+def test_parse_instrument_info_falls_back_to_precision_step():
+    """qtyStep이 없으면 minOrderQty의 소수점 자릿수를 단위로 쓰는지 테스트"""
+    info = BybitClient._parse_instrument_info({"lotSizeFilter": {"minOrderQty": "0.0001"}})
+    assert info["qty_step"] == Decimal("0.0001")
+    assert info["min_qty"] == Decimal("0.0001")
+
+
+@pytest.fixture
+def bybit_client() -> BybitClient:
+    return BybitClient(api_key=SecretStr("key"), api_secret=SecretStr("secret"), testnet=True)
+
+
+def _instrument(qty_step: str, min_qty: str) -> dict:
+    return BybitClient._parse_instrument_info(
+        {"symbol": "TESTUSDT", "lotSizeFilter": {"qtyStep": qty_step, "minOrderQty": min_qty}}
+    )
+
+
+@pytest.mark.asyncio
+async def test_place_market_order_sends_quantized_qty(bybit_client: BybitClient):
+    """수량 주문 시 qtyStep 단위로 내림한 수량 문자열을 전송하는지 테스트"""
+    request = AsyncMock(return_value={"result": {"orderId": "1"}})
+    with patch.dict(BybitClient._instrument_info_cache, {"TESTUSDT": _instrument("0.001", "0.001")}), \
+            patch.object(BybitClient, "_request", request):
+        result = await bybit_client.place_market_order("TESTUSDT", Side.SELL, qty=0.1 + 0.2)
+
+    assert result == {"orderId": "1"}
+    request.assert_awaited_once()
+    assert request.await_args.kwargs["data"]["qty"] == "0.300"
+
+
+@pytest.mark.asyncio
+async def test_place_market_order_skips_below_min_qty(bybit_client: BybitClient):
+    """내림한 수량이 최소 주문 수량보다 작으면 주문하지 않는지 테스트"""
+    request = AsyncMock()
+    with patch.dict(BybitClient._instrument_info_cache, {"TESTUSDT": _instrument("10", "10")}), \
+            patch.object(BybitClient, "_request", request):
+        result = await bybit_client.place_market_order("TESTUSDT", Side.SELL, qty=9.99)
+
+    assert result == {}
+    request.assert_not_awaited()
+
+
+class _ClosingConnection:
+    """접속하자마자 정상 종료(1000)되는 WebSocket 연결을 흉내 냅니다."""
+    async def __aenter__(self):
+        raise ConnectionClosedOK(Close(1000, ""), Close(1000, ""), True)
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+@pytest.mark.asyncio
+async def test_ws_handler_backs_off_after_repeated_normal_closes(bybit_client: BybitClient):
+    """정상 종료가 반복되면 첫 번째만 바로 재접속하고, 이후에는 백오프 대기 후 재접속하는지 테스트"""
+    connect_calls = 0
+    sleeps = []
+
+    def fake_connect(url, **kwargs):
+        nonlocal connect_calls
+        connect_calls += 1
+        return _ClosingConnection()
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) == 3:
+            raise asyncio.CancelledError
+
+    with patch("app.exchange.bybit_client.ws_connect", fake_connect), \
+            patch("app.exchange.bybit_client.random.random", return_value=0.5), \
+            patch("app.exchange.bybit_client.asyncio.sleep", fake_sleep):
+        with pytest.raises(asyncio.CancelledError):
+            await bybit_client._ws_handler("wss://test", [], is_private=False)
+
+    # 1번째 종료: 바로 재접속, 2~4번째 종료: 지수 백오프(지터 0.5 + 0.5 = 1배)
+    assert connect_calls == 4
+    assert sleeps == [BybitClient.WS_BACKOFF_INITIAL, BybitClient.WS_BACKOFF_INITIAL * 2, BybitClient.WS_BACKOFF_INITIAL * 4]
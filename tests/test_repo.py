@@ -0,0 +1,173 @@
+# ===================================================================================
+#   tests/test_repo.py: 데이터베이스 쓰기 큐 단위 테스트
+# ===================================================================================
+#
+#   - `Database`의 배치 쓰기 경로(`add_*` → 쓰기 큐 → `_flush_loop`)를 임시 SQLite 파일로 테스트합니다.
+#
+#   **테스트 대상:**
+#   - `add_trade`/`add_event`/`add_trend_event`로 넣은 행이 실제로 DB에 기록되는지 확인합니다.
+#   - `disconnect()`가 쓰기 큐에 남은 행을 모두 기록한 뒤 종료하는지 확인합니다.
+#   - 한 배치의 기록이 실패해도 `_flush_loop` 태스크가 죽지 않고 다음 배치를 기록하는지 확인합니다.
+#   - 쓰기 전용 연결(`_writer_conn`): 연결 수명, 모델별 executemany 한 번, 실패 시 문제가 된 행만 버리고 나머지는 기록하는지 확인합니다.
+#
+#
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy import event, func
+from sqlmodel import select
+
+from app.state.models import EventLog, TradeLog, TrendEventLog
+from app.state.repo import Database
+from app.utils.time import now
+from app.utils.typing import TrendEvent
+
+pytestmark = pytest.mark.asyncio
+
+
+def _trade(order_id: str, side="Buy") -> dict:
+    return {"order_id": order_id, "symbol": "BTCUSDT", "side": side, "qty": 0.1, "price": 50000.0, "fee": 0.01}
+
+
+@asynccontextmanager
+async def _open_db(path):
+    """임시 SQLite 파일에 연결된 `Database`를 열고, 블록을 벗어나면 닫습니다."""
+    database = Database(f"sqlite+aiosqlite:///{path}")
+    await database.connect()
+    try:
+        yield database
+    finally:
+        await database.disconnect()
+
+
+async def _count(db: Database, model) -> int:
+    async with db.get_session() as session:
+        result = await session.execute(select(func.count()).select_from(model))
+        return result.scalar_one()
+
+
+async def _wait_for_count(db: Database, model, expected: int, timeout: float = 2.0):
+    """백그라운드 flush가 끝날 때까지 `model` 테이블의 행 수가 `expected`가 되기를 기다립니다."""
+    async def poll():
+        while await _count(db, model) != expected:
+            await asyncio.sleep(0.02)
+    await asyncio.wait_for(poll(), timeout)
+
+
+async def test_queued_rows_reach_db(tmp_path):
+    """add_* 로 큐에 넣은 행이 flush 태스크에 의해 DB에 기록되는지 테스트"""
+    async with _open_db(tmp_path / "test.db") as db:
+        await db.add_trade(_trade("1"))
+        await db.add_event("START", "strategy started")
+        await db.add_trend_event(TrendEvent(source="test", text="BTC to the moon", timestamp=now(), symbol_final="BTCUSDT"))
+
+        await _wait_for_count(db, TradeLog, 1)
+        await _wait_for_count(db, EventLog, 1)
+        await _wait_for_count(db, TrendEventLog, 1)
+
+        trades = await db.get_all_trades()
+        assert [t.order_id for t in trades] == ["1"]
+
+
+async def test_disconnect_drains_queue(tmp_path):
+    """disconnect()가 큐에 남은 행을 모두 기록하고 종료하는지 테스트"""
+    path = tmp_path / "drain.db"
+    row_count = Database.FLUSH_MAX_BATCH + 10
+    async with _open_db(path) as db:
+        for i in range(row_count):
+            await db.add_trade(_trade(str(i)))
+    assert db._flush_task is None
+    assert db._write_queue.empty()
+
+    # 새 인스턴스로 다시 열어 기록된 행을 확인합니다.
+    async with _open_db(path) as reopened:
+        assert await _count(reopened, TradeLog) == row_count
+
+
+async def test_failed_batch_does_not_kill_flush_task(tmp_path):
+    """기록에 실패한 배치가 있어도 flush 태스크가 계속 동작하는지 테스트"""
+    async with _open_db(tmp_path / "test.db") as db:
+        # side는 NOT NULL 컬럼이므로 이 배치의 INSERT는 실패합니다.
+        await db.add_trade(_trade("bad", side=None))
+        await asyncio.sleep(Database.FLUSH_INTERVAL_SECONDS * 3)
+        assert not db._flush_task.done()
+
+        await db.add_trade(_trade("good"))
+        await _wait_for_count(db, TradeLog, 1)
+        trades = await db.get_all_trades()
+        assert [t.order_id for t in trades] == ["good"]
+
+
+async def test_writer_connection_lifecycle(tmp_path):
+    """쓰기 전용 연결이 connect()에서 열리고 disconnect()에서 닫히는지 테스트"""
+    async with _open_db(tmp_path / "test.db") as db:
+        assert db._writer_conn is not None
+        assert not db._writer_conn.closed
+        writer_conn = db._writer_conn
+    assert db._writer_conn is None
+    assert writer_conn.closed
+
+
+async def test_write_batch_uses_one_executemany_per_model(tmp_path):
+    """한 배치가 모델별로 INSERT 한 번(executemany)과 커밋 한 번으로 기록되는지 테스트"""
+    async with _open_db(tmp_path / "test.db") as db:
+        inserts, commits = [], []
+
+        def on_execute(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT"):
+                inserts.append((statement.split()[2], executemany, len(parameters)))
+
+        sync_engine = db.engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", on_execute)
+        event.listen(sync_engine, "commit", lambda conn: commits.append(conn))
+        batch = [TradeLog(**_trade(str(i))) for i in range(3)] + [EventLog(event_type="E", details=str(i)) for i in range(2)]
+        await db._write_batch(batch)
+
+        assert sorted(inserts) == [("eventlog", True, 2), ("tradelog", True, 3)]
+        assert len(commits) == 1
+        assert await _count(db, TradeLog) == 3
+        assert await _count(db, EventLog) == 2
+
+
+async def test_write_batch_keeps_good_rows_on_error(tmp_path):
+    """배치 중 한 행이 실패해도 같은 배치의 나머지 행은 기록되고, 쓰기 연결은 계속 사용할 수 있는지 테스트"""
+    async with _open_db(tmp_path / "test.db") as db:
+        await db._write_batch([
+            EventLog(event_type="E", details="kept"),
+            TradeLog(**_trade("good-1")),
+            TradeLog(**_trade("bad", side=None)),
+            TradeLog(**_trade("good-2")),
+        ])
+        assert await _count(db, EventLog) == 1
+        trades = await db.get_all_trades()
+        assert sorted(t.order_id for t in trades) == ["good-1", "good-2"]
+
+        await db._write_batch([TradeLog(**_trade("good-3"))])
+        assert await _count(db, TradeLog) == 3
+
+
+async def test_failed_rollback_does_not_kill_flush_task(tmp_path):
+    """기록 실패 후 롤백까지 실패해도 flush 태스크가 계속 동작하는지 테스트"""
+    async with _open_db(tmp_path / "test.db") as db:
+        writer_conn = db._writer_conn
+
+        class _FailingRollback:
+            """롤백만 실패하고 나머지는 실제 쓰기 연결에 넘기는 대역 연결"""
+            def __getattr__(self, name):
+                return getattr(writer_conn, name)
+
+            async def rollback(self):
+                await writer_conn.rollback()
+                raise RuntimeError("rollback failed")
+
+        db._writer_conn = _FailingRollback()
+        try:
+            await db.add_trade(_trade("bad", side=None))
+            await asyncio.sleep(Database.FLUSH_INTERVAL_SECONDS * 3)
+            assert not db._flush_task.done()
+
+            await db.add_trade(_trade("good"))
+            await _wait_for_count(db, TradeLog, 1)
+        finally:
+            db._writer_conn = writer_conn
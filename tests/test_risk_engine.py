@@ -0,0 +1,92 @@
+# ===================================================================================
+#   tests/test_risk_engine.py: RiskEngine 유니버스 선정 단위 테스트
+# ===================================================================================
+#
+#   - `RiskEngine.load_instrument_info`가 시작 시 어떤 심볼을 거래 대상(universe)으로
+#     선정하는지 테스트합니다.
+#   - Bybit 클라이언트와 `state_store`, `load_universe`는 모의(mock) 객체로 대체합니다.
+#
+#   **테스트 대상:**
+#   - 티커가 있는 심볼: 24시간 거래량이 0이거나 고가와 저가가 같으면 제외됩니다.
+#   - 티커가 없는 심볼: kline 조회 실패 또는 kline이 15개 미만이면 제외됩니다.
+#   - 티커 조회 자체가 실패하면 모든 심볼을 kline으로 확인합니다.
+#
+#
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.risk.engine import RiskEngine
+
+pytestmark = pytest.mark.asyncio
+
+UNIVERSE = ["BTCUSDT", "ETHUSDT", "DEADUSDT", "FLATUSDT", "NEWUSDT", "FAILUSDT", "OLDUSDT"]
+
+
+def _instrument(symbol: str) -> dict:
+    return {"symbol": symbol, "lotSizeFilter": {"basePrecision": "0.0001", "minOrderQty": "0.0001"}}
+
+
+def _ticker(symbol: str, volume: str, high: str, low: str) -> dict:
+    return {"symbol": symbol, "volume24h": volume, "highPrice24h": high, "lowPrice24h": low}
+
+
+def _klines(count: int) -> list:
+    # [startTime, open, high, low, close, volume, turnover]
+    return [[str(i), "1", "1.1", "0.9", str(1 + i / 100), "10", "10"] for i in range(count)]
+
+
+async def _load(tickers, klines_by_symbol) -> RiskEngine:
+    client = AsyncMock()
+    client.get_instruments_info.return_value = [_instrument(s) for s in UNIVERSE] + [_instrument("XYZUSDT")]
+    if isinstance(tickers, Exception):
+        client.get_tickers.side_effect = tickers
+    else:
+        client.get_tickers.return_value = tickers
+
+    async def get_kline(symbol: str, interval: str, limit: int):
+        result = klines_by_symbol[symbol]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    client.get_kline.side_effect = get_kline
+
+    with patch("app.risk.engine.state_store"), patch("app.risk.engine.load_universe", return_value=UNIVERSE):
+        engine = RiskEngine(bybit_client=client)
+        await engine.load_instrument_info()
+    return engine
+
+
+async def test_load_instrument_info_selects_liquid_symbols():
+    """티커 기준 비유동 심볼과 kline 이력이 부족한 심볼이 제외되는지 테스트"""
+    tickers = [
+        _ticker("BTCUSDT", "1000", "50100", "49900"),
+        _ticker("ETHUSDT", "500", "3010", "2990"),
+        _ticker("DEADUSDT", "0", "1.0", "0.9"),      # 24시간 거래량 0
+        _ticker("FLATUSDT", "100", "2.0", "2.0"),    # 고가 == 저가
+        _ticker("XYZUSDT", "100", "2.0", "1.0"),     # 유니버스 밖
+    ]
+    klines = {
+        "NEWUSDT": _klines(3),                        # 신규 상장: 이력 부족
+        "FAILUSDT": RuntimeError("kline failed"),
+        "OLDUSDT": _klines(15),
+    }
+
+    engine = await _load(tickers, klines)
+
+    assert engine.universe == ["BTCUSDT", "ETHUSDT", "OLDUSDT"]
+    assert set(engine.instrument_info) == {"BTCUSDT", "ETHUSDT", "OLDUSDT"}
+    # 티커가 있는 심볼은 kline을 조회하지 않습니다.
+    fetched = {call.kwargs["symbol"] for call in engine.bybit_client.get_kline.await_args_list}
+    assert fetched == {"NEWUSDT", "FAILUSDT", "OLDUSDT"}
+
+
+async def test_load_instrument_info_falls_back_to_kline_without_tickers():
+    """티커 조회가 실패하면 모든 심볼을 kline 최소 이력으로 확인하는지 테스트"""
+    klines = {symbol: _klines(15) for symbol in UNIVERSE}
+    klines["NEWUSDT"] = _klines(14)
+    klines["FAILUSDT"] = RuntimeError("kline failed")
+
+    engine = await _load(RuntimeError("tickers failed"), klines)
+
+    assert engine.universe == ["BTCUSDT", "ETHUSDT", "DEADUSDT", "FLATUSDT", "OLDUSDT"]
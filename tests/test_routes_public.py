@@ -0,0 +1,56 @@
+# ===================================================================================
+#   tests/test_routes_public.py: 공개 API ETag 처리 단위 테스트
+# ===================================================================================
+#
+#   - `_etag_response`가 `If-None-Match` 헤더에 따라 304 또는 본문을 반환하는지 테스트합니다.
+#   - 전체 애플리케이션을 띄우지 않고, starlette `Request`를 직접 만들어 호출합니다.
+#
+#   **테스트 대상:**
+#   - 재시작으로 버전 카운터가 처음부터 다시 세어져도, 재시작 전 ETag가 일치하지 않는지 확인합니다.
+#   - `If-None-Match: *`와 약한 ETag(`W/` 접두사)를 일치로 처리하는지 확인합니다.
+#
+#
+from unittest.mock import patch
+
+import pytest
+from starlette.requests import Request
+
+from app.api import routes_public
+from app.api.routes_public import _etag_response
+
+CONTENT = b'{"status":"ok"}'
+
+
+def _request(if_none_match: str = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def test_etag_changes_across_restart():
+    """같은 버전이라도 프로세스가 다시 시작되면 ETag가 바뀌고, 이전 ETag로는 304를 받지 않는지 테스트"""
+    response = _etag_response(_request(), "state", 1, CONTENT)
+    old_etag = response.headers["etag"]
+    assert _etag_response(_request(old_etag), "state", 1, CONTENT).status_code == 304
+
+    # 재시작: 새 부팅 ID로 버전 1부터 다시 셉니다.
+    with patch.object(routes_public, "_BOOT_ID", "restarted"):
+        response = _etag_response(_request(old_etag), "state", 1, CONTENT)
+    assert response.status_code == 200
+    assert response.body == CONTENT
+    assert response.headers["etag"] != old_etag
+
+
+@pytest.mark.parametrize("if_none_match", ["*", "W/{etag}", '"other", W/{etag}'])
+def test_if_none_match_wildcard_and_weak_tags(if_none_match):
+    """`*`, 약한 ETag, 여러 ETag 목록을 일치로 처리하는지 테스트"""
+    etag = _etag_response(_request(), "risk", 3, CONTENT).headers["etag"]
+    response = _etag_response(_request(if_none_match.format(etag=etag)), "risk", 3, CONTENT)
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+
+def test_if_none_match_mismatch_returns_body():
+    """다른 ETag면 본문과 함께 200을 반환하는지 테스트"""
+    response = _etag_response(_request('W/"risk-other-3"'), "risk", 3, CONTENT)
+    assert response.status_code == 200
+    assert response.body == CONTENT
@@ -0,0 +1,50 @@
+# ===================================================================================
+#   tests/test_store.py: StateStore 상태 동기화 단위 테스트
+# ===================================================================================
+#
+#   - `StateStore`가 몰려 들어오는 변경을 `_schedule_update`로 모아(debounce)
+#     `SystemState` 동기화와 버전 증가를 한 번만 하는지 테스트합니다.
+#
+#
+import asyncio
+
+import pytest
+
+from app.state.store import StateStore
+
+pytestmark = pytest.mark.asyncio
+
+# 지연 동기화가 끝날 때까지 넉넉히 기다리는 시간
+SETTLE_SECONDS = StateStore.UPDATE_DEBOUNCE_SECONDS * 4
+
+
+async def test_burst_of_updates_is_coalesced():
+    """짧은 시간에 들어온 여러 변경이 한 번의 동기화/버전 증가로 합쳐지는지 테스트"""
+    store = StateStore()
+    version = store.get_system_state_json()[0]
+
+    for i in range(20):
+        await store.add_error(f"error {i}")
+
+    # 디바운스 시간이 지나기 전에는 아직 반영되지 않습니다.
+    assert store.get_system_state_json()[0] == version
+    assert store.get_system_state().recent_errors == []
+
+    await asyncio.sleep(SETTLE_SECONDS)
+    assert store.get_system_state_json()[0] == version + 1
+    assert store.get_system_state().recent_errors[0] == "error 19"
+    assert len(store.get_system_state().recent_errors) == 20
+
+
+async def test_update_after_flush_schedules_another_sync():
+    """동기화가 끝난 뒤의 변경은 다음 동기화로 반영되는지 테스트"""
+    store = StateStore()
+    version = store.get_system_state_json()[0]
+
+    await store.add_error("first")
+    await asyncio.sleep(SETTLE_SECONDS)
+    await store.add_error("second")
+    await asyncio.sleep(SETTLE_SECONDS)
+
+    assert store.get_system_state_json()[0] == version + 2
+    assert store.get_system_state().recent_errors == ["second", "first"]
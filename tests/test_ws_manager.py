@@ -0,0 +1,129 @@
+# ===================================================================================
+#   tests/test_ws_manager.py: 대시보드 WebSocket 브로드캐스트 단위 테스트
+# ===================================================================================
+#
+#   - `WebSocketManager`의 연결/브로드캐스트 동작을 모의(mock) WebSocket 객체로 테스트합니다.
+#   - `state_store`는 실제 `StateStore` 인스턴스로 바꿔 상태 버전을 직접 올립니다.
+#
+#   **테스트 대상:**
+#   - 연결 직후 현재 스냅샷을 바로 보내는지 확인합니다.
+#   - 상태 버전이 바뀌지 않았으면 같은 스냅샷을 다시 보내지 않는지(keepalive 주기 제외) 확인합니다.
+#   - 전송 제한 시간을 넘기는 느린 클라이언트를 목록에서 빼고 1013 코드로 닫는지 확인합니다.
+#
+#
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from starlette.websockets import WebSocketState
+
+from app.state.store import StateStore
+from app.ws.manager import WebSocketManager
+
+pytestmark = pytest.mark.asyncio
+
+BROADCAST_INTERVAL = 0.01
+
+
+def _websocket(send_text=None) -> MagicMock:
+    websocket = MagicMock()
+    websocket.client_state = WebSocketState.CONNECTED
+    websocket.accept = AsyncMock()
+    websocket.close = AsyncMock()
+    websocket.send_text = send_text or AsyncMock()
+    return websocket
+
+
+@asynccontextmanager
+async def _running_manager(keepalive_seconds: float = 60.0):
+    """모의 상태 저장소를 쓰는 WebSocketManager와 실행 중인 broadcast_loop를 제공합니다."""
+    store = StateStore()
+    with patch("app.ws.manager.state_store", store):
+        manager = WebSocketManager()
+        manager.KEEPALIVE_INTERVAL_SECONDS = keepalive_seconds
+        manager.SEND_TIMEOUT_SECONDS = 0.05
+        task = asyncio.create_task(manager.broadcast_loop(interval_seconds=BROADCAST_INTERVAL))
+        try:
+            yield manager, store
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+
+async def _settle():
+    await asyncio.sleep(BROADCAST_INTERVAL * 10)
+
+
+async def test_connect_sends_current_snapshot():
+    """연결 직후 현재 상태 스냅샷을 보내는지 테스트"""
+    async with _running_manager() as (manager, store):
+        websocket = _websocket()
+        await manager.connect(websocket)
+
+        websocket.accept.assert_awaited_once()
+        websocket.send_text.assert_awaited_once_with(store.get_system_state_json()[1].decode("utf-8"))
+        assert manager.active_connections == [websocket]
+
+
+async def test_unchanged_version_is_not_resent():
+    """상태 버전이 그대로면 깨어나더라도 다시 보내지 않고, 버전이 바뀌면 한 번 보내는지 테스트"""
+    async with _running_manager() as (manager, store):
+        websocket = _websocket()
+        await manager.connect(websocket)
+        websocket.send_text.reset_mock()
+
+        store._bump_version()
+        await _settle()
+        assert websocket.send_text.await_count == 1
+
+        # 버전을 올리지 않고 변경 알림만 보냅니다.
+        store._state_changed.set()
+        await _settle()
+        assert websocket.send_text.await_count == 1
+
+        store._bump_version()
+        await _settle()
+        assert websocket.send_text.await_count == 2
+
+
+async def test_keepalive_resends_unchanged_snapshot():
+    """상태가 바뀌지 않아도 keepalive 주기마다 스냅샷을 다시 보내는지 테스트"""
+    async with _running_manager(keepalive_seconds=0.05) as (manager, store):
+        websocket = _websocket()
+        await manager.connect(websocket)
+        websocket.send_text.reset_mock()
+
+        await asyncio.sleep(0.3)
+        assert websocket.send_text.await_count >= 2
+
+
+async def test_stalled_client_is_dropped():
+    """전송이 멈춘 클라이언트는 연결 목록에서 빠지고 1013 코드로 닫히며, 다른 클라이언트는 계속 받는지 테스트"""
+    async with _running_manager() as (manager, store):
+        fast = _websocket()
+        stalled_calls = 0
+
+        async def stall_after_snapshot(message):
+            # 연결 시 스냅샷은 받고, 그 다음 전송부터 응답하지 않습니다.
+            nonlocal stalled_calls
+            stalled_calls += 1
+            if stalled_calls > 1:
+                await asyncio.Event().wait()
+
+        stalled_send = AsyncMock(side_effect=stall_after_snapshot)
+        stalled = _websocket(send_text=stalled_send)
+        await manager.connect(fast)
+        await manager.connect(stalled)
+
+        store._bump_version()
+        await asyncio.sleep(manager.SEND_TIMEOUT_SECONDS + BROADCAST_INTERVAL * 10)
+
+        assert manager.active_connections == [fast]
+        stalled.close.assert_awaited_once_with(code=1013)
+        assert fast.send_text.await_count == 2
+
+        store._bump_version()
+        await _settle()
+        assert fast.send_text.await_count == 3
+        assert stalled_send.await_count == 2